@@ -0,0 +1,64 @@
+"""
+Compare `full_clean` looping over fields to `full_clean` with a generated
+function (`compile_cleaning = True`) for an increasing number of fields.
+
+    python benchmarks/bench_codegen.py --records 20000
+"""
+from __future__ import print_function
+
+import argparse
+import time
+
+from swamper.base import BaseSwamper
+
+
+def make_swamper_class(field_count, compiled):
+    """
+    Build a swamper class where half of the fields have a clean method.
+    """
+    def clean(self, value, is_blank):
+        if is_blank:
+            raise self.error_class('This field is required.')
+        return value
+
+    attrs = {'compile_cleaning': compiled}
+    for i in range(0, field_count, 2):
+        attrs['clean_field_%d' % i] = clean
+    return type('Swamper%d' % field_count, (BaseSwamper,), attrs)
+
+
+def make_records(field_count, count):
+    fields = ['field_%d' % i for i in range(field_count)]
+    records = []
+    for i in range(count):
+        record = dict([(field, 'value %d' % i) for field in fields])
+        if i % 10 == 0:
+            record[fields[0]] = ''
+        records.append(record)
+    return fields, records
+
+
+def timed(swamper_class, fields, records):
+    start = time.time()
+    for _ in swamper_class.clean_many(records, fields):
+        pass
+    return time.time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--records', type=int, default=20000)
+    parser.add_argument('--fields', type=int, nargs='+', default=[5, 20, 100])
+    args = parser.parse_args()
+
+    print('{:>8} {:>14} {:>14} {:>8}'.format('fields', 'interpreted/s', 'compiled/s', 'speedup'))
+    for field_count in args.fields:
+        fields, records = make_records(field_count, args.records)
+        interpreted = timed(make_swamper_class(field_count, False), fields, records)
+        compiled = timed(make_swamper_class(field_count, True), fields, records)
+        print('{:>8} {:>14.0f} {:>14.0f} {:>8.2f}'.format(
+            field_count, len(records) / interpreted, len(records) / compiled, interpreted / compiled))
+
+
+if __name__ == '__main__':
+    main()
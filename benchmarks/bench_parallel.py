@@ -0,0 +1,90 @@
+"""
+Compare cleaning records with a serial `full_clean` loop to `clean_parallel`
+with an increasing number of worker processes.
+
+    python benchmarks/bench_parallel.py --records 20000
+"""
+from __future__ import print_function
+
+import argparse
+import multiprocessing
+import re
+import time
+import unicodedata
+
+from swamper.base import BaseSwamper
+from swamper.parallel import clean_parallel
+
+
+WORD_RE = re.compile(r'[^a-z0-9]+')
+
+
+class CompanySwamper(BaseSwamper):
+    """
+    CPU-bound clean methods, along the lines of the README example.
+    """
+    fields = ['name', 'github_address']
+
+    def clean_name(self, name, is_blank):
+        if is_blank:
+            raise ValueError('Field "name" is required.')
+
+        for _ in range(20):
+            ascii_name = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode('ascii')
+        return WORD_RE.sub(' ', ascii_name.lower()).strip()
+
+    def clean_github_address(self, address, is_blank):
+        if is_blank:
+            raise ValueError('Field "github_address" cannot be empty.')
+
+        return 'https://github.com/%s' % WORD_RE.sub('-', address.lower()).strip('-')
+
+
+def make_records(count):
+    return [{
+        'name': u'Devhouse Spindl\xe9 %d - B.V.' % i,
+        'github_address': 'WeAreSpindle_%d' % i,
+    } for i in range(count)]
+
+
+def clean_serial(records):
+    for data in records:
+        swamper = CompanySwamper(CompanySwamper.fields, data)
+        swamper.full_clean()
+
+
+def clean_in_pool(records, workers, chunk_size):
+    for _ in clean_parallel(CompanySwamper, records, args=(CompanySwamper.fields,), workers=workers,
+                            chunk_size=chunk_size):
+        pass
+
+
+def timed(func, *args):
+    start = time.time()
+    func(*args)
+    return time.time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--records', type=int, default=20000)
+    parser.add_argument('--chunk-size', type=int, default=500)
+    parser.add_argument('--max-workers', type=int, default=multiprocessing.cpu_count())
+    args = parser.parse_args()
+
+    records = make_records(args.records)
+
+    serial = timed(clean_serial, records)
+    print('{:<12} {:>10} {:>12} {:>8}'.format('mode', 'seconds', 'records/s', 'speedup'))
+    print('{:<12} {:>10.3f} {:>12.0f} {:>8.2f}'.format('serial', serial, len(records) / serial, 1))
+
+    workers = 1
+    while workers <= args.max_workers:
+        seconds = timed(clean_in_pool, records, workers, args.chunk_size)
+        print('{:<12} {:>10.3f} {:>12.0f} {:>8.2f}'.format(
+            'workers=%d' % workers, seconds, len(records) / seconds, serial / seconds))
+        workers *= 2
+
+
+if __name__ == '__main__':
+    main()
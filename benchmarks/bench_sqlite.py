@@ -0,0 +1,91 @@
+"""
+Compare writing cleaned records to SQLite row by row, building a model with
+`build_or_update` and saving it, to `write_sqlite` for a range of chunk sizes.
+
+    python benchmarks/bench_sqlite.py --records 20000
+"""
+from __future__ import print_function
+
+import argparse
+import sqlite3
+import time
+
+from swamper.base import BaseSwamper
+from swamper.sinks import write_sqlite
+
+FIELDS = ['name', 'github', 'city', 'country', 'employees']
+INSERT = 'INSERT INTO company (%s) VALUES (%s)' % (', '.join(FIELDS), ', '.join(['?'] * len(FIELDS)))
+
+
+class Company(object):
+    def save(self, connection):
+        connection.execute(INSERT, [getattr(self, field) for field in FIELDS])
+        connection.commit()
+
+
+class CompanySwamper(BaseSwamper):
+    instance_to_data_fields = {'github': 'github_address'}
+
+    def clean_name(self, value, is_blank):
+        if is_blank:
+            raise self.error_class('Name is required')
+        return value
+
+    def clean_employees(self, value, is_blank):
+        return int(value)
+
+
+def make_records(count):
+    records = []
+    for i in range(count):
+        records.append({
+            'name': 'company %d' % i if i % 10 else '',
+            'github_address': 'company%d' % i,
+            'city': 'Groningen',
+            'country': 'NL',
+            'employees': str(i),
+        })
+    return records
+
+
+def connect():
+    connection = sqlite3.connect(':memory:')
+    connection.execute('CREATE TABLE company (%s)' % ', '.join(FIELDS))
+    return connection
+
+
+def row_by_row(records):
+    connection = connect()
+    start = time.time()
+    for record in records:
+        swamper = CompanySwamper(FIELDS, record)
+        if swamper.is_clean():
+            swamper.build_or_update(Company, FIELDS).save(connection)
+    return time.time() - start
+
+
+def chunked(records, chunk_size):
+    connection = connect()
+    start = time.time()
+    write_sqlite(CompanySwamper, CompanySwamper.clean_many(records, FIELDS), connection, 'company', FIELDS,
+                 chunk_size=chunk_size)
+    return time.time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--records', type=int, default=20000)
+    parser.add_argument('--chunk-sizes', type=int, nargs='+', default=[100, 1000, 10000])
+    args = parser.parse_args()
+
+    records = make_records(args.records)
+    baseline = row_by_row(records)
+    print('{:>10} {:>14} {:>14} {:>8}'.format('chunk', 'row by row/s', 'chunked/s', 'speedup'))
+    for chunk_size in args.chunk_sizes:
+        seconds = chunked(records, chunk_size)
+        print('{:>10} {:>14.0f} {:>14.0f} {:>8.2f}'.format(
+            chunk_size, len(records) / baseline, len(records) / seconds, baseline / seconds))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,241 @@
+"""
+Measure the throughput of the hot paths of cleaning and building for a range
+of field counts, error rates, field remapping and `skip_verify`, and store the
+results to compare releases.
+
+    python benchmarks/run_benchmarks.py --output benchmarks/results/0.1.json
+    python benchmarks/run_benchmarks.py --compare benchmarks/results/0.1.json
+
+Every case is run `--repeat` times, the fastest run counts. Cases for APIs
+the installed release lacks, such as `clean_many` in the 0.1 release, are
+skipped. The directory of `--output` is created when it doesn't exist.
+"""
+from __future__ import print_function
+
+import argparse
+import datetime
+import itertools
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+import swamper
+from swamper.base import BaseSwamper
+
+
+class Company(object):
+    pass
+
+
+def make_swamper_class(field_count, remap):
+    """
+    Build a swamper class with a clean method for every field, which rejects
+    values marked by `make_records`.
+    """
+    def clean(self, value, is_blank):
+        if value.startswith('!'):
+            raise self.error_class('This value is rejected.')
+        return value
+
+    attrs = dict([('clean_field_%d' % i, clean) for i in range(field_count)])
+    if remap:
+        attrs['instance_to_data_fields'] = dict([('attr_%d' % i, 'field_%d' % i) for i in range(field_count)])
+    return type('Swamper%d' % field_count, (BaseSwamper,), attrs)
+
+
+def make_records(field_count, count, error_rate):
+    """
+    Build records with a value for every field, and mark a value to reject in
+    `error_rate` of them.
+    """
+    records = []
+    rejected_every = int(round(1 / error_rate)) if error_rate else 0
+    for i in range(count):
+        record = dict([('field_%d' % f, 'value %d' % i) for f in range(field_count)])
+        if rejected_every and i % rejected_every == 0:
+            record['field_0'] = '!value'
+        records.append(record)
+    return records
+
+
+def bench_full_clean(swamper_class, fields, records, skip_verify):
+    for record in records:
+        swamper_class(fields, record, skip_verify=skip_verify).full_clean()
+
+
+def bench_clean_many(swamper_class, fields, records, skip_verify):
+    for _ in swamper_class.clean_many(records, fields, skip_verify=skip_verify):
+        pass
+
+
+def bench_test_is_blank(swamper_class, fields, records, skip_verify):
+    swamper = swamper_class(fields, records[0], skip_verify=skip_verify)
+    test_is_blank = swamper.test_is_blank
+    for record in records:
+        swamper.raw_data = record
+        for data_field, value in record.items():
+            test_is_blank(data_field, value)
+
+
+def bench_add_error(swamper_class, fields, records, skip_verify):
+    swamper = swamper_class(fields, records[0], skip_verify=skip_verify)
+    swamper.full_clean()
+    data_fields = swamper.fields
+    for _ in records:
+        swamper._errors = {}
+        swamper.cleaned_data = {}
+        for data_field in data_fields:
+            swamper.add_error(data_field, 'This value is rejected.')
+
+
+def bench_build_or_update(swamper_class, fields, records, skip_verify):
+    swampers = []
+    for record in records:
+        swamper = swamper_class(fields, record, skip_verify=skip_verify)
+        swamper.full_clean()
+        swamper._errors = {}
+        swampers.append(swamper)
+
+    start = time.time()
+    for swamper in swampers:
+        swamper.build_or_update(Company, fields)
+    return time.time() - start
+
+
+CASES = {
+    'full_clean': bench_full_clean,
+    'clean_many': bench_clean_many,
+    'test_is_blank': bench_test_is_blank,
+    'add_error': bench_add_error,
+    'build_or_update': bench_build_or_update,
+}
+
+# Cases that need an API newer than the first release.
+REQUIRES = {
+    'clean_many': 'clean_many',
+}
+
+
+def is_supported(case):
+    """
+    Tell if the installed release has the API a case measures.
+    """
+    return case not in REQUIRES or hasattr(BaseSwamper, REQUIRES[case])
+
+
+def run_case(case, field_count, record_count, error_rate, remap, skip_verify, repeat):
+    """
+    Run a case `repeat` times.
+
+    Returns:
+        dict: parameters and the fastest time of the case.
+    """
+    swamper_class = make_swamper_class(field_count, remap)
+    fields = ['%s_%d' % ('attr' if remap else 'field', i) for i in range(field_count)]
+    records = make_records(field_count, record_count, error_rate)
+
+    best = None
+    for _ in range(repeat):
+        start = time.time()
+        seconds = CASES[case](swamper_class, fields, records, skip_verify)
+        if seconds is None:
+            seconds = time.time() - start
+        best = seconds if best is None else min(best, seconds)
+
+    return {
+        'case': case,
+        'fields': field_count,
+        'records': record_count,
+        'error_rate': error_rate,
+        'remap': remap,
+        'skip_verify': skip_verify,
+        'seconds': best,
+        'records_per_second': record_count / best if best else None,
+    }
+
+
+def result_key(result):
+    return tuple([result[name] for name in ('case', 'fields', 'records', 'error_rate', 'remap', 'skip_verify')])
+
+
+def check_output_path(path):
+    """
+    Create the directory of `path` and check the results can be written
+    there, before spending time on the benchmarks.
+
+    Raises:
+        IOError: when `path` is not writable.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    if not os.access(path if os.path.exists(path) else directory, os.W_OK):
+        raise IOError('Cannot write results to {!r}'.format(path))
+
+
+def git_revision():
+    try:
+        revision = subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], stderr=subprocess.STDOUT)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return revision.decode().strip()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--cases', nargs='+', choices=sorted(CASES), default=sorted(CASES))
+    parser.add_argument('--fields', type=int, nargs='+', default=[5, 50, 500])
+    parser.add_argument('--records', type=int, default=1000)
+    parser.add_argument('--error-rates', type=float, nargs='+', default=[0.0, 0.1, 0.5])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help='JSON file to store the results in')
+    parser.add_argument('--compare', help='JSON file with earlier results to compare to')
+    args = parser.parse_args()
+
+    if args.output:
+        try:
+            check_output_path(args.output)
+        except (IOError, OSError) as e:
+            parser.error(str(e))
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = dict([(result_key(result), result) for result in json.load(f)['results']])
+
+    cases = [case for case in args.cases if is_supported(case)]
+    for case in sorted(set(args.cases) - set(cases)):
+        print('Skipping {}, swamper {} lacks {}'.format(case, swamper.__version__, REQUIRES[case]), file=sys.stderr)
+
+    print('{:<16} {:>6} {:>6} {:>6} {:>12} {:>14} {:>8}'.format(
+        'case', 'fields', 'errors', 'remap', 'skip_verify', 'records/s', 'vs base'))
+
+    results = []
+    for case, field_count, error_rate, remap, skip_verify in itertools.product(
+            cases, args.fields, args.error_rates, [False, True], [False, True]):
+        result = run_case(case, field_count, args.records, error_rate, remap, skip_verify, args.repeat)
+        results.append(result)
+
+        base = baseline.get(result_key(result))
+        ratio = ''
+        if base and base['records_per_second'] and result['records_per_second']:
+            ratio = '{:.2f}x'.format(result['records_per_second'] / base['records_per_second'])
+        print('{:<16} {:>6} {:>6.0%} {:>6} {:>12} {:>14.0f} {:>8}'.format(
+            case, field_count, error_rate, str(remap), str(skip_verify), result['records_per_second'] or 0, ratio))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({
+                'version': swamper.__version__,
+                'revision': git_revision(),
+                'python': platform.python_version(),
+                'date': datetime.datetime.utcnow().isoformat(),
+                'results': results,
+            }, f, indent=2, sort_keys=True)
+
+
+if __name__ == '__main__':
+    main()
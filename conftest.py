@@ -0,0 +1,8 @@
+import sys
+
+
+collect_ignore = []
+if sys.version_info < (3, 5):
+    # Coroutines need `async def`, which is a syntax error before 3.5, so
+    # flake8 can't check the async swamper there.
+    collect_ignore.append('swamper/aio.py')
@@ -11,9 +11,14 @@ except:
 
 install_requires = [
     'six>=1.10.0',
+    'futures>=3.0.5; python_version < "3.2"',
 ]
 
-tests_require = [
+numpy_require = [
+    'numpy',
+]
+
+tests_require = numpy_require + [
     'pytest>=3.0.5',
     'pytest-cov>=2.4.0',
     'pytest-flake8>=0.8.1',
@@ -32,6 +37,7 @@ setup(
     install_requires=install_requires,
     tests_require=tests_require,
     extras_require={
+        'numpy': numpy_require,
         'test': tests_require,
     },
     packages=find_packages(exclude=['contrib', 'docs', 'tests']),
@@ -0,0 +1,106 @@
+"""
+Clean a CSV or JSON Lines file with a swamper class:
+
+    python -m swamper myapp.swampers:CompanySwamper companies.csv --clean clean.csv --rejects rejects.jsonl
+"""
+from __future__ import print_function
+
+import argparse
+import contextlib
+import importlib
+import sys
+
+from .ingest import FORMATS, guess_format, ingest, open_file
+
+
+def import_swamper(path):
+    """
+    Import a swamper class from a 'package.module:Class' or
+    'package.module.Class' path.
+
+    Raises:
+        ValueError: when the path has no module part.
+    """
+    if ':' in path:
+        module_name, class_name = path.split(':', 1)
+    else:
+        module_name, _, class_name = path.rpartition('.')
+    if not module_name:
+        raise ValueError('Expected a path like package.module:Class, got {!r}'.format(path))
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+@contextlib.contextmanager
+def opened(path, mode):
+    """
+    Open `path` with `open_file`, without closing stdin or stdout.
+    """
+    if path is None:
+        yield None
+        return
+
+    f = open_file(path, mode)
+    try:
+        yield f
+    finally:
+        if path != '-':
+            f.close()
+
+
+def positive_int(value):
+    """
+    Parse a command line option that must be a number of at least 1.
+    """
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError('must be at least 1, got {}'.format(value))
+    return number
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m swamper', description=__doc__.strip().splitlines()[0])
+    parser.add_argument('swamper', help='swamper class to clean with, as package.module:Class')
+    parser.add_argument('input', help="file to read records from, '-' for stdin")
+    parser.add_argument('--format', choices=FORMATS,
+                        help='format of input and clean output, guessed from the input file name by default')
+    parser.add_argument('--clean', default='-', help="file to write clean records to (default: stdout)")
+    parser.add_argument('--rejects', help='JSON Lines file to write rejected records with their errors to')
+    parser.add_argument('--fields', help='comma separated data fields, the fields of the swamper class by default')
+    parser.add_argument('--chunk-size', type=positive_int, default=1000, help='number of records to handle at once')
+    parser.add_argument('--workers', type=positive_int, help='number of processes to clean with')
+    parser.add_argument('--progress', action='store_true', help='report rows/s after every chunk')
+    args = parser.parse_args(argv)
+
+    if args.format is None:
+        try:
+            args.format = guess_format(args.input)
+        except ValueError as e:
+            parser.error('{}, with --format'.format(e))
+
+    args.swamper = import_swamper(args.swamper)
+    if args.fields:
+        args.fields = args.fields.split(',')
+    else:
+        args.fields = getattr(args.swamper, 'fields', None)
+        if args.fields is None:
+            parser.error('{} has no fields of its own, choose them with --fields'.format(args.swamper.__name__))
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    def progress(report):
+        print(report, file=sys.stderr)
+
+    with opened(args.input, 'r') as source, opened(args.clean, 'w') as clean_output, \
+            opened(args.rejects, 'w') as reject_output:
+        report = ingest(args.swamper, source, clean_output, reject_output, format=args.format, args=(args.fields,),
+                        chunk_size=args.chunk_size, workers=args.workers,
+                        progress=progress if args.progress else None)
+
+    print(report, file=sys.stderr)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    sys.exit(main())
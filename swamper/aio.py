@@ -0,0 +1,351 @@
+"""
+Cleaning with asyncio, this module requires Python 3.5 or newer.
+"""
+import asyncio
+import collections
+import functools
+import inspect
+import timeit
+
+from .base import BaseSwamper, CleanResult, NON_FIELD_ERRORS, _ErrorBudgetExceeded
+
+
+class _CleanStream(object):
+    """
+    Asynchronous iterator of results of cleaning a stream of records, see
+    `AsyncSwamper.aclean_stream`.
+    """
+
+    def __init__(self, swamper_class, records, args, kwargs, concurrency, ordered):
+        if hasattr(records, '__aiter__'):
+            self._records = records.__aiter__()
+            self._sync_records = None
+        else:
+            self._records = None
+            self._sync_records = iter(records)
+        self._swamper_class = swamper_class
+        self._args = args
+        self._kwargs = kwargs
+        self._concurrency = concurrency
+        self._ordered = ordered
+        self._pending = collections.deque()
+        self._idle = []
+        self._prefetches = True
+        self._exhausted = False
+
+    def __aiter__(self):
+        return self
+
+    async def _next_record(self):
+        """
+        Get the next record from the source.
+
+        Raises:
+            StopAsyncIteration: when the source is exhausted.
+        """
+        if self._records is not None:
+            return await self._records.__anext__()
+        try:
+            return next(self._sync_records)
+        except StopIteration:
+            raise StopAsyncIteration
+
+    async def _clean(self, data, instances):
+        """
+        Clean a record with an idle swamper, or with a new one when all
+        swampers are busy.
+        """
+        idle = self._idle
+        swamper = self._swamper_class._reuse(idle.pop() if idle else None, data, self._args, self._kwargs, instances)
+        await swamper.afull_clean()
+        idle.append(swamper)
+        return CleanResult(data, swamper.cleaned_data, swamper._errors, swamper.instances)
+
+    async def _fill(self):
+        """
+        Start cleaning records from the source until `concurrency` records
+        are in flight. While the swamper class prefetches instances, records
+        are started in batches with instances prefetched per batch, as soon
+        as no more than half of `concurrency` records are in flight.
+        """
+        if self._prefetches and len(self._pending) > self._concurrency // 2:
+            return
+
+        swamper_class = self._swamper_class
+        room = min(self._concurrency - len(self._pending), swamper_class.prefetch_chunk_size)
+        batch = []
+        while not self._exhausted and len(batch) < room:
+            try:
+                batch.append(await self._next_record())
+            except StopAsyncIteration:
+                self._exhausted = True
+        if not batch:
+            return
+
+        instances = None
+        if self._prefetches:
+            instances = swamper_class.prefetch_instances(batch)
+            if inspect.isawaitable(instances):
+                instances = await instances
+            # A class that doesn't prefetch instances for a batch never does.
+            self._prefetches = instances is not None
+        for data, data_instances in zip(batch, swamper_class._check_prefetched(batch, instances)):
+            self._pending.append(asyncio.ensure_future(self._clean(data, data_instances)))
+
+    async def _next_result(self):
+        await self._fill()
+        if not self._pending:
+            raise StopAsyncIteration
+
+        if self._ordered:
+            task = self._pending.popleft()
+        else:
+            done, _ = await asyncio.wait(self._pending, return_when=asyncio.FIRST_COMPLETED)
+            task = next(task for task in self._pending if task in done)
+            self._pending.remove(task)
+        return await task
+
+    async def __anext__(self):
+        try:
+            return await self._next_result()
+        except StopAsyncIteration:
+            raise
+        except Exception:
+            # Don't leave the other records running unattended.
+            await self.aclose()
+            raise
+
+    async def aclose(self):
+        """
+        Stop cleaning, cancel records in flight.
+        """
+        self._exhausted = True
+        pending = list(self._pending)
+        self._pending.clear()
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+def _atimed(collector, swamper_class, step, function):
+    """
+    Like `swamper.metrics.timed`, but report a coroutine returned by
+    `function` when it is done, instead of when it is created.
+    """
+    timer = timeit.default_timer
+
+    async def awaited(start, awaitable):
+        try:
+            result = await awaitable
+        except Exception:
+            collector.observe(swamper_class, step, timer() - start, True)
+            raise
+        collector.observe(swamper_class, step, timer() - start, False)
+        return result
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        start = timer()
+        try:
+            result = function(*args, **kwargs)
+        except Exception:
+            collector.observe(swamper_class, step, timer() - start, True)
+            raise
+        if inspect.isawaitable(result):
+            return awaited(start, result)
+        collector.observe(swamper_class, step, timer() - start, False)
+        return result
+    return wrapper
+
+
+class AsyncSwamper(BaseSwamper):
+    """
+    Swamper that allows clean methods to be coroutines, for example when
+    cleaning a field requires a lookup elsewhere.
+
+    Clean methods for fields run concurrently, so they cannot rely on other
+    fields being cleaned already. When all fields are done, validators (see
+    `validates`) run concurrently, then `clean` runs.
+    """
+
+    @classmethod
+    def _timed(cls, collector, step, function):
+        return _atimed(collector, cls, step, function)
+
+    def full_clean(self):
+        raise TypeError("'AsyncSwamper' must be cleaned with 'afull_clean'")
+
+    def lazy_clean(self):
+        raise TypeError("'AsyncSwamper' must be cleaned with 'afull_clean'")
+
+    def partial_clean(self, fields=None):
+        raise TypeError("'AsyncSwamper' must be cleaned with 'afull_clean'")
+
+    def update(self, data_delta):
+        raise TypeError("'AsyncSwamper' must be cleaned with 'afull_clean'")
+
+    @classmethod
+    def aclean_stream(cls, records, *args, concurrency=10, ordered=True, **kwargs):
+        """
+        Clean a stream of records with up to `concurrency` records in flight,
+        each with its own swamper, which is reset for a later record when it
+        is done:
+
+            async for result in CompanySwamper.aclean_stream(records, concurrency=20):
+                ...
+
+        The next record is only taken from `records` when a result is taken
+        and fewer than `concurrency` records are in flight, so a slow consumer
+        slows down reading the source. Records are taken in batches, with
+        instances prefetched per batch, see `prefetch_instances`, which may
+        be a coroutine for an `AsyncSwamper`.
+
+        Args:
+            records (iterable): inputs to clean, an asynchronous or a plain
+                iterable.
+            *args: arguments to build the swamper with, see `clean_many`.
+            concurrency (int): maximum number of records in flight.
+            ordered (bool): yield results in input order, or as soon as they
+                are done.
+            **kwargs: keyword arguments to build the swamper with.
+
+        Returns:
+            asynchronous iterator: `CleanResult` for every record, call
+                `aclose` on it to stop early. When cleaning a record raises,
+                the records in flight are cancelled before it is re-raised.
+
+        Raises:
+            ValueError: when `concurrency` is less than 1.
+        """
+        if concurrency < 1:
+            raise ValueError("'concurrency' must be at least 1, got {!r}".format(concurrency))
+        return _CleanStream(cls, records, args, kwargs, concurrency, ordered)
+
+    async def afull_clean(self):
+        """
+        Clean instances, fields and do a post clean where you have access to
+        all cleaned input data so far. When an error is raised during cleaning
+        of instances, don't continue.
+
+        When `max_errors` is set, cleaning stops as soon as that many fields
+        have errors, see `full_clean`.
+        """
+        if not self._prepare_clean():
+            return
+
+        self._error_budget = self.max_errors
+        try:
+            await self._aclean_fields()
+            await self._arun_validators()
+            await self._aclean_all()
+        except _ErrorBudgetExceeded:
+            self._errors.short_circuited = True
+        finally:
+            self._error_budget = None
+
+    async def ais_clean(self):
+        """
+        Indicates if there were no errors cleaning input.
+
+        Returns:
+            bool: True if the form has no errors.
+        """
+        if self._errors is None:
+            await self.afull_clean()
+        return not self._errors
+
+    async def _aclean_field(self, data_field, cleaner, value):
+        """
+        Run the clean method for a single field.
+
+        Returns:
+            tuple: the cleaned value and None, or None and the error raised
+                by the clean method.
+        """
+        try:
+            is_blank = self.test_is_blank(data_field, value)
+            value = cleaner(self, value, is_blank=is_blank)
+            if inspect.isawaitable(value):
+                value = await value
+        except (self.error_class, _ErrorBudgetExceeded) as e:
+            # An exceeded budget is re-raised by the caller, not out of the
+            # task running this clean method.
+            return None, e
+        return value, None
+
+    async def _aclean_fields(self):
+        """
+        Run all clean methods for predefined fields concurrently, these
+        methods are also called when the correspondig field isn't present in
+        the input data.
+
+        The outcome is added to `cleaned_data` and errors in field order, as
+        if the fields were cleaned one by one.
+        """
+        data = self.data
+        cleaned_data = self.cleaned_data
+
+        data_fields = []
+        pending = []
+        for data_field, cleaner in self._plan.cleaners:
+            value = data.get(data_field)
+            if data_field not in cleaned_data:
+                cleaned_data[data_field] = value
+
+            if cleaner is not None:
+                data_fields.append(data_field)
+                pending.append(self._aclean_field(data_field, cleaner, value))
+
+        outcomes = await asyncio.gather(*pending)
+        for data_field, (value, error) in zip(data_fields, outcomes):
+            if error is None:
+                cleaned_data[data_field] = value
+            elif isinstance(error, _ErrorBudgetExceeded):
+                raise error
+            else:
+                self.add_error(data_field, error)
+
+    async def _arun_validator(self, validator):
+        """
+        Run a single validator.
+
+        Returns:
+            Exception: the error raised by the validator, if any.
+        """
+        try:
+            outcome = validator(self)
+            if inspect.isawaitable(outcome):
+                await outcome
+        except (self.error_class, _ErrorBudgetExceeded) as e:
+            return e
+
+    async def _arun_validators(self):
+        """
+        Run validators concurrently, skip those for which any of the fields
+        has errors. Errors are added in the order validators are scheduled.
+        """
+        errors = self._errors
+        pending = [
+            self._arun_validator(validator) for validator, data_fields in self._plan.validators
+            if not any(data_field in errors for data_field in data_fields)
+        ]
+
+        for error in await asyncio.gather(*pending):
+            if isinstance(error, _ErrorBudgetExceeded):
+                raise error
+            if error is not None:
+                self.add_error(NON_FIELD_ERRORS, error)
+
+    async def _aclean_all(self):
+        """
+        Run the global method to clean fields that depend on each other.
+        """
+        try:
+            cleaned_data = self.clean()
+            if inspect.isawaitable(cleaned_data):
+                cleaned_data = await cleaned_data
+        except self.error_class as e:
+            self.add_error(NON_FIELD_ERRORS, e)
+        else:
+            if cleaned_data is not None:
+                self.cleaned_data = cleaned_data
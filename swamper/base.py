@@ -1,16 +1,116 @@
 import collections
 import inspect
+import timeit
 
 import six
 
+from .lazy import LazyCleanedData
+from .metrics import timed
+from .ordering import CleaningProfile
+from .plan import CleaningPlan
+from .setters import compile_setter
+from .threads import submit
+from .utils import chunks
+
 
 NON_FIELD_ERRORS = None
 
 
+class CleanResult(collections.namedtuple('CleanResult', ['raw_data', 'cleaned_data', 'errors', 'instances'])):
+    """
+    Outcome of cleaning a single record with `BaseSwamper.clean_many`.
+    """
+    __slots__ = ()
+
+    def is_clean(self):
+        """
+        Indicates if there were no errors cleaning the record.
+
+        Returns:
+            bool: True if the record has no errors.
+        """
+        return not self.errors
+
+
+class ErrorDict(dict):
+    """
+    Map of field to list of errors.
+
+    Attributes:
+        short_circuited (bool): True when cleaning stopped as soon as
+            `max_errors` fields had errors, so the remaining fields, validators
+            and the post clean were not run.
+    """
+    short_circuited = False
+
+
+class _ErrorBudgetExceeded(BaseException):
+    """
+    Raised by `add_error` to stop cleaning when the error budget is used up.
+    Not an `Exception`, so it passes any `error_class` handler on its way out.
+    """
+
+
+def verify_fields(fields):
+    """
+    Validate types for a list of field names.
+
+    Raises:
+        TypeError: when fields is not a list of field names.
+    """
+    # Verify fields type.
+    if (not isinstance(fields, collections.Iterable) or
+            isinstance(fields, collections.Mapping) or
+            isinstance(fields, six.string_types)):
+        raise TypeError("'fields' must be a 1-dimensional iterable (list, tuple, ..)")
+
+    # Verify field types.
+    for field in fields:
+        if not isinstance(field, six.string_types):
+            raise TypeError("'fields' must only contain field names")
+
+
 class BaseSwamper(object):
     # Allow for field name abstraction between data and instances.
     instance_to_data_fields = {}
 
+    # Keep cleaning plans and verified field lists for this many lists of
+    # fields per class, the oldest plan is forgotten first when more lists of
+    # fields are cleaned.
+    plan_cache_size = 128
+
+    # Share the caches of `cached` clean methods between all instances.
+    share_cleaner_cache = False
+
+    # Clean fields with a generated function instead of looping over them.
+    compile_cleaning = False
+
+    # Stop `full_clean` as soon as this many fields have errors, 1 fails fast
+    # and None cleans everything.
+    max_errors = None
+    _error_budget = None
+
+    # Clean fields that are cheap and often fail first, see `CleaningProfile`.
+    # Set `cleaning_profile` to order fields by a saved profile.
+    adaptive_ordering = False
+    cleaning_profile = None
+
+    # Let `swamper.dedupe.clean_deduped` re-use results for identical records,
+    # turn off when cleaning has side effects or depends on external state.
+    deduplicate_records = True
+
+    # Run clean methods of a record in this many threads of a shared pool at
+    # most, None cleans fields one by one. See `swamper.threads`.
+    cleaner_threads = None
+
+    # Number of records `clean_many` passes to `prefetch_instances` at once.
+    prefetch_chunk_size = 500
+    _prefetched = None
+
+    # Report timings and errors of every step of cleaning to this collector,
+    # see `swamper.metrics.MetricsCollector`.
+    collector = None
+
     def __init__(self, fields, data, error_class=ValueError, skip_verify=False):
         """
         Build a swamper that clean given fields from data.
@@ -31,53 +131,285 @@ class BaseSwamper(object):
             self._verify_args()
 
         self._errors = None
+        self._snapshots = None
         self.error_class = error_class
 
         self.map_fields()
 
+        if self.collector is not None:
+            for step in ('build_instances', 'clean_instances', 'clean'):
+                setattr(self, step, self._timed(self.collector, step, getattr(self, step)))
+
+    @classmethod
+    def _timed(cls, collector, step, function):
+        """
+        Wrap `function` to report its timings for `step` to `collector`, see
+        `swamper.metrics.timed`.
+        """
+        return timed(collector, cls, step, function)
+
     def map_fields(self):
         """
         Re-map instance and data fields.
         """
-        # Re-map instance fields -> data fields.
-        self.fields = list(self.fields)
-        for i, field in enumerate(self.fields):
-            self.fields[i] = self.get_data_field(field)
+        self._plan = self.get_plan(self.fields)
+        if self.collector is not None:
+            self._plan = self._plan.instrumented(type(self), self.collector)
+
+        # Copy, plans are shared between swampers.
+        self.fields = list(self._plan.fields)
+        self.data_to_instance_fields = dict(self._plan.data_to_instance_fields)
+        self.instance_fields = list(self._plan.instance_fields)
 
-        # Build reverse map of instance_to_data_fields.
-        self.data_to_instance_fields = dict([(v, k) for k, v in six.iteritems(self.instance_to_data_fields)])
+    @classmethod
+    def _setup_class(cls):
+        """
+        Give this class its own cache of cleaning plans and verified field
+        lists, and verify its configuration once, the first time it is used
+        instead of for every record.
 
-        # Build list of instance fields.
-        self.instance_fields = self.fields[:]  # copy
-        for i, data_field in enumerate(self.instance_fields):
-            instance_field = self.get_instance_field(data_field)
-            self.instance_fields[i] = instance_field
+        Raises:
+            TypeError: when types not match for fields or instance_to_data_fields.
+        """
+        # Verify fields type, when fields are defined on the class.
+        if cls.__dict__.get('fields') is not None:
+            verify_fields(cls.__dict__['fields'])
+
+        # Verify map type.
+        if not isinstance(cls.instance_to_data_fields, collections.Mapping):
+            raise TypeError("'instance_to_data_fields' must be a 2-dimensional iterable (dict, ..)")
+
+        cls._verified_fields = set()
+        cls._plans = collections.OrderedDict()
+
+    def get_plan(self, fields):
+        """
+        Get the cleaning plan for `fields`, compile it when this class never
+        cleaned these fields before. A swamper with an `instance_to_data_fields`
+        of its own gets a plan of its own, plans of the class are for the
+        mapping of the class.
+
+        Args:
+            fields (list): list of data fields to clean.
+
+        Returns:
+            CleaningPlan: field mappings and clean methods for `fields`.
+        """
+        if '_plans' not in type(self).__dict__:
+            self._setup_class()
+
+        key = tuple(fields)
+        if 'instance_to_data_fields' in self.__dict__:
+            return CleaningPlan(self, key)
+
+        plans = self._plans
+        plan = plans.get(key)
+        if plan is None:
+            if plans and len(plans) >= self.plan_cache_size:
+                plans.popitem(last=False)
+            plan = plans[key] = CleaningPlan(self, key)
+        return plan
 
     def _verify_args(self):
         """
         Validate types for variables that indicate what to clean.
 
         Raises:
-            TypeError: when types not match for fields, data or instances.
+            TypeError: when types not match for fields, data or a map of
+                fields of this swamper itself.
+        """
+        self._verify_fields(self.fields)
+        self._verify_data()
+
+        # The map of the class is verified once, see `_setup_class`.
+        if 'instance_to_data_fields' in self.__dict__:
+            if not isinstance(self.instance_to_data_fields, collections.Mapping):
+                raise TypeError("'instance_to_data_fields' must be a 2-dimensional iterable (dict, ..)")
+
+    def _verify_fields(self, fields):
+        """
+        Validate types for a list of field names. Lists and tuples that were
+        verified before for this class are not verified again.
+
+        Raises:
+            TypeError: when fields is not a list of field names.
         """
-        # Verify fields type.
-        if (not isinstance(self.fields, collections.Iterable) or
-                isinstance(self.fields, collections.Mapping) or
-                isinstance(self.fields, six.string_types)):
-            raise TypeError("'fields' must be a 1-dimensional iterable (list, tuple, ..)")
+        if '_plans' not in type(self).__dict__:
+            self._setup_class()
+
+        key = None
+        if type(fields) in (list, tuple):
+            try:
+                key = tuple(fields)
+                if key in self._verified_fields:
+                    return
+            except TypeError:
+                # Unhashable, so it cannot be a list of field names.
+                key = None
 
-        # Verify field types.
-        for field in self.fields:
-            if not isinstance(field, six.string_types):
-                raise TypeError("'fields' must only contain field names")
+        verify_fields(fields)
+        if key is not None:
+            if len(self._verified_fields) >= self.plan_cache_size:
+                self._verified_fields.clear()
+            self._verified_fields.add(key)
 
-        # Verify data type.
+    def _verify_data(self):
+        """
+        Validate type for the input to clean.
+
+        Raises:
+            TypeError: when data is not a mapping.
+        """
         if not isinstance(self.raw_data, collections.Mapping):
             raise TypeError("'data' must be a 2-dimensional iterable (dict, ..)")
 
-        # Verify map type.
-        if not isinstance(self.instance_to_data_fields, collections.Mapping):
-            raise TypeError("'instance_to_data_fields' must be a 2-dimensional iterable (dict, ..)")
+    def reset(self, data):
+        """
+        Point this swamper to new input to clean, as if it was just built for
+        this input. The outcome of earlier cleaning (errors, cleaned data and
+        instances) is forgotten, everything that does not depend on the input,
+        such as the field mappings, is kept.
+
+        Args:
+            data (dict): input to clean.
+
+        Raises:
+            TypeError: when data is not a mapping.
+        """
+        self.raw_data = data
+        if not self.skip_verify:
+            self._verify_data()
+
+        self._errors = None
+        self._snapshots = None
+        self._prefetched = None
+        for name in ('data', 'cleaned_data', 'instances'):
+            self.__dict__.pop(name, None)
+
+    @classmethod
+    def clean_many(cls, records, *args, **kwargs):
+        """
+        Clean many records with a single swamper, which is only built once
+        and then re-used for every record.
+
+        Args:
+            records (iterable): inputs to clean, consumed lazily, in chunks
+                of `prefetch_chunk_size` records when instances are
+                prefetched.
+            *args: arguments to build the swamper with, the first record
+                is passed as keyword argument `data`.
+            **kwargs: keyword arguments to build the swamper with.
+
+        Yields:
+            CleanResult: the outcome for every record, in input order.
+
+        Raises:
+            ValueError: when `prefetch_instances` doesn't return instances for
+                every record.
+        """
+        for swamper in cls._swampers(records, args, kwargs):
+            swamper.full_clean()
+            yield CleanResult(swamper.raw_data, swamper.cleaned_data, swamper._errors, swamper.instances)
+
+    @classmethod
+    def prefetch_instances(cls, records):
+        """
+        Build instances for many records at once, for example with a single
+        query, instead of calling `build_instances` for every record. Batch
+        cleaning, such as `clean_many`, calls this for every
+        `prefetch_chunk_size` records.
+
+        Args:
+            records (list): inputs that will be cleaned.
+
+        Returns:
+            list: instances for every record, in the same order, as
+                `build_instances` would set them. None to build instances
+                for every record with `build_instances`, which is the
+                default.
+        """
+        return None
+
+    @classmethod
+    def _check_prefetched(cls, records, instances):
+        """
+        Check the outcome of `prefetch_instances` for `records`.
+
+        Returns:
+            list: instances for every record, None for records to build
+                instances for.
+
+        Raises:
+            ValueError: when there are instances, but not for every record.
+        """
+        if instances is None:
+            return [None] * len(records)
+        if len(instances) != len(records):
+            raise ValueError("'prefetch_instances' must return instances for every record")
+        return instances
+
+    @classmethod
+    def _prefetch(cls, records):
+        """
+        Pair records with their prefetched instances, or with None for records
+        to build instances for. Instances for the first record are prefetched
+        on their own, so records are only read ahead in chunks when the class
+        prefetches instances.
+        """
+        iterator = iter(records)
+        for data in iterator:
+            instances = cls.prefetch_instances([data])
+            if instances is None:
+                # This class builds instances for every record.
+                yield data, None
+                for data in iterator:
+                    yield data, None
+                return
+
+            yield data, cls._check_prefetched([data], instances)[0]
+            break
+
+        for chunk in chunks(iterator, cls.prefetch_chunk_size):
+            for pair in zip(chunk, cls._check_prefetched(chunk, cls.prefetch_instances(chunk))):
+                yield pair
+
+    @classmethod
+    def _reuse(cls, swamper, data, args, kwargs, instances=None):
+        """
+        Reset `swamper` to `data`, or build a swamper for `data` when there
+        is none, and hand it instances that were prefetched for `data`.
+
+        Args:
+            swamper (BaseSwamper): swamper to re-use, or None.
+            data (dict): input to clean.
+            args (tuple): arguments to build the swamper with.
+            kwargs (dict): keyword arguments to build the swamper with.
+            instances (dict): prefetched instances, None to build them.
+
+        Returns:
+            BaseSwamper: swamper for `data`.
+        """
+        if swamper is None:
+            swamper = cls(*args, data=data, **kwargs)
+        else:
+            swamper.reset(data)
+        swamper._prefetched = instances
+        return swamper
+
+    @classmethod
+    def _swampers(cls, records, args, kwargs):
+        """
+        Point a single swamper to every record in turn, with instances
+        prefetched per chunk of records, see `prefetch_instances`. This is
+        what all batch cleaning is built on.
+
+        Yields:
+            BaseSwamper: the swamper, reset to the next record.
+        """
+        swamper = None
+        for data, instances in cls._prefetch(records):
+            swamper = cls._reuse(swamper, data, args, kwargs, instances)
+            yield swamper
 
     def build_instances(self):
         """
@@ -165,17 +497,233 @@ class BaseSwamper(object):
         if data_field in self.cleaned_data:
             del self.cleaned_data[data_field]
 
+        if self._error_budget is not None and len(self._errors) >= self._error_budget:
+            raise _ErrorBudgetExceeded()
+
     def full_clean(self):
         """
         Clean instances, fields and do a post clean where you have access to
         all cleaned input data so far. When an error is raised during cleaning
         of instances, don't continue.
+
+        When `max_errors` is set, cleaning stops as soon as that many fields
+        have errors and `errors.short_circuited` is True. When
+        `cleaner_threads` is set, clean methods run in threads and validators
+        run after all fields are cleaned.
+        """
+        if self._prepare_clean():
+            self._clean_prepared()
+
+    def _clean_prepared(self):
+        """
+        Clean fields, run validators and do the post clean, once instances
+        are built and cleaned without errors by `_prepare_clean`.
+        """
+        self._error_budget = self.max_errors
+        try:
+            if self.cleaner_threads:
+                self._clean_fields_threaded()
+                self._run_validators(self._plan.validators)
+            elif self.adaptive_ordering:
+                self._clean_adaptive()
+            elif self.compile_cleaning:
+                self._plan.compile(type(self))(self)
+            else:
+                for cleaners, validators in self._plan.stages:
+                    self._clean_fields(cleaners)
+                    if validators:
+                        self._run_validators(validators)
+            self._clean_all()
+        except _ErrorBudgetExceeded:
+            self._errors.short_circuited = True
+        finally:
+            self._error_budget = None
+
+    @classmethod
+    def get_cleaning_profile(cls):
+        """
+        Get the profile to order fields by for `adaptive_ordering`, which is
+        `cleaning_profile` when set and a recording profile for this class
+        otherwise.
+
+        Returns:
+            CleaningProfile: profile of this class.
+        """
+        if cls.cleaning_profile is not None:
+            return cls.cleaning_profile
+        profile = cls.__dict__.get('_profile')
+        if profile is None:
+            profile = cls._profile = CleaningProfile()
+        return profile
+
+    def _clean_adaptive(self):
+        """
+        Clean fields and run validators in the order of the cleaning profile,
+        recording the time spent and failures of clean methods unless the
+        profile is frozen.
+        """
+        profile = self.get_cleaning_profile()
+        plan = self._plan.ordered(self, profile)
+        if profile.frozen:
+            if self.compile_cleaning:
+                plan.compile(type(self))(self)
+            else:
+                for cleaners, validators in plan.stages:
+                    self._clean_fields(cleaners)
+                    if validators:
+                        self._run_validators(validators)
+            return
+
+        try:
+            for cleaners, validators in plan.stages:
+                self._clean_fields_recorded(cleaners, profile)
+                if validators:
+                    self._run_validators(validators)
+        finally:
+            profile.record_done()
+
+    def lazy_clean(self):
+        """
+        Clean instances, but clean fields only when they are read from
+        `cleaned_data`. Until then, `errors` only has errors for instances and
+        for fields that were read. Validators and the post clean are not run,
+        because they depend on other fields.
+        """
+        if self._prepare_clean():
+            self.cleaned_data = LazyCleanedData(self, self.cleaned_data)
+
+    def partial_clean(self, fields=None):
+        """
+        Clean instances and only the given fields, then run the validators
+        that only depend on these fields. The post clean is not run, because
+        it may depend on any field.
+
+        Args:
+            fields (list): instance or data field names to clean, by default
+                the fields present in the input data.
+
+        Raises:
+            ValueError: if a field was never specified when creating this
+                swamper.
+        """
+        if fields is None:
+            data_fields = set(self.raw_data)
+        else:
+            data_fields = set([self.get_data_field(field) for field in fields])
+            for data_field in data_fields:
+                if data_field not in self.fields:
+                    raise ValueError("No field named '{}'".format(data_field))
+
+        if self._prepare_clean():
+            self._clean_fields([cleaner for cleaner in self._plan.cleaners if cleaner[0] in data_fields])
+            self._run_validators([
+                validator for validator in self._plan.validators if validator[1].issubset(data_fields)
+            ])
+
+    def update(self, data_delta):
+        """
+        Change part of the input and clean again, but only run the clean
+        methods for the changed fields. Validators and the post clean only run
+        again when any of the fields they depend on changed, see `depends_on`.
+
+        Instances are not built and cleaned again. The first update after
+        cleaning by other means cleans everything once.
+
+        Args:
+            data_delta (dict): new values for data fields.
         """
-        self._errors = {}
+        data = dict(self.raw_data)
+        data.update(data_delta)
+        self.raw_data = data
+
+        if self._snapshots is None:
+            if self._prepare_clean():
+                self._clean_fields()
+                fields_snapshot = self._copy_outcome(self.cleaned_data, self._errors)
+                self._run_validators(self._plan.validators)
+                self._snapshots = (fields_snapshot, self._copy_outcome(self.cleaned_data, self._errors))
+                self._clean_all()
+            return
+
+        self.data = self.raw_data
+        cleaners = [cleaner for cleaner in self._plan.cleaners if cleaner[0] in data_delta]
+        changed = frozenset([data_field for data_field, _ in cleaners])
+        final_outcome = (self.cleaned_data, self._errors)
+        fields_snapshot, validators_snapshot = self._snapshots
+
+        # Re-clean changed fields on top of the outcome of cleaning fields.
+        self.cleaned_data, self._errors = self._copy_outcome(*fields_snapshot)
+        for data_field in changed:
+            self.cleaned_data.pop(data_field, None)
+            self._errors.pop(data_field, None)
+        self._clean_fields(cleaners)
+        fields_snapshot = self._copy_outcome(self.cleaned_data, self._errors)
+
+        validators_changed = any(not changed.isdisjoint(data_fields) for _, data_fields in self._plan.validators)
+        if validators_changed:
+            self._run_validators(self._plan.validators)
+        else:
+            # Validators aren't affected, patch their earlier outcome instead.
+            self._patch_outcome(self._copy_outcome(*validators_snapshot), changed)
+        self._snapshots = (fields_snapshot, self._copy_outcome(self.cleaned_data, self._errors))
+
+        depends_on = self._plan.clean_depends_on
+        if validators_changed or depends_on is None or not changed.isdisjoint(depends_on):
+            self._clean_all()
+        else:
+            # The post clean isn't affected, patch its earlier outcome instead.
+            self._patch_outcome(final_outcome, changed)
+
+    def _copy_outcome(self, cleaned_data, errors):
+        """
+        Copy cleaned data and errors, for `update` to remember them.
+
+        Returns:
+            tuple: copies of `cleaned_data` and `errors`.
+        """
+        return dict(cleaned_data), ErrorDict([(field, list(messages)) for field, messages in six.iteritems(errors)])
+
+    def _patch_outcome(self, outcome, data_fields):
+        """
+        Copy the current outcome for some fields into an earlier outcome, then
+        make that the current outcome.
+
+        Args:
+            outcome (tuple): cleaned data and errors to patch.
+            data_fields (iterable): names of data fields to copy.
+        """
+        cleaned_data, errors = outcome
+        for data_field in data_fields:
+            cleaned_data.pop(data_field, None)
+            if data_field in self.cleaned_data:
+                cleaned_data[data_field] = self.cleaned_data[data_field]
+
+            errors.pop(data_field, None)
+            if data_field in self._errors:
+                errors[data_field] = list(self._errors[data_field])
+
+        self.cleaned_data, self._errors = cleaned_data, errors
+
+    def _prepare_clean(self):
+        """
+        Reset the outcome of earlier cleaning, then build (or take the
+        prefetched) instances and clean them.
+
+        Returns:
+            bool: True when fields can be cleaned, False when errors occurred
+                during setup.
+        """
+        self._errors = ErrorDict()
+        self._snapshots = None
         self.cleaned_data = {}
         self.data = self.raw_data
+        self._bind_plan()
 
-        self.build_instances()
+        if self._prefetched is None:
+            self.build_instances()
+        else:
+            self.instances = self._prefetched
+            self._prefetched = None
         if not self.skip_verify:
             # Verify instances type.
             if not isinstance(self.instances, collections.Mapping):
@@ -185,11 +733,18 @@ class BaseSwamper(object):
             self.clean_instances()
         except self.error_class as e:
             self.add_error(NON_FIELD_ERRORS, e)
-        else:
-            # Avoid cleaning fields when errors occurred during setup.
-            if not self._errors:
-                self._clean_fields()
-                self._clean_all()
+            return False
+
+        # Avoid cleaning fields when errors occurred during setup.
+        return not self._errors
+
+    def _bind_plan(self):
+        """
+        Switch to a plan of this swamper only when clean methods are assigned
+        on the swamper itself, which then replace those of its class.
+        """
+        if not self._plan.cleaner_names.isdisjoint(self.__dict__):
+            self._plan = self._plan.bound(self)
 
     def test_is_blank(self, data_field, value):
         """
@@ -204,24 +759,120 @@ class BaseSwamper(object):
 
         return is_empty and data_field in self.raw_data
 
-    def _clean_fields(self):
+    def _clean_fields(self, cleaners=None):
         """
         Run all clean methods for predefined fields, these methods are also
         called when the correspondig field isn't present in the input data.
+
+        Args:
+            cleaners (list): (data field, clean method) pairs to run instead
+                of those for all fields.
         """
-        for data_field in self.fields:
-            value = self.data.get(data_field)
-            if data_field not in self.cleaned_data:
-                self.cleaned_data[data_field] = value
+        if cleaners is None:
+            cleaners = self._plan.cleaners
+
+        data = self.data
+        cleaned_data = self.cleaned_data
+        for data_field, cleaner in cleaners:
+            value = data.get(data_field)
+            if data_field not in cleaned_data:
+                cleaned_data[data_field] = value
+
+            if cleaner is None:
+                continue
 
             try:
-                if hasattr(self, 'clean_%s' % data_field):
-                    is_blank = self.test_is_blank(data_field, value)
-                    value = getattr(self, 'clean_%s' % data_field)(value, is_blank=is_blank)
-                    self.cleaned_data[data_field] = value
+                is_blank = self.test_is_blank(data_field, value)
+                cleaned_data[data_field] = cleaner(self, value, is_blank=is_blank)
             except self.error_class as e:
                 self.add_error(data_field, e)
 
+    def _clean_fields_recorded(self, cleaners, profile):
+        """
+        Like `_clean_fields`, but record the time spent and failures of every
+        clean method in `profile`.
+        """
+        timer = timeit.default_timer
+        data = self.data
+        cleaned_data = self.cleaned_data
+        for data_field, cleaner in cleaners:
+            value = data.get(data_field)
+            if data_field not in cleaned_data:
+                cleaned_data[data_field] = value
+
+            if cleaner is None:
+                continue
+
+            start = timer()
+            try:
+                is_blank = self.test_is_blank(data_field, value)
+                cleaned_data[data_field] = cleaner(self, value, is_blank=is_blank)
+            except self.error_class as e:
+                profile.record(data_field, timer() - start, True)
+                self.add_error(data_field, e)
+            else:
+                profile.record(data_field, timer() - start, False)
+
+    def _clean_field(self, data_field, cleaner, value):
+        """
+        Run the clean method for a single field.
+
+        Returns:
+            tuple: the cleaned value and None, or None and the error raised
+                by the clean method.
+        """
+        try:
+            is_blank = self.test_is_blank(data_field, value)
+            return cleaner(self, value, is_blank=is_blank), None
+        except self.error_class as e:
+            return None, e
+
+    def _clean_fields_threaded(self):
+        """
+        Run all clean methods for predefined fields in the shared thread pool,
+        which pays off when they wait for I/O. Clean methods run at the same
+        time, so they cannot rely on other fields being cleaned already.
+
+        The outcome is added to `cleaned_data` and errors in field order, as
+        if the fields were cleaned one by one.
+        """
+        data = self.data
+        cleaned_data = self.cleaned_data
+        swamper_class = type(self)
+
+        pending = []
+        for data_field, cleaner in self._plan.cleaners:
+            value = data.get(data_field)
+            if data_field not in cleaned_data:
+                cleaned_data[data_field] = value
+            if cleaner is not None:
+                pending.append((data_field, submit(swamper_class, self._clean_field, data_field, cleaner, value)))
+
+        for data_field, future in pending:
+            value, error = future.result()
+            if error is None:
+                cleaned_data[data_field] = value
+            else:
+                self.add_error(data_field, error)
+
+    def _run_validators(self, validators):
+        """
+        Run validators for fields that depend on each other, skip those for
+        which any of the fields has errors.
+
+        Args:
+            validators (list): (validator, data fields) pairs to run.
+        """
+        errors = self._errors
+        for validator, data_fields in validators:
+            if any(data_field in errors for data_field in data_fields):
+                continue
+
+            try:
+                validator(self)
+            except self.error_class as e:
+                self.add_error(NON_FIELD_ERRORS, e)
+
     def _clean_all(self):
         """
         Run the global method to clean fields that depend on each other.
@@ -273,6 +924,10 @@ class BaseSwamper(object):
         Returns:
             object: instance with (updated) values for `fields`.
         """
+        if isinstance(getattr(self, 'cleaned_data', None), LazyCleanedData):
+            # Clean the fields to assign first, their errors prevent building.
+            self.cleaned_data.resolve([self.get_data_field(field) for field in fields])
+
         if not self.is_clean():
             raise ValueError('Cannot build or update because there are errors')
 
@@ -284,16 +939,7 @@ class BaseSwamper(object):
             instance = instance_or_class
 
         if not self.skip_verify:
-            # Verify fields type.
-            if not (isinstance(fields, collections.Iterable) and
-                    not isinstance(fields, collections.Mapping) and
-                    not isinstance(fields, six.string_types)):
-                raise TypeError("'fields' must be 1 dimensional iterable (list, tuple, ..)")
-
-            # Verify field types.
-            for field in fields:
-                if not isinstance(field, six.string_types):
-                    raise TypeError("'fields' must only contain field names")
+            self._verify_fields(fields)
 
         # Verify if all instances type were pre-defined.
         if self.instances and klass not in self.instances:
@@ -303,3 +949,64 @@ class BaseSwamper(object):
             self.setattr(instance, field)
 
         return instance
+
+    @classmethod
+    def _field_mapper(cls):
+        """
+        Get a swamper without input, to map field names like swampers with
+        input do, with `get_data_field` and `get_instance_field`.
+        """
+        swamper = cls.__new__(cls)
+        swamper.data_to_instance_fields = dict([(v, k) for k, v in six.iteritems(cls.instance_to_data_fields)])
+        return swamper
+
+    @classmethod
+    def build_or_update_many(cls, results, klass, fields, skip_verify=False):
+        """
+        Return an object for every result, like `build_or_update` does for a
+        single swamper. Field names are mapped once for all results, and
+        values are assigned in the fastest way that is safe for `klass`.
+
+        Args:
+            results (iterable): results of `clean_many`.
+            klass (type): type to build instances for, an instance of this
+                type in the instances of a result is updated instead.
+            fields (list): list of field names to assign for instances.
+            skip_verify (bool): toggle argument type checking (default=False).
+
+        Returns:
+            list: instances with (updated) values for `fields`.
+
+        Raises:
+            ValueError: if any of the results has errors.
+        """
+        swamper = cls._field_mapper()
+        if not skip_verify:
+            swamper._verify_fields(fields)
+
+        if six.get_unbound_function(cls.setattr) is six.get_unbound_function(BaseSwamper.setattr):
+            assign = compile_setter(klass, [
+                (swamper.get_data_field(field), swamper.get_instance_field(field)) for field in fields
+            ])
+        else:
+            def assign(instance, cleaned_data):
+                swamper.cleaned_data = cleaned_data
+                for field in fields:
+                    swamper.setattr(instance, field)
+
+        instances = []
+        for result in results:
+            if result.errors:
+                raise ValueError('Cannot build or update because there are errors')
+
+            # Verify if all instances type were pre-defined.
+            if result.instances and klass not in result.instances:
+                raise TypeError("'klass' must be in 'instances'")
+
+            instance = result.instances.get(klass)
+            if instance is None:
+                instance = klass()
+            assign(instance, result.cleaned_data)
+            instances.append(instance)
+
+        return instances
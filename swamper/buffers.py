@@ -0,0 +1,139 @@
+"""
+Collect cleaned batches in columns instead of a dict per record.
+"""
+import array
+import collections
+import itertools
+
+
+class ColumnBuffers(object):
+    """
+    Cleaned values of a batch per column, keyed by instance field name, and
+    an index of rejected rows.
+
+    Attributes:
+        columns (OrderedDict): map of instance field to list of cleaned
+            values of the clean rows, in field order.
+        rejected_rows (array.array): input positions (starting at 0) of rows
+            with errors.
+        errors (list): errors of the rejected rows, in the same order.
+        rows (int): number of rows seen.
+    """
+
+    def __init__(self, data_fields, instance_fields):
+        """
+        Args:
+            data_fields (list): data fields to collect.
+            instance_fields (list): instance field names to collect them as,
+                in the same order.
+        """
+        self.columns = collections.OrderedDict([(instance_field, []) for instance_field in instance_fields])
+        self._appenders = tuple([
+            (data_field, self.columns[instance_field].append)
+            for data_field, instance_field in zip(data_fields, instance_fields)
+        ])
+        self.rejected_rows = array.array('l')
+        self.errors = []
+        self.rows = 0
+
+    def __len__(self):
+        """
+        Returns:
+            int: number of clean rows.
+        """
+        return self.rows - len(self.rejected_rows)
+
+    def append(self, cleaned_data, errors):
+        """
+        Add the outcome of cleaning a row, to the columns when it is clean or
+        to the rejected rows otherwise. Fields missing from cleaned data are
+        added as None.
+        """
+        if errors:
+            self.rejected_rows.append(self.rows)
+            self.errors.append(errors)
+        else:
+            get = cleaned_data.get
+            for data_field, append in self._appenders:
+                append(get(data_field))
+        self.rows += 1
+
+    def as_lists(self):
+        """
+        Returns:
+            dict: map of instance field to list of values, these are the
+                buffers themselves.
+        """
+        return collections.OrderedDict(self.columns)
+
+    def as_arrays(self, typecodes):
+        """
+        Copy columns into compact arrays.
+
+        Args:
+            typecodes (dict): map of instance field to `array` type code,
+                only these columns are returned.
+
+        Returns:
+            dict: map of instance field to `array.array`.
+
+        Raises:
+            TypeError: when a value doesn't fit the type code.
+        """
+        return collections.OrderedDict([
+            (instance_field, array.array(typecodes[instance_field], values))
+            for instance_field, values in self.columns.items() if instance_field in typecodes
+        ])
+
+    def as_numpy(self, dtypes=None):
+        """
+        Copy columns into NumPy arrays, this requires numpy.
+
+        Args:
+            dtypes (dict): map of instance field to dtype, other columns get
+                the dtype NumPy picks.
+
+        Returns:
+            dict: map of instance field to `numpy.ndarray`.
+        """
+        import numpy
+
+        dtypes = dtypes or {}
+        return collections.OrderedDict([
+            (instance_field, numpy.array(values, dtype=dtypes.get(instance_field)))
+            for instance_field, values in self.columns.items()
+        ])
+
+
+def clean_to_columns(swamper_class, records, args=(), kwargs=None):
+    """
+    Clean records like `clean_many`, collecting cleaned values straight into
+    column buffers instead of keeping the cleaned data of every record.
+
+    Args:
+        swamper_class (type): swamper to clean records with.
+        records (iterable): inputs to clean.
+        args (tuple): arguments to build the swamper with, see
+            `BaseSwamper.clean_many`.
+        kwargs (dict): keyword arguments to build the swamper with.
+
+    Returns:
+        ColumnBuffers: cleaned columns and rejected rows, without columns
+            when there are no records.
+    """
+    if kwargs is None:
+        kwargs = {}
+
+    records = iter(records)
+    for first in records:
+        break
+    else:
+        return ColumnBuffers([], [])
+
+    # Resolve the fields to collect like the swamper that cleans them does.
+    swamper = swamper_class(*args, data=first, **kwargs)
+    buffers = ColumnBuffers(swamper.fields, swamper.instance_fields)
+
+    for result in swamper_class.clean_many(itertools.chain([first], records), *args, **kwargs):
+        buffers.append(result.cleaned_data, result.errors)
+    return buffers
@@ -0,0 +1,145 @@
+import collections
+import copy
+import functools
+import threading
+import weakref
+
+
+CacheInfo = collections.namedtuple('CacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize'])
+
+_MISSING = object()
+
+
+class LRUCache(object):
+    """
+    Cache with a maximum size, which evicts the least recently used entries
+    first and keeps count of hits, misses and evictions.
+    """
+
+    def __init__(self, maxsize=128):
+        """
+        Args:
+            maxsize (int): maximum number of entries to keep.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=None):
+        """
+        Get the value for `key` and mark it as most recently used.
+
+        Raises:
+            TypeError: when `key` is unhashable.
+        """
+        with self._lock:
+            try:
+                value = self._data.pop(key)
+            except KeyError:
+                self.misses += 1
+                return default
+
+            self._data[key] = value
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        """
+        Set the value for `key`, evict the least recently used entry when the
+        cache grows too big.
+        """
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = value
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """
+        Remove all entries, counters are kept.
+        """
+        with self._lock:
+            self._data.clear()
+
+    def info(self):
+        """
+        Returns:
+            CacheInfo: counters and size of this cache.
+        """
+        return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._data))
+
+
+def cached(maxsize=128):
+    """
+    Decorate a clean method to remember its outcome for values it has cleaned
+    before, including errors of `error_class` it raised.
+
+    Only use this for clean methods that depend on nothing but the value and
+    `is_blank`. Unhashable values are never cached.
+
+    By default every swamper instance has its own cache, set
+    `share_cleaner_cache = True` on a swamper class to share a cache between
+    all its instances. Use `cache_for` on the decorated method to inspect the
+    cache for a swamper:
+
+        Swamper.clean_name.cache_for(swamper).info()
+
+    Args:
+        maxsize (int): maximum number of values to remember per cache.
+    """
+    def decorator(cleaner):
+        class_caches = weakref.WeakKeyDictionary()
+
+        def cache_for(swamper):
+            """
+            Get the cache that is used for `swamper`.
+
+            Returns:
+                LRUCache: cache of this clean method.
+            """
+            if swamper.share_cleaner_cache:
+                caches = class_caches
+                key = type(swamper)
+            else:
+                caches = swamper.__dict__.setdefault('_cleaner_caches', {})
+                key = wrapper
+
+            cache = caches.get(key)
+            if cache is None:
+                cache = caches[key] = LRUCache(maxsize)
+            return cache
+
+        @functools.wraps(cleaner)
+        def wrapper(self, value, is_blank):
+            cache = cache_for(self)
+
+            # Include the type, so for example `1` and `True` don't collide.
+            key = (type(value), value, is_blank)
+            try:
+                outcome = cache.get(key, _MISSING)
+            except TypeError:
+                return cleaner(self, value, is_blank=is_blank)
+
+            if outcome is _MISSING:
+                try:
+                    outcome = (cleaner(self, value, is_blank=is_blank), None)
+                except self.error_class as e:
+                    outcome = (None, e)
+                cache.set(key, outcome)
+
+            value, error = outcome
+            if error is not None:
+                # Raise a copy, so tracebacks don't pile up on the cached one.
+                raise copy.copy(error)
+            return value
+
+        wrapper.cache_for = cache_for
+        return wrapper
+    return decorator
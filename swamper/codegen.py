@@ -0,0 +1,109 @@
+import collections
+import linecache
+
+import six
+
+
+def _test_is_blank_source(data_field):
+    """
+    Source lines that inline `BaseSwamper.test_is_blank` for a field, with
+    shortcuts for values that are None or a plain `str`.
+    """
+    return [
+        'if value is None:',
+        '    is_empty = True',
+        'elif type(value) is str:',
+        "    is_empty = value == ''",
+        'elif isinstance(value, Iterable) and not isinstance(value, string_types):',
+        '    is_empty = len(value) == 0',
+        'else:',
+        '    is_empty = value in EMPTY',
+        'is_blank = is_empty and {!r} in raw_data'.format(data_field),
+    ]
+
+
+def _indent(lines, level=1):
+    return ['    ' * level + line for line in lines]
+
+
+def compile_clean_fields(swamper_class, plan):
+    """
+    Generate a function that does what cleaning fields and running
+    validators for `plan` does, without looping over fields: field names and
+    clean methods are written out for every field.
+
+    `test_is_blank` is inlined unless `swamper_class` overrides it.
+
+    Args:
+        swamper_class (type): swamper class `plan` was compiled for.
+        plan (CleaningPlan): plan to generate the function for.
+
+    Returns:
+        function: takes the swamper to clean fields for.
+    """
+    from .base import BaseSwamper, NON_FIELD_ERRORS
+
+    test_is_blank = six.get_unbound_function(swamper_class.test_is_blank)
+    inline_is_blank = test_is_blank is six.get_unbound_function(BaseSwamper.test_is_blank)
+    namespace = {
+        'EMPTY': ['', None],
+        'Iterable': collections.Iterable,
+        'NON_FIELD_ERRORS': NON_FIELD_ERRORS,
+        'string_types': six.string_types,
+    }
+
+    lines = [
+        'def clean_fields(self):',
+        '    data = self.data',
+        '    raw_data = self.raw_data',
+        '    cleaned_data = self.cleaned_data',
+        '    errors = self._errors',
+        '    error_class = self.error_class',
+    ]
+
+    for stage, (cleaners, validators) in enumerate(plan.stages):
+        for i, (data_field, cleaner) in enumerate(cleaners):
+            lines.extend(_indent([
+                '',
+                'value = data.get({!r})'.format(data_field),
+                'if {!r} not in cleaned_data:'.format(data_field),
+                '    cleaned_data[{!r}] = value'.format(data_field),
+            ]))
+            if cleaner is None:
+                continue
+
+            name = 'cleaner_{}_{}'.format(stage, i)
+            namespace[name] = cleaner
+            if inline_is_blank:
+                is_blank = _test_is_blank_source(data_field)
+            else:
+                is_blank = ['is_blank = self.test_is_blank({!r}, value)'.format(data_field)]
+            lines.extend(_indent(['try:'] + _indent(is_blank + [
+                'cleaned_data[{!r}] = {}(self, value, is_blank=is_blank)'.format(data_field, name),
+            ]) + [
+                'except error_class as e:',
+                '    self.add_error({!r}, e)'.format(data_field),
+            ]))
+
+        for i, (validator, data_fields) in enumerate(validators):
+            name = 'validator_{}_{}'.format(stage, i)
+            namespace[name] = validator
+            lines.extend(_indent([
+                '',
+                'if not ({}):'.format(' or '.join(['{!r} in errors'.format(f) for f in sorted(data_fields)])),
+                '    try:',
+                '        {}(self)'.format(name),
+                '    except error_class as e:',
+                '        self.add_error(NON_FIELD_ERRORS, e)',
+            ]))
+
+    source = '\n'.join(lines) + '\n'
+    filename = '<swamper clean_fields {}.{} {}>'.format(swamper_class.__module__, swamper_class.__name__, id(plan))
+    six.exec_(compile(source, filename, 'exec'), namespace)
+
+    # Make tracebacks show the generated source.
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+
+    clean_fields = namespace['clean_fields']
+    clean_fields.source = source
+    return clean_fields
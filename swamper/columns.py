@@ -0,0 +1,147 @@
+"""
+Clean columns of values at once with NumPy, this module requires numpy.
+"""
+import numpy
+
+
+class ColumnBatch(object):
+    """
+    Outcome of cleaning columns with `clean_columns`.
+
+    Attributes:
+        cleaned (dict): cleaned array for every data field, including the
+            values of rows that have errors.
+        errors (dict): map of row index to a map of field to list of errors,
+            for rows with errors only.
+        valid (numpy.ndarray): boolean mask of rows without errors.
+    """
+
+    def __init__(self, cleaned, errors, valid):
+        self.cleaned = cleaned
+        self.errors = errors
+        self.valid = valid
+
+    def __len__(self):
+        return len(self.valid)
+
+    def valid_columns(self):
+        """
+        Returns:
+            dict: cleaned arrays for every data field, with only the rows
+                without errors.
+        """
+        return dict([(data_field, values[self.valid]) for data_field, values in self.cleaned.items()])
+
+
+def _as_columns(columns):
+    """
+    Turn a structured array or a mapping of columns into a dict of arrays.
+
+    Returns:
+        tuple: dict of arrays and the number of rows.
+
+    Raises:
+        ValueError: when columns differ in length.
+    """
+    if isinstance(columns, numpy.ndarray) and columns.dtype.names:
+        columns = dict([(name, columns[name]) for name in columns.dtype.names])
+    else:
+        columns = dict([(name, numpy.asarray(values)) for name, values in columns.items()])
+
+    lengths = set([len(values) for values in columns.values()])
+    if len(lengths) > 1:
+        raise ValueError('All columns must have the same number of rows')
+    return columns, lengths.pop() if lengths else 0
+
+
+def _blank_mask(swamper, data_field, values):
+    """
+    Vectorized `test_is_blank`: strings are blank when empty and numbers are
+    never blank. Other values are tested one by one with `test_is_blank`.
+    """
+    if values.dtype.kind == 'U':
+        return values == u''
+    if values.dtype.kind == 'S':
+        return values == b''
+    if values.dtype.kind == 'O':
+        return numpy.array([swamper.test_is_blank(data_field, value) for value in values], dtype=bool)
+    return numpy.zeros(len(values), dtype=bool)
+
+
+def clean_columns(swamper_class, columns, args=(), kwargs=None):
+    """
+    Clean whole columns of values at once.
+
+    A swamper can define column clean methods that take an array of values
+    and a boolean mask of blank values, and return the cleaned array. To
+    reject rows, return a tuple of the cleaned array and an array of error
+    messages, where an empty message means no error:
+
+        def clean_age_column(self, values, is_blank_mask):
+            values = values.astype(int)
+            return values, numpy.where(values < 0, 'Age must be positive', '')
+
+    Fields without a column clean method are cleaned value by value with
+    their `clean_<field>` method. Instances are not built or cleaned and
+    validators and the post clean are not run, those are about single rows.
+
+    Args:
+        swamper_class (type): swamper to clean columns with.
+        columns (dict|numpy.ndarray): map of data field to array-like column,
+            or a structured array. Fields without a column are missing from
+            the input.
+        args (tuple): arguments to build the swamper with, see
+            `BaseSwamper.clean_many`.
+        kwargs (dict): keyword arguments to build the swamper with.
+
+    Returns:
+        ColumnBatch: cleaned columns and errors per row.
+
+    Raises:
+        ValueError: when columns differ in length.
+    """
+    columns, size = _as_columns(columns)
+    if kwargs is None:
+        kwargs = {}
+
+    swamper = swamper_class(*args, data=columns, **kwargs)
+    swamper.cleaned_data = {}
+    swamper._errors = {}
+    swamper._bind_plan()
+
+    cleaned = {}
+    errors = {}
+    valid = numpy.ones(size, dtype=bool)
+
+    def reject(row, data_field, messages):
+        valid[row] = False
+        errors.setdefault(row, {}).setdefault(data_field, []).extend(messages)
+
+    for data_field, cleaner in swamper._plan.cleaners:
+        if data_field in columns:
+            values = columns[data_field]
+        else:
+            values = numpy.full(size, None, dtype=object)
+
+        column_cleaner = getattr(swamper_class, 'clean_%s_column' % data_field, None)
+        if column_cleaner is not None:
+            outcome = column_cleaner(swamper, values, _blank_mask(swamper, data_field, values))
+            if isinstance(outcome, tuple):
+                outcome, messages = outcome
+                messages = numpy.asarray(messages, dtype=object)
+                rejected = numpy.not_equal(messages, '') & numpy.not_equal(messages, None)
+                for row in numpy.flatnonzero(rejected):
+                    reject(int(row), data_field, [str(messages[row])])
+            cleaned[data_field] = numpy.asarray(outcome)
+        elif cleaner is not None:
+            outcome = numpy.empty(size, dtype=object)
+            for row, value in enumerate(values):
+                try:
+                    outcome[row] = cleaner(swamper, value, is_blank=swamper.test_is_blank(data_field, value))
+                except swamper.error_class as e:
+                    reject(row, data_field, swamper.handle_error(data_field, e))
+            cleaned[data_field] = outcome
+        else:
+            cleaned[data_field] = values
+
+    return ColumnBatch(cleaned, errors, valid)
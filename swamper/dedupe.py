@@ -0,0 +1,95 @@
+"""
+Clean batches with many identical records once per distinct record.
+"""
+from .base import CleanResult, ErrorDict
+from .cache import LRUCache
+
+_MISSING = object()
+
+
+def fingerprint(data, data_fields):
+    """
+    Build a key for the values of `data_fields` in `data`, which is equal for
+    records with equal values of the same types. Missing fields differ from
+    fields with any value.
+
+    Returns:
+        tuple: hashable key when all values are hashable.
+    """
+    key = []
+    for data_field in data_fields:
+        value = data.get(data_field, _MISSING)
+        key.append((type(value), value))
+    return tuple(key)
+
+
+def _copy_result(result, data, instances):
+    """
+    Copy the outcome of a result for other input and instances, so changes to
+    one result don't affect another.
+    """
+    errors = ErrorDict([(field, list(messages)) for field, messages in result.errors.items()])
+    errors.short_circuited = result.errors.short_circuited
+    return CleanResult(data, dict(result.cleaned_data), errors, instances)
+
+
+def clean_deduped(swamper_class, records, args=(), kwargs=None, cache=None):
+    """
+    Clean records like `clean_many`, but clean a record only once when it
+    comes by again: a record with the same values for the fields to clean as
+    an earlier record gets a copy of the earlier result.
+
+    Instances are still built and cleaned for every record, so identical
+    records never share them, only the outcome of cleaning fields, running
+    validators and the post clean is re-used. Only the fields to clean are
+    compared, so this is only correct when that outcome depends on nothing
+    else. Set `deduplicate_records = False` on swamper classes whose clean
+    methods have side effects or depend on instances or external state, their
+    records are all cleaned.
+
+    Records with unhashable values are always cleaned.
+
+    Args:
+        swamper_class (type): swamper to clean records with.
+        records (iterable): inputs to clean, consumed lazily, in chunks of
+            `prefetch_chunk_size` records when instances are prefetched.
+        args (tuple): arguments to build the swamper with, see
+            `BaseSwamper.clean_many`.
+        kwargs (dict): keyword arguments to build the swamper with.
+        cache (LRUCache): cache of results, pass a cache to inspect its hit
+            rate with `cache.info()` (default=a cache of 1024 results).
+
+    Yields:
+        CleanResult: the outcome for every record, in input order.
+    """
+    if kwargs is None:
+        kwargs = {}
+    if not swamper_class.deduplicate_records:
+        for result in swamper_class.clean_many(records, *args, **kwargs):
+            yield result
+        return
+
+    if cache is None:
+        cache = LRUCache(1024)
+
+    for swamper in swamper_class._swampers(records, args, kwargs):
+        data = swamper.raw_data
+        if not swamper._prepare_clean():
+            # Errors of instances are never re-used.
+            yield CleanResult(data, swamper.cleaned_data, swamper._errors, swamper.instances)
+            continue
+
+        key = fingerprint(data, swamper.fields)
+        try:
+            result = cache.get(key)
+        except TypeError:
+            key = result = None
+        if result is not None:
+            yield _copy_result(result, data, swamper.instances)
+            continue
+
+        swamper._clean_prepared()
+        result = CleanResult(data, swamper.cleaned_data, swamper._errors, swamper.instances)
+        if key is not None:
+            cache.set(key, _copy_result(result, data, None))
+        yield result
@@ -0,0 +1,50 @@
+def depends_on(*fields):
+    """
+    Declare which fields a method of a swamper reads from `cleaned_data`.
+
+    Decorating `clean` with this limits re-running it on `update` to changes
+    of these fields:
+
+        @depends_on('start_date', 'end_date')
+        def clean(self):
+            ...
+
+    Decorating a `clean_<field>` method with this keeps it after these
+    fields when `adaptive_ordering` reorders clean methods.
+
+    Args:
+        *fields (str): instance or data field names.
+    """
+    def decorator(method):
+        method.depends_on = fields
+        return method
+    return decorator
+
+
+def validates(*fields):
+    """
+    Mark a method of a swamper as a validator for fields that depend on each
+    other. A validator runs as soon as all of its fields are cleaned, and is
+    skipped when any of them has errors. Raise `error_class` or use
+    `add_error` to report errors, a raised error is added to the non field
+    errors.
+
+        @validates('start_date', 'end_date')
+        def validate_period(self):
+            if self.cleaned_data['start_date'] > self.cleaned_data['end_date']:
+                raise self.error_class('A period cannot end before it starts.')
+
+    Args:
+        *fields (str): instance or data field names.
+
+    Raises:
+        TypeError: when no fields are given.
+    """
+    if not fields:
+        raise TypeError("'validates' needs at least one field")
+
+    def decorator(method):
+        method.validates = fields
+        method.depends_on = fields
+        return method
+    return decorator
@@ -0,0 +1,214 @@
+"""
+Stream CSV and JSON Lines files through a swamper, see `ingest` and
+`python -m swamper --help`.
+"""
+import csv
+import io
+import json
+import sys
+import time
+
+import six
+
+from .utils import chunks
+
+FORMATS = ('csv', 'jsonl')
+
+
+class IngestReport(object):
+    """
+    Counts of an ingestion run.
+
+    Attributes:
+        rows (int): number of records read.
+        clean (int): number of records written to the clean output.
+        rejected (int): number of records with errors.
+        seconds (float): time spent so far.
+    """
+
+    def __init__(self, rows=0, clean=0, rejected=0, seconds=0.0):
+        self.rows = rows
+        self.clean = clean
+        self.rejected = rejected
+        self.seconds = seconds
+
+    @property
+    def rows_per_second(self):
+        if not self.seconds:
+            return 0.0
+        return self.rows / self.seconds
+
+    def __str__(self):
+        return '{} rows ({} clean, {} rejected) in {:.2f}s, {:.0f} rows/s'.format(
+            self.rows, self.clean, self.rejected, self.seconds, self.rows_per_second)
+
+
+def guess_format(path):
+    """
+    Tell the format of a file from its extension.
+
+    Raises:
+        ValueError: when the extension is not known.
+    """
+    if path.endswith('.csv'):
+        return 'csv'
+    if path.endswith(('.jsonl', '.ndjson')):
+        return 'jsonl'
+    raise ValueError('Cannot tell the format of {!r}, choose one of: {}'.format(path, ', '.join(FORMATS)))
+
+
+def open_file(path, mode):
+    """
+    Open a file to read or write records, '-' is stdin or stdout.
+    """
+    if path == '-':
+        return sys.stdin if mode == 'r' else sys.stdout
+    if six.PY2:  # pragma: no cover
+        # The csv module of python 2 works on bytes.
+        return open(path, mode + 'b')
+    else:  # pragma: no cover
+        return io.open(path, mode, newline='', encoding='utf-8')
+
+
+def read_records(source, format):
+    """
+    Read records one by one from an open file.
+
+    Args:
+        source (file): file to read, opened in text mode.
+        format (str): 'csv' for a CSV file with a header row, or 'jsonl' for
+            a JSON object on every line.
+
+    Yields:
+        dict: every record, blank JSON lines are skipped.
+    """
+    if format == 'csv':
+        for record in csv.DictReader(source):
+            yield record
+    elif format == 'jsonl':
+        for line in source:
+            if line.strip():
+                yield json.loads(line)
+    else:
+        raise ValueError('Unknown format {!r}, choose one of: {}'.format(format, ', '.join(FORMATS)))
+
+
+def _to_json(value):
+    """
+    Make values that json cannot serialize, like dates, serializable.
+    """
+    if isinstance(value, bytes):  # pragma: no cover
+        # Only on python 3, json writes bytes itself on python 2.
+        return value.decode('utf-8', 'replace')
+    return six.text_type(value)
+
+
+def _dump(record):
+    return json.dumps(record, default=_to_json)
+
+
+class _CsvWriter(object):
+    """
+    Write cleaned data as CSV, the header is taken from the first record, in
+    the column order of `reader` with other fields sorted after them.
+    """
+
+    def __init__(self, output, reader):
+        self.output = output
+        self.reader = reader
+        self.writer = None
+
+    def writerows(self, records):
+        for record in records:
+            if self.writer is None:
+                columns = [column for column in self.reader.fieldnames if column in record]
+                columns += sorted(set(record) - set(columns))
+                self.writer = csv.DictWriter(self.output, columns, extrasaction='ignore')
+                self.writer.writeheader()
+            self.writer.writerow(record)
+
+
+class _JsonLinesWriter(object):
+    def __init__(self, output):
+        self.output = output
+
+    def writerows(self, records):
+        self.output.write(''.join([_dump(record) + '\n' for record in records]))
+
+
+def ingest(swamper_class, source, clean_output, reject_output=None, format='jsonl', args=(), kwargs=None,
+           chunk_size=1000, workers=None, progress=None):
+    """
+    Stream records from a file through a swamper, writing cleaned data of
+    clean records to `clean_output` and rejected records to `reject_output`.
+
+    Records are read, cleaned and written a chunk at a time, so memory use
+    does not grow with the size of the file.
+
+    Rejected records are written as JSON Lines, with the line or row number
+    (starting at 1), the raw data and the errors, non field errors are under
+    the key null:
+
+        {"row": 3, "data": {"name": ""}, "errors": {"name": ["Name is required"]}}
+
+    Args:
+        swamper_class (type): swamper to clean records with.
+        source (file): file to read records from.
+        clean_output (file): file to write cleaned data to, in `format`.
+        reject_output (file): file to write rejected records to, rejected
+            records are only counted when not given.
+        format (str): format of `source` and `clean_output`, 'csv' or
+            'jsonl'.
+        args (tuple): arguments to build the swamper with, see
+            `BaseSwamper.clean_many`.
+        kwargs (dict): keyword arguments to build the swamper with.
+        chunk_size (int): number of records to handle at once.
+        workers (int): clean with `clean_parallel` using this number of
+            processes, records are cleaned in this process when not given.
+        progress (callable): called with the `IngestReport` so far after
+            every chunk.
+
+    Returns:
+        IngestReport: counts of the run.
+    """
+    if kwargs is None:
+        kwargs = {}
+
+    if format == 'csv':
+        records = csv.DictReader(source)
+        writer = _CsvWriter(clean_output, records)
+    else:
+        records = read_records(source, format)
+        writer = _JsonLinesWriter(clean_output)
+
+    if workers:
+        from .parallel import clean_parallel
+        results = clean_parallel(swamper_class, records, args, kwargs, workers=workers, chunk_size=chunk_size)
+    else:
+        results = swamper_class.clean_many(records, *args, **kwargs)
+
+    report = IngestReport()
+    start = time.time()
+
+    for chunk in chunks(results, chunk_size):
+        clean = []
+        rejected = []
+        for row, result in enumerate(chunk, report.rows + 1):
+            if result.errors:
+                rejected.append(_dump({'row': row, 'data': result.raw_data, 'errors': result.errors}) + '\n')
+            else:
+                clean.append(result.cleaned_data)
+
+        writer.writerows(clean)
+        if reject_output is not None and rejected:
+            reject_output.write(''.join(rejected))
+
+        report.rows += len(chunk)
+        report.clean += len(clean)
+        report.rejected += len(rejected)
+        report.seconds = time.time() - start
+        if progress is not None:
+            progress(report)
+
+    report.seconds = time.time() - start
+    return report
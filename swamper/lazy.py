@@ -0,0 +1,59 @@
+import collections
+
+
+class LazyCleanedData(collections.MutableMapping):
+    """
+    Cleaned data that runs the clean method for a field the first time that
+    field is read. Iterating or taking the length cleans all fields.
+    """
+
+    def __init__(self, swamper, initial):
+        """
+        Args:
+            swamper (BaseSwamper): swamper to clean fields with.
+            initial (dict): values known before cleaning any field.
+        """
+        self._swamper = swamper
+        self._data = initial
+        self._pending = set(swamper.fields)
+
+    def resolve(self, data_fields):
+        """
+        Clean the given fields, unless they were cleaned before.
+
+        Args:
+            data_fields (iterable): names of data fields to clean.
+        """
+        pending = [data_field for data_field in data_fields if data_field in self._pending]
+        if pending:
+            self._pending.difference_update(pending)
+            pending = set(pending)
+            cleaners = self._swamper._plan.cleaners
+            self._swamper._clean_fields([cleaner for cleaner in cleaners if cleaner[0] in pending])
+
+    def __getitem__(self, data_field):
+        self.resolve((data_field,))
+        return self._data[data_field]
+
+    def __contains__(self, data_field):
+        self.resolve((data_field,))
+        return data_field in self._data
+
+    def __setitem__(self, data_field, value):
+        self._pending.discard(data_field)
+        self._data[data_field] = value
+
+    def __delitem__(self, data_field):
+        self.resolve((data_field,))
+        del self._data[data_field]
+
+    def __iter__(self):
+        self.resolve(list(self._pending))
+        return iter(self._data)
+
+    def __len__(self):
+        self.resolve(list(self._pending))
+        return len(self._data)
+
+    def __repr__(self):
+        return '<LazyCleanedData {!r} pending={!r}>'.format(self._data, sorted(self._pending))
@@ -0,0 +1,188 @@
+import collections
+import functools
+import math
+import threading
+import timeit
+
+
+def timed(collector, swamper_class, step, function):
+    """
+    Wrap a function to report the time it takes and whether it raised to
+    `collector`.
+
+    Args:
+        collector: object with an `observe(swamper_class, step, seconds,
+            failed)` method.
+        swamper_class (type): swamper class to report for.
+        step (str): name of the step to report for.
+        function (callable): function to time.
+
+    Returns:
+        function: the wrapped function.
+    """
+    timer = timeit.default_timer
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        start = timer()
+        try:
+            result = function(*args, **kwargs)
+        except Exception:
+            collector.observe(swamper_class, step, timer() - start, True)
+            raise
+        collector.observe(swamper_class, step, timer() - start, False)
+        return result
+    return wrapper
+
+
+class StepMetrics(object):
+    """
+    Calls, errors and timings of a single step of cleaning.
+
+    Attributes:
+        count (int): number of calls.
+        errors (int): number of calls that raised.
+        seconds (float): cumulative time spent.
+        samples (collections.deque): times of the most recent calls.
+    """
+
+    def __init__(self, sample_size):
+        self.count = 0
+        self.errors = 0
+        self.seconds = 0.0
+        self.samples = collections.deque(maxlen=sample_size)
+
+    def percentile(self, percent):
+        """
+        Get a percentile of the times of the most recent calls, by the
+        nearest rank method.
+
+        Args:
+            percent (float): percentile to get, between 0 and 100.
+
+        Returns:
+            float: time in seconds, 0.0 when there were no calls.
+        """
+        if not self.samples:
+            return 0.0
+        samples = sorted(self.samples)
+        index = int(math.ceil(percent / 100.0 * len(samples))) - 1
+        return samples[max(index, 0)]
+
+
+class MetricsCollector(object):
+    """
+    Collect call counts, timings and errors of `build_instances`,
+    `clean_instances`, every clean method, validators and `clean` in memory.
+
+    Attach a collector to a swamper class before building swampers:
+
+        CompanySwamper.collector = MetricsCollector()
+        ...
+        print(CompanySwamper.collector.report())
+
+    Steps are named after their methods, for example `clean_name`, and
+    reported per swamper class name.
+
+    Args:
+        sample_size (int): number of recent timings to keep per step for
+            percentiles.
+    """
+    percentiles = (50, 90, 99)
+
+    def __init__(self, sample_size=1000):
+        self.sample_size = sample_size
+        self._metrics = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def observe(self, swamper_class, step, seconds, failed):
+        """
+        Record a call of a step.
+
+        Args:
+            swamper_class (type): swamper class the step belongs to.
+            step (str): name of the step.
+            seconds (float): time the call took.
+            failed (bool): whether the call raised.
+        """
+        key = (swamper_class.__name__, step)
+        with self._lock:
+            metrics = self._metrics.get(key)
+            if metrics is None:
+                metrics = self._metrics[key] = StepMetrics(self.sample_size)
+            metrics.count += 1
+            metrics.seconds += seconds
+            metrics.samples.append(seconds)
+            if failed:
+                metrics.errors += 1
+
+    def metrics(self):
+        """
+        Returns:
+            dict: map of (swamper class name, step) to `StepMetrics`, in the
+                order steps were first seen.
+        """
+        with self._lock:
+            return collections.OrderedDict(self._metrics)
+
+    def reset(self):
+        """
+        Forget everything collected so far.
+        """
+        with self._lock:
+            self._metrics.clear()
+
+    def report(self):
+        """
+        Returns:
+            str: a table of all steps, with times in milliseconds.
+        """
+        header = ['swamper', 'step', 'calls', 'errors', 'total ms'] + ['p%d ms' % p for p in self.percentiles]
+        rows = []
+        for (swamper, step), metrics in self.metrics().items():
+            rows.append([swamper, step, str(metrics.count), str(metrics.errors), '%.3f' % (metrics.seconds * 1000)] + [
+                '%.3f' % (metrics.percentile(p) * 1000) for p in self.percentiles
+            ])
+
+        widths = [max([len(row[i]) for row in [header] + rows]) for i in range(len(header))]
+        lines = []
+        for row in [header] + rows:
+            lines.append('  '.join([
+                cell.ljust(width) if i < 2 else cell.rjust(width) for i, (cell, width) in enumerate(zip(row, widths))
+            ]).rstrip())
+        return '\n'.join(lines) + '\n'
+
+    def prometheus(self):
+        """
+        Returns:
+            str: all steps in the Prometheus text exposition format, as a
+                summary of seconds and a counter of errors.
+        """
+        metrics = self.metrics()
+        lines = [
+            '# HELP swamper_step_seconds Time spent in a step of cleaning.',
+            '# TYPE swamper_step_seconds summary',
+        ]
+        for (swamper, step), step_metrics in metrics.items():
+            labels = 'swamper="%s",step="%s"' % (_escape(swamper), _escape(step))
+            for p in self.percentiles:
+                lines.append('swamper_step_seconds{%s,quantile="%s"} %r' % (
+                    labels, p / 100.0, step_metrics.percentile(p)))
+            lines.append('swamper_step_seconds_sum{%s} %r' % (labels, step_metrics.seconds))
+            lines.append('swamper_step_seconds_count{%s} %d' % (labels, step_metrics.count))
+
+        lines.extend([
+            '# HELP swamper_step_errors_total Calls of a step of cleaning that raised.',
+            '# TYPE swamper_step_errors_total counter',
+        ])
+        for (swamper, step), step_metrics in metrics.items():
+            lines.append('swamper_step_errors_total{swamper="%s",step="%s"} %d' % (
+                _escape(swamper), _escape(step), step_metrics.errors))
+        return '\n'.join(lines) + '\n'
+
+
+def _escape(value):
+    """
+    Escape a Prometheus label value.
+    """
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
@@ -0,0 +1,156 @@
+import six
+
+
+class FieldStats(object):
+    """
+    Observed calls, failures and time spent for the clean method of a field.
+    """
+    __slots__ = ('calls', 'failures', 'seconds')
+
+    def __init__(self, calls=0, failures=0, seconds=0.0):
+        self.calls = calls
+        self.failures = failures
+        self.seconds = seconds
+
+    def rank(self):
+        """
+        Expected cost of cleaning this field per rejected record: mean time
+        per call divided by the failure rate. Cleaning fields in increasing
+        order of rank minimizes the expected time to find the first error.
+
+        Returns:
+            float: rank, infinite for fields that never failed.
+        """
+        if not self.failures:
+            return float('inf')
+        return (self.seconds / self.calls) / (float(self.failures) / self.calls)
+
+
+class CleaningProfile(object):
+    """
+    Per field statistics of cleaning records with a swamper class, used to
+    clean fields that are cheap and often fail first when `adaptive_ordering`
+    is set on the swamper class.
+
+    A profile that is recording orders fields by what it observed so far and
+    orders them again every `reorder_every` records. A frozen profile, from
+    `load`, no longer records and always gives the same order:
+
+        CompanySwamper.cleaning_profile = CleaningProfile.load(json.load(f))
+
+    Args:
+        reorder_every (int): number of records between orderings.
+        frozen (bool): stop recording and keep the current order.
+
+    Attributes:
+        stats (dict): map of data field to `FieldStats`.
+        records (int): number of records recorded.
+        generation (int): incremented every time fields are ordered again,
+            plans are ordered again when it changes.
+    """
+
+    def __init__(self, reorder_every=1000, frozen=False):
+        self.reorder_every = reorder_every
+        self.frozen = frozen
+        self.stats = {}
+        self.records = 0
+        self.generation = 0
+
+    def record(self, data_field, seconds, failed):
+        """
+        Record a call of the clean method for a field.
+        """
+        stats = self.stats.get(data_field)
+        if stats is None:
+            stats = self.stats[data_field] = FieldStats()
+        stats.calls += 1
+        stats.seconds += seconds
+        if failed:
+            stats.failures += 1
+
+    def record_done(self):
+        """
+        Count a cleaned record, every `reorder_every` records this starts a
+        new generation.
+        """
+        self.records += 1
+        if self.records % self.reorder_every == 0:
+            self.generation += 1
+
+    def rank(self, data_field):
+        stats = self.stats.get(data_field)
+        if stats is None:
+            return float('inf')
+        return stats.rank()
+
+    def order(self, cleaners, after):
+        """
+        Order cleaners by increasing rank, cleaners that never failed keep
+        their order after the others. A cleaner is never put before the
+        fields it must follow, these fields take over its rank so they are
+        moved forward along with it.
+
+        Args:
+            cleaners (tuple): (data field, clean method) pairs in plan order.
+            after (dict): map of data field to a set of data fields that must
+                be cleaned before it.
+
+        Returns:
+            tuple: the same cleaners in their new order.
+        """
+        ranks = dict([(data_field, self.rank(data_field)) for data_field, _ in cleaners])
+        changed = True
+        while changed:
+            changed = False
+            for data_field, required in six.iteritems(after):
+                for required_field in required:
+                    if ranks[data_field] < ranks[required_field]:
+                        ranks[required_field] = ranks[data_field]
+                        changed = True
+
+        remaining = list(enumerate(cleaners))
+        done = set()
+        ordered = []
+        while remaining:
+            ready = [cleaner for cleaner in remaining if after.get(cleaner[1][0], done) <= done]
+            if not ready:
+                # Circular constraints, keep the plan order for the rest.
+                ready = remaining[:1]
+
+            best = min(ready, key=lambda cleaner: (ranks[cleaner[1][0]], cleaner[0]))
+            remaining.remove(best)
+            done.add(best[1][0])
+            ordered.append(best[1])
+        return tuple(ordered)
+
+    def dump(self):
+        """
+        Returns:
+            dict: statistics that can be saved as JSON and loaded with `load`.
+        """
+        return {
+            'records': self.records,
+            'fields': dict([
+                (data_field, {'calls': stats.calls, 'failures': stats.failures, 'seconds': stats.seconds})
+                for data_field, stats in six.iteritems(self.stats)
+            ]),
+        }
+
+    @classmethod
+    def load(cls, data, frozen=True):
+        """
+        Build a profile from the output of `dump`.
+
+        Args:
+            data (dict): statistics from `dump`.
+            frozen (bool): stop recording, so fields are always cleaned in the
+                same order (default=True).
+
+        Returns:
+            CleaningProfile: profile with the saved statistics.
+        """
+        profile = cls(frozen=frozen)
+        profile.records = data.get('records', 0)
+        for data_field, stats in six.iteritems(data['fields']):
+            profile.stats[data_field] = FieldStats(**stats)
+        return profile
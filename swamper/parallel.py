@@ -0,0 +1,65 @@
+import collections
+import multiprocessing
+import pickle
+
+from concurrent.futures import ProcessPoolExecutor
+
+from .utils import chunks
+
+
+def _clean_chunk(swamper_class, args, kwargs, chunk):
+    """
+    Clean a chunk of records, this runs in a worker process.
+    """
+    return list(swamper_class.clean_many(chunk, *args, **kwargs))
+
+
+def clean_parallel(swamper_class, records, args=(), kwargs=None, workers=None, chunk_size=500):
+    """
+    Clean records in chunks spread over a pool of processes, which pays off
+    when clean methods are CPU-bound.
+
+    Everything that is sent to a worker is pickled, so `swamper_class` (and
+    `error_class` when given) must be importable from a module and the
+    records and their results must be picklable.
+
+    Args:
+        swamper_class (type): swamper to clean records with.
+        records (iterable): inputs to clean, consumed lazily.
+        args (tuple): arguments to build the swamper with, see
+            `BaseSwamper.clean_many`.
+        kwargs (dict): keyword arguments to build the swamper with.
+        workers (int): number of processes (default=number of CPUs).
+        chunk_size (int): number of records to send to a worker at once.
+
+    Yields:
+        CleanResult: the outcome for every record, in input order.
+
+    Raises:
+        TypeError: when the swamper or its arguments cannot be pickled.
+    """
+    if kwargs is None:
+        kwargs = {}
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+
+    try:
+        pickle.dumps((swamper_class, args, kwargs), pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, AttributeError, TypeError) as e:
+        raise TypeError("'swamper_class' and its arguments must be picklable: {}".format(e))
+
+    # Keep a few chunks per worker in flight, so workers don't have to wait
+    # for new work while records are never read ahead without bounds.
+    max_pending = 2 * workers
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = collections.deque()
+        for chunk in chunks(records, chunk_size):
+            pending.append(executor.submit(_clean_chunk, swamper_class, args, kwargs, chunk))
+            if len(pending) >= max_pending:
+                for result in pending.popleft().result():
+                    yield result
+
+        while pending:
+            for result in pending.popleft().result():
+                yield result
@@ -0,0 +1,265 @@
+import copy
+import inspect
+import itertools
+import linecache
+
+import six
+
+from .codegen import compile_clean_fields
+
+
+def _attribute_cleaner(name, method):
+    """
+    Wrap a clean method that isn't a plain function, such as a static method,
+    a class method or one assigned on a swamper itself, so it is called like
+    `getattr(swamper, name)(value, is_blank=is_blank)` with the same
+    signature as plain clean methods.
+
+    Args:
+        name (str): name of the clean method.
+        method: the clean method, to copy `depends_on` from.
+    """
+    def cleaner(swamper, value, is_blank):
+        return getattr(swamper, name)(value, is_blank=is_blank)
+
+    cleaner.__name__ = str(name)
+    cleaner.depends_on = getattr(method, 'depends_on', None)
+    return cleaner
+
+
+def _resolve_cleaner(klass, name):
+    """
+    Get the clean method `name` of `klass`, to call with the swamper as first
+    argument, or None when `klass` has no such method.
+    """
+    for base in inspect.getmro(klass):
+        if name in base.__dict__:
+            method = base.__dict__[name]
+            break
+    else:
+        return None
+
+    if inspect.isfunction(method):
+        return method
+    return _attribute_cleaner(name, getattr(klass, name))
+
+
+class CleaningPlan(object):
+    """
+    Everything `full_clean` needs to know about a swamper class and a list of
+    fields, resolved once instead of for every record.
+
+    Plans are shared between all instances of a swamper class that clean the
+    same fields, so treat the attributes of a plan as read-only.
+    """
+    __slots__ = ('fields', 'instance_fields', 'data_to_instance_fields', 'cleaners', 'cleaner_names',
+                 'clean_depends_on', 'validators', 'stages', 'compiled', 'reordered', 'collected')
+
+    def __init__(self, swamper, fields):
+        """
+        Compile a plan for cleaning `fields` with (the class of) `swamper`.
+
+        Args:
+            swamper (BaseSwamper): instance used to resolve field names, so
+                overrides of `get_data_field` and `get_instance_field` are
+                respected.
+            fields (tuple): instance or data field names to clean.
+        """
+        # Build reverse map of instance_to_data_fields, `get_instance_field`
+        # depends on it.
+        self.data_to_instance_fields = dict([(v, k) for k, v in six.iteritems(swamper.instance_to_data_fields)])
+        swamper.data_to_instance_fields = self.data_to_instance_fields
+
+        # Re-map instance fields -> data fields.
+        self.fields = [swamper.get_data_field(field) for field in fields]
+
+        # Build list of instance fields.
+        self.instance_fields = [swamper.get_instance_field(data_field) for data_field in self.fields]
+
+        # Resolve the clean method for every data field, None when absent.
+        klass = type(swamper)
+        self.cleaners = tuple([
+            (data_field, _resolve_cleaner(klass, 'clean_%s' % data_field))
+            for data_field in self.fields
+        ])
+
+        # Names of clean methods that a swamper can override by assigning
+        # them on itself, see `bound`.
+        self.cleaner_names = frozenset(['clean_%s' % data_field for data_field in self.fields])
+
+        # Data fields read by `clean`, None when it may read any field.
+        depends_on = getattr(klass.clean, 'depends_on', None)
+        if depends_on is not None:
+            depends_on = frozenset([swamper.get_data_field(field) for field in depends_on])
+        self.clean_depends_on = depends_on
+
+        self._schedule_validators(swamper)
+
+        # Generated function to clean fields with, see `compile`.
+        self.compiled = None
+
+        # Plan with cleaners in the order of a profile, see `ordered`.
+        self.reordered = None
+
+        # Plan with timed clean methods and validators, see `instrumented`.
+        self.collected = None
+
+    def __del__(self):
+        # Forget the source of the generated function, see `compile`.
+        compiled = getattr(self, 'compiled', None)
+        if compiled is not None:
+            linecache.cache.pop(compiled.__code__.co_filename, None)
+
+    def bound(self, swamper):
+        """
+        Get a copy of this plan that calls the clean methods assigned on
+        `swamper` itself instead of those of its class.
+
+        Args:
+            swamper (BaseSwamper): instance with clean methods of its own.
+
+        Returns:
+            CleaningPlan: the plan for `swamper` only.
+        """
+        cleaners = []
+        for data_field, cleaner in self.cleaners:
+            name = 'clean_%s' % data_field
+            if name in swamper.__dict__:
+                cleaner = _attribute_cleaner(name, swamper.__dict__[name])
+            cleaners.append((data_field, cleaner))
+
+        plan = copy.copy(self)
+        plan.cleaners = tuple(cleaners)
+        plan.cleaner_names = frozenset()
+        plan.compiled = None
+        plan.reordered = None
+        plan.collected = None
+        plan._schedule_validators(swamper)
+        return plan
+
+    def compile(self, swamper_class):
+        """
+        Generate a function that cleans fields and runs validators for this
+        plan, the first time this is called.
+
+        Args:
+            swamper_class (type): swamper class this plan was compiled for.
+
+        Returns:
+            function: takes the swamper to clean fields for.
+        """
+        if self.compiled is None:
+            self.compiled = compile_clean_fields(swamper_class, self)
+        return self.compiled
+
+    def ordered(self, swamper, profile):
+        """
+        Get a copy of this plan with cleaners in the order of `profile`, which
+        is only ordered again when the profile starts a new generation.
+
+        A clean method that reads other fields from `cleaned_data` must
+        declare them with `depends_on`, it is never run before these fields.
+
+        Args:
+            swamper (BaseSwamper): instance used to resolve field names.
+            profile (CleaningProfile): statistics to order cleaners by.
+
+        Returns:
+            CleaningPlan: the ordered plan.
+        """
+        reordered = self.reordered
+        if reordered is not None and reordered[0] is profile and reordered[1] == profile.generation:
+            return reordered[2]
+
+        after = {}
+        for data_field, cleaner in self.cleaners:
+            depends_on = getattr(cleaner, 'depends_on', None)
+            if depends_on is not None:
+                after[data_field] = set([swamper.get_data_field(field) for field in depends_on]) & set(self.fields)
+
+        plan = copy.copy(self)
+        plan.cleaners = profile.order(self.cleaners, after)
+        plan.compiled = None
+        plan.reordered = None
+        plan._schedule_validators(swamper)
+
+        self.reordered = (profile, profile.generation, plan)
+        return plan
+
+    def instrumented(self, swamper_class, collector):
+        """
+        Get a copy of this plan where clean methods and validators report
+        their timings to `collector`, see `BaseSwamper._timed`.
+
+        Args:
+            swamper_class (type): swamper class this plan was compiled for.
+            collector: collector to report to.
+
+        Returns:
+            CleaningPlan: the instrumented plan.
+        """
+        collected = self.collected
+        if collected is not None and collected[0] is collector:
+            return collected[1]
+
+        cleaners = dict([
+            (data_field, cleaner and swamper_class._timed(collector, 'clean_%s' % data_field, cleaner))
+            for data_field, cleaner in self.cleaners
+        ])
+        validators = dict([
+            (validator, swamper_class._timed(collector, validator.__name__, validator))
+            for validator, _ in self.validators
+        ])
+
+        def wrap(stage_cleaners, stage_validators):
+            return (
+                tuple([(data_field, cleaners[data_field]) for data_field, _ in stage_cleaners]),
+                tuple([(validators[validator], data_fields) for validator, data_fields in stage_validators]),
+            )
+
+        plan = copy.copy(self)
+        plan.cleaners, plan.validators = wrap(self.cleaners, self.validators)
+        plan.stages = tuple([wrap(*stage) for stage in self.stages])
+        plan.compiled = None
+        plan.reordered = None
+        plan.collected = None
+
+        self.collected = (collector, plan)
+        return plan
+
+    def _schedule_validators(self, swamper):
+        """
+        Find the methods decorated with `validates` and schedule each of them
+        right after the last field it depends on is cleaned. Validators that
+        depend on fields that are not cleaned are left out.
+
+        Sets `validators`, a tuple of (method, data fields) in the order they
+        run, and `stages`, a tuple of (cleaners, validators) to run in turn.
+        """
+        positions = dict([(data_field, i) for i, (data_field, _) in enumerate(self.cleaners)])
+
+        scheduled = []
+        klass = type(swamper)
+        for name in sorted(dir(klass)):
+            method = getattr(klass, name, None)
+            fields = getattr(method, 'validates', None)
+            if fields is None:
+                continue
+
+            data_fields = frozenset([swamper.get_data_field(field) for field in fields])
+            if data_fields.issubset(positions):
+                position = max([positions[data_field] for data_field in data_fields])
+                scheduled.append((position, name, method, data_fields))
+        scheduled.sort(key=lambda validator: validator[:2])
+
+        self.validators = tuple([validator[2:] for validator in scheduled])
+
+        stages = []
+        start = 0
+        for position, validators in itertools.groupby(scheduled, key=lambda validator: validator[0]):
+            validators = tuple([validator[2:] for validator in validators])
+            stages.append((self.cleaners[start:position + 1], validators))
+            start = position + 1
+        if start < len(self.cleaners) or not stages:
+            stages.append((self.cleaners[start:], ()))
+        self.stages = tuple(stages)
@@ -0,0 +1,77 @@
+import contextlib
+import threading
+
+
+class SwamperPool(object):
+    """
+    Keep swampers around per thread to clean new input with, instead of
+    building a new swamper for every request, see `BaseSwamper.reset`:
+
+        pool = SwamperPool(CompanySwamper, args=(['name'],))
+
+        def handle(request):
+            with pool.swamper(request.data) as swamper:
+                if swamper.is_clean():
+                    ...
+
+    Swampers are never shared between threads, so a pool can be used by all
+    threads of a web worker.
+    """
+
+    def __init__(self, swamper_class, args=(), kwargs=None, size=4):
+        """
+        Args:
+            swamper_class (type): swamper to build.
+            args (tuple): arguments to build the swamper with, the input is
+                passed as keyword argument `data`.
+            kwargs (dict): keyword arguments to build the swamper with.
+            size (int): maximum number of idle swampers to keep per thread.
+        """
+        self.swamper_class = swamper_class
+        self.args = args
+        self.kwargs = kwargs or {}
+        self.size = size
+        self._local = threading.local()
+
+    def _idle(self):
+        """
+        Returns:
+            list: idle swampers of the current thread.
+        """
+        idle = getattr(self._local, 'idle', None)
+        if idle is None:
+            idle = self._local.idle = []
+        return idle
+
+    def acquire(self, data):
+        """
+        Get an idle swamper reset to `data`, or build a new one.
+
+        Args:
+            data (dict): input to clean.
+
+        Returns:
+            BaseSwamper: swamper for `data`, give it back with `release`.
+        """
+        idle = self._idle()
+        return self.swamper_class._reuse(idle.pop() if idle else None, data, self.args, self.kwargs)
+
+    def release(self, swamper):
+        """
+        Give a swamper back to the pool, it is dropped when the pool of the
+        current thread is full. Don't use the swamper after releasing it.
+        """
+        idle = self._idle()
+        if len(idle) < self.size:
+            idle.append(swamper)
+
+    @contextlib.contextmanager
+    def swamper(self, data):
+        """
+        Acquire a swamper for `data` and release it afterwards.
+        """
+        swamper = self.acquire(data)
+        try:
+            yield swamper
+        finally:
+            self.release(swamper)
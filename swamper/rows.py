@@ -0,0 +1,122 @@
+"""
+Clean positional rows, such as those from csv readers and database cursors,
+without turning every row into a dict.
+"""
+import collections
+
+from .base import CleanResult
+
+
+class RowSchema(object):
+    """
+    Positions of named columns in rows, resolved once for all rows.
+    """
+
+    def __init__(self, columns):
+        """
+        Args:
+            columns (iterable): column names in row order, None for columns
+                to leave out.
+        """
+        self.columns = tuple(columns)
+        self.index = dict([(column, i) for i, column in enumerate(self.columns) if column is not None])
+
+    @classmethod
+    def from_cursor(cls, cursor):
+        """
+        Build a schema for the rows of a DB-API cursor.
+
+        Args:
+            cursor: cursor that executed a query.
+
+        Returns:
+            RowSchema: schema with the column names of the query.
+        """
+        return cls([description[0] for description in cursor.description])
+
+    def view(self, row):
+        """
+        Returns:
+            RowView: a view of `row` by column name.
+        """
+        return RowView(self.index, row)
+
+
+class RowView(collections.Mapping):
+    """
+    Read-only mapping of column name to value for a positional row.
+
+    A column that is not in the schema or that is beyond the end of the row
+    is missing, so `test_is_blank` does not mark it as blank. A value of None
+    or '' in a column is present but blank.
+    """
+    __slots__ = ('_index', '_row')
+
+    def __init__(self, index, row):
+        """
+        Args:
+            index (dict): map of column name to position, see `RowSchema`.
+            row (sequence): row to read values from.
+        """
+        self._index = index
+        self._row = row
+
+    def __getitem__(self, column):
+        position = self._index[column]
+        row = self._row
+        if position >= len(row):
+            raise KeyError(column)
+        return row[position]
+
+    def get(self, column, default=None):
+        position = self._index.get(column)
+        row = self._row
+        if position is None or position >= len(row):
+            return default
+        return row[position]
+
+    def __contains__(self, column):
+        position = self._index.get(column)
+        return position is not None and position < len(self._row)
+
+    def __iter__(self):
+        size = len(self._row)
+        return iter([column for column, position in self._index.items() if position < size])
+
+    def __len__(self):
+        size = len(self._row)
+        return len([position for position in self._index.values() if position < size])
+
+    def __repr__(self):
+        return '<RowView {!r}>'.format(dict(self))
+
+
+def clean_rows(swamper_class, rows, columns, args=(), kwargs=None):
+    """
+    Clean positional rows with a single swamper, like `clean_many` does for
+    dicts. Every row is read through a `RowView` of the same schema, so no
+    dict is built per row.
+
+    Args:
+        swamper_class (type): swamper to clean rows with.
+        rows (iterable): sequences of values, consumed lazily, in chunks of
+            `prefetch_chunk_size` rows when instances are prefetched.
+        columns (RowSchema|iterable): schema of the rows, or the column names
+            in row order.
+        args (tuple): arguments to build the swamper with, see
+            `BaseSwamper.clean_many`.
+        kwargs (dict): keyword arguments to build the swamper with.
+
+    Yields:
+        CleanResult: the outcome for every row, in input order, with the row
+            itself as `raw_data`.
+    """
+    if not isinstance(columns, RowSchema):
+        columns = RowSchema(columns)
+    if kwargs is None:
+        kwargs = {}
+
+    views = (columns.view(row) for row in rows)
+    for swamper in swamper_class._swampers(views, args, kwargs):
+        swamper.full_clean()
+        yield CleanResult(swamper.raw_data._row, swamper.cleaned_data, swamper._errors, swamper.instances)
@@ -0,0 +1,68 @@
+import inspect
+
+
+def _attribute_kind(klass, name):
+    """
+    Tell how attribute `name` is stored on instances of `klass`.
+
+    Returns:
+        str: 'slot' for a `__slots__` member, 'descriptor' for other data
+            descriptors such as properties, 'dict' otherwise.
+    """
+    attribute = None
+    for base in inspect.getmro(klass):
+        if name in vars(base):
+            attribute = vars(base)[name]
+            break
+
+    if inspect.ismemberdescriptor(attribute):
+        return 'slot'
+    if hasattr(type(attribute), '__set__'):
+        return 'descriptor'
+    return 'dict'
+
+
+def compile_setter(klass, field_map):
+    """
+    Build a function that assigns cleaned data to an instance of `klass`,
+    picking the fastest way that is safe for the class:
+
+     * plain classes get their `__dict__` updated at once;
+     * classes with `__slots__` get their slot descriptors set directly;
+     * others, with properties or a custom `__setattr__`, use `setattr`.
+
+    Args:
+        klass (type): class of instances to assign values to.
+        field_map (list): (data field, instance field) pairs to assign.
+
+    Returns:
+        function: takes an instance and cleaned data, assigns values for the
+            data fields that are in cleaned data.
+    """
+    field_map = tuple(field_map)
+    custom_setattr = getattr(klass, '__setattr__', None) is not object.__setattr__
+    has_dict = any('__dict__' in vars(base) for base in inspect.getmro(klass))
+    kinds = set([_attribute_kind(klass, instance_field) for _, instance_field in field_map])
+
+    if not custom_setattr and has_dict and kinds <= set(['dict']):
+        def assign(instance, cleaned_data):
+            instance.__dict__.update([
+                (instance_field, cleaned_data[data_field])
+                for data_field, instance_field in field_map if data_field in cleaned_data
+            ])
+    elif not custom_setattr and kinds == set(['slot']):
+        slots = tuple([
+            (data_field, getattr(klass, instance_field).__set__) for data_field, instance_field in field_map
+        ])
+
+        def assign(instance, cleaned_data):
+            for data_field, set_slot in slots:
+                if data_field in cleaned_data:
+                    set_slot(instance, cleaned_data[data_field])
+    else:
+        def assign(instance, cleaned_data):
+            for data_field, instance_field in field_map:
+                if data_field in cleaned_data:
+                    setattr(instance, instance_field, cleaned_data[data_field])
+
+    return assign
@@ -0,0 +1,103 @@
+"""
+Write cleaned records to a database table in chunks, see `write_sqlite`.
+"""
+import collections
+import sqlite3
+
+import six
+
+from .base import NON_FIELD_ERRORS, ErrorDict
+from .utils import chunks
+
+
+class RowFailure(collections.namedtuple('RowFailure', ['position', 'raw_data', 'errors'])):
+    """
+    A record that was not written, with the errors of cleaning it or the
+    error of the database under `NON_FIELD_ERRORS`.
+    """
+    __slots__ = ()
+
+
+class SinkReport(object):
+    """
+    Outcome of writing records.
+
+    Attributes:
+        written (int): number of rows written.
+        failures (list): a `RowFailure` for every record that was not
+            written, in input order.
+    """
+
+    def __init__(self):
+        self.written = 0
+        self.failures = []
+
+
+def _quote(name):
+    return '"%s"' % name.replace('"', '""')
+
+
+def write_sqlite(swamper_class, results, connection, table, fields, chunk_size=500):
+    """
+    Insert the cleaned data of the results of `clean_many` into a table, a
+    column per instance field. Values are looked up in cleaned data by the
+    data field of every instance field, as `get_data_field` of
+    `swamper_class` maps it, missing values are NULL.
+
+    Clean records are inserted with `executemany` and committed per chunk of
+    `chunk_size` records. When a chunk fails, it is rolled back and its rows
+    are inserted one by one, so only the rows the database refuses fail. This
+    relies on the transactions sqlite3 begins by itself, so `connection`
+    must not be in autocommit mode (`isolation_level=None`).
+
+    Args:
+        swamper_class (type): swamper the records were cleaned with.
+        results (iterable): results of `clean_many`, consumed lazily.
+        connection (sqlite3.Connection): database to write to.
+        table (str): name of the table to insert into.
+        fields (list): instance fields to insert, these are the column names.
+        chunk_size (int): number of records per transaction.
+
+    Returns:
+        SinkReport: the number of rows written and failures of records with
+            errors and of rows the database refused.
+    """
+    mapper = swamper_class._field_mapper()
+    data_fields = [mapper.get_data_field(field) for field in fields]
+    sql = 'INSERT INTO %s (%s) VALUES (%s)' % (
+        _quote(table), ', '.join([_quote(field) for field in fields]), ', '.join(['?'] * len(fields)))
+
+    report = SinkReport()
+    position = 0
+    for chunk in chunks(results, chunk_size):
+        rows = []
+        for result in chunk:
+            if result.errors:
+                report.failures.append(RowFailure(position, result.raw_data, result.errors))
+            else:
+                get = result.cleaned_data.get
+                rows.append((position, result.raw_data, tuple([get(data_field) for data_field in data_fields])))
+            position += 1
+
+        try:
+            connection.executemany(sql, [values for _, _, values in rows])
+        except sqlite3.Error:
+            connection.rollback()
+        else:
+            connection.commit()
+            report.written += len(rows)
+            continue
+
+        for row_position, raw_data, values in rows:
+            try:
+                connection.execute(sql, values)
+            except sqlite3.Error as e:
+                report.failures.append(RowFailure(row_position, raw_data, ErrorDict({
+                    NON_FIELD_ERRORS: [six.text_type(e)],
+                })))
+            else:
+                report.written += 1
+        connection.commit()
+
+    report.failures.sort(key=lambda failure: failure.position)
+    return report
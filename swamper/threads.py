@@ -0,0 +1,77 @@
+"""
+A thread pool shared by all swampers that clean fields in threads, see
+`BaseSwamper.cleaner_threads`.
+"""
+import threading
+import weakref
+
+from concurrent.futures import ThreadPoolExecutor
+
+# Maximum number of threads of the shared pool, the limit per swamper class
+# is `cleaner_threads`.
+MAX_WORKERS = 32
+
+_executor = None
+_semaphores = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def get_executor():
+    """
+    Get the shared thread pool, which is started the first time it is
+    needed.
+
+    Returns:
+        ThreadPoolExecutor: the shared thread pool.
+    """
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+        return _executor
+
+
+def set_executor(executor):
+    """
+    Use another thread pool for all swampers, for example one that is shut
+    down with the application.
+
+    Args:
+        executor (ThreadPoolExecutor): pool to use, None to start a new
+            shared pool when it is needed.
+    """
+    global _executor
+    with _lock:
+        _executor = executor
+
+
+def _semaphore_for(swamper_class):
+    """
+    Get the semaphore that limits the number of clean methods of
+    `swamper_class` running at once to its `cleaner_threads`.
+    """
+    limit = swamper_class.cleaner_threads
+    with _lock:
+        entry = _semaphores.get(swamper_class)
+        if entry is None or entry[0] != limit:
+            entry = _semaphores[swamper_class] = (limit, threading.BoundedSemaphore(limit))
+        return entry[1]
+
+
+def submit(swamper_class, function, *args):
+    """
+    Run `function` in the shared pool, waiting first while `swamper_class`
+    already has `cleaner_threads` functions running.
+
+    Returns:
+        concurrent.futures.Future: outcome of the function.
+    """
+    semaphore = _semaphore_for(swamper_class)
+    semaphore.acquire()
+    try:
+        future = get_executor().submit(function, *args)
+    except Exception:
+        semaphore.release()
+        raise
+    future.add_done_callback(lambda future: semaphore.release())
+    return future
@@ -0,0 +1,22 @@
+import itertools
+
+
+def chunks(iterable, chunk_size):
+    """
+    Split an iterable into lists of at most `chunk_size` items, consuming it
+    lazily.
+
+    Raises:
+        ValueError: when `chunk_size` is less than 1.
+    """
+    if chunk_size < 1:
+        raise ValueError("'chunk_size' must be at least 1, got {!r}".format(chunk_size))
+    return _chunks(iter(iterable), chunk_size)
+
+
+def _chunks(iterator, chunk_size):
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
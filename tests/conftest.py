@@ -0,0 +1,22 @@
+import sys
+
+import pytest
+
+from swamper.base import BaseSwamper
+
+
+collect_ignore = []
+if sys.version_info < (3, 5):
+    # Coroutines need `async def`, which is a syntax error before 3.5.
+    collect_ignore.append('test_aio.py')
+
+
+@pytest.fixture(autouse=True, params=[False, True], ids=['interpreted', 'compiled'])
+def compile_cleaning(request):
+    """
+    Run every test with fields cleaned by looping over them and by a
+    generated function, which must give the same results.
+    """
+    BaseSwamper.compile_cleaning = request.param
+    yield request.param
+    BaseSwamper.compile_cleaning = False
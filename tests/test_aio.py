@@ -0,0 +1,468 @@
+import asyncio
+
+from pytest import raises
+
+from swamper.aio import AsyncSwamper
+from swamper.dependencies import validates
+from swamper.metrics import MetricsCollector
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def test_afull_clean_coroutine_and_plain_cleaners():
+    """
+    Test coroutine and plain clean methods can be mixed and their output ends
+    up in cleaned data.
+    """
+    class Swamper(AsyncSwamper):
+        async def clean_name(self, value, is_blank):
+            await asyncio.sleep(0)
+            return value.upper()
+
+        def clean_city(self, value, is_blank):
+            return value.lower()
+
+    swamper = Swamper(['name', 'city', 'age'], {'name': 'swamper', 'city': 'Groningen', 'age': 4})
+    assert run(swamper.ais_clean()) is True
+    assert swamper.cleaned_data == {'name': 'SWAMPER', 'city': 'groningen', 'age': 4}
+    assert swamper.errors == {}
+
+
+def test_afull_clean_runs_cleaners_concurrently():
+    """
+    Test all clean methods for fields start before any of them finishes and
+    `clean` runs after all of them.
+    """
+    events = []
+
+    class Swamper(AsyncSwamper):
+        async def clean_name(self, value, is_blank):
+            events.append('start name')
+            await asyncio.sleep(0.01)
+            events.append('end name')
+            return value
+
+        async def clean_city(self, value, is_blank):
+            events.append('start city')
+            await asyncio.sleep(0)
+            events.append('end city')
+            return value
+
+        async def clean(self):
+            events.append('clean')
+            return self.cleaned_data
+
+    swamper = Swamper(['name', 'city'], {'name': 'swamper', 'city': 'Groningen'})
+    assert run(swamper.ais_clean()) is True
+    assert events == ['start name', 'start city', 'end city', 'end name', 'clean']
+
+
+def test_afull_clean_errors():
+    """
+    Test errors raised by clean methods are added in field order and remove
+    the field from cleaned data, like they do when cleaning synchronously.
+    """
+    class Swamper(AsyncSwamper):
+        async def clean_name(self, value, is_blank):
+            await asyncio.sleep(0.01)
+            raise self.error_class('Name is invalid')
+
+        async def clean_city(self, value, is_blank):
+            raise self.error_class('City is invalid')
+
+        async def clean(self):
+            self.add_error('city', 'City is still invalid')
+            raise self.error_class('Swamper is invalid')
+
+    swamper = Swamper(['name', 'city'], {'name': 'swamper', 'city': 'Groningen'})
+    assert run(swamper.ais_clean()) is False
+    assert list(swamper.errors) == ['name', 'city', None]
+    assert swamper.errors == {
+        'name': ['Name is invalid'],
+        'city': ['City is invalid', 'City is still invalid'],
+        None: ['Swamper is invalid'],
+    }
+    assert swamper.cleaned_data == {}
+
+
+def test_afull_clean_instance_errors():
+    """
+    Test fields are not cleaned when cleaning instances fails.
+    """
+    class Swamper(AsyncSwamper):
+        def clean_instances(self):
+            raise ValueError('No instance')
+
+        async def clean_name(self, value, is_blank):
+            raise AssertionError('Should not be called')
+
+    swamper = Swamper(['name'], {'name': 'swamper'})
+    assert run(swamper.ais_clean()) is False
+    assert swamper.errors == {None: ['No instance']}
+
+
+def test_afull_clean_plain_clean():
+    """
+    Test a plain `clean` method and one that returns nothing.
+    """
+    class Swamper(AsyncSwamper):
+        def clean(self):
+            return {'name': 'rotinaj'}
+
+    swamper = Swamper(['name'], {'name': 'swamper'})
+    run(swamper.afull_clean())
+    assert swamper.cleaned_data == {'name': 'rotinaj'}
+
+    class Swamper(AsyncSwamper):
+        def clean(self):
+            pass
+
+    swamper = Swamper(['name'], {'name': 'swamper'})
+    run(swamper.afull_clean())
+    assert swamper.cleaned_data == {'name': 'swamper'}
+
+
+def test_afull_clean_unexpected_error():
+    """
+    Test errors that are not of `error_class` are raised.
+    """
+    class Swamper(AsyncSwamper):
+        async def clean_name(self, value, is_blank):
+            raise KeyError('name')
+
+    swamper = Swamper(['name'], {'name': 'swamper'})
+    with raises(KeyError):
+        run(swamper.afull_clean())
+
+
+def test_full_clean_not_allowed():
+    """
+    Test an async swamper cannot be cleaned synchronously.
+    """
+    swamper = AsyncSwamper(['name'], {'name': 'swamper'})
+    with raises(TypeError):
+        swamper.is_clean()
+    assert run(swamper.ais_clean()) is True
+    assert swamper.is_clean() is True
+
+
+def test_lazy_and_partial_clean_not_allowed():
+    """
+    Test an async swamper cannot clean only some fields, which would leave
+    coroutines of clean methods that are never awaited.
+    """
+    swamper = AsyncSwamper(['name'], {'name': 'swamper'})
+    with raises(TypeError):
+        swamper.lazy_clean()
+    with raises(TypeError):
+        swamper.partial_clean(['name'])
+    assert swamper._errors is None
+
+
+def test_update_not_allowed():
+    """
+    Test an async swamper cannot be updated, its input is left as it is.
+    """
+    swamper = AsyncSwamper(['name'], {'name': 'swamper'})
+    with raises(TypeError):
+        swamper.update({'name': 'rotinaj'})
+    assert swamper.raw_data == {'name': 'swamper'}
+
+
+def test_afull_clean_validators():
+    """
+    Test validators run concurrently after all fields, and are skipped when
+    any of their fields has errors.
+    """
+    events = []
+
+    class Swamper(AsyncSwamper):
+        def clean_city(self, value, is_blank):
+            raise self.error_class('City is invalid')
+
+        @validates('name')
+        async def validate_name(self):
+            events.append('start name')
+            await asyncio.sleep(0.01)
+            events.append('end name')
+            raise self.error_class('Name is taken')
+
+        @validates('name', 'age')
+        async def validate_age(self):
+            events.append('start age')
+            await asyncio.sleep(0)
+            events.append('end age')
+
+        @validates('age')
+        def validate_adult(self):
+            events.append('adult')
+            raise self.error_class('Too young')
+
+        @validates('city')
+        def validate_city(self):
+            raise AssertionError('Should not be called')
+
+    swamper = Swamper(['name', 'age', 'city'], {'name': 'swamper', 'age': 4, 'city': 'Atlantis'})
+    assert run(swamper.ais_clean()) is False
+    assert events == ['start name', 'adult', 'start age', 'end age', 'end name']
+    assert swamper.errors == {'city': ['City is invalid'], None: ['Name is taken', 'Too young']}
+
+
+class Source(object):
+    """
+    Asynchronous iterable of records, which keeps track of how many records
+    were taken.
+    """
+
+    def __init__(self, records):
+        self.records = iter(records)
+        self.taken = 0
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        await asyncio.sleep(0)
+        try:
+            record = next(self.records)
+        except StopIteration:
+            raise StopAsyncIteration
+        self.taken += 1
+        return record
+
+
+class DelaySwamper(AsyncSwamper):
+    async def clean_delay(self, value, is_blank):
+        await asyncio.sleep(value)
+        if value > 0.02:
+            raise self.error_class('Too slow')
+        return value
+
+
+async def collect(stream, source=None, concurrency=None):
+    results = []
+    async for result in stream:
+        if source is not None:
+            assert source.taken <= len(results) + concurrency
+        results.append(result)
+    return results
+
+
+def test_aclean_stream_ordered():
+    """
+    Test results come in input order, while only `concurrency` records are
+    taken from the source ahead of the consumer.
+    """
+    delays = [0.03, 0.0, 0.01, 0.0, 0.02]
+    source = Source([{'delay': delay} for delay in delays])
+    stream = DelaySwamper.aclean_stream(source, ['delay'], concurrency=2)
+    results = run(collect(stream, source, 2))
+
+    assert [result.raw_data['delay'] for result in results] == delays
+    assert [result.is_clean() for result in results] == [False, True, True, True, True]
+    assert results[0].errors == {'delay': ['Too slow']}
+
+
+def test_aclean_stream_unordered():
+    """
+    Test results come as soon as they are done without `ordered`.
+    """
+    delays = [0.03, 0.0, 0.01]
+    stream = DelaySwamper.aclean_stream([{'delay': delay} for delay in delays], ['delay'], concurrency=3,
+                                        ordered=False)
+    results = run(collect(stream))
+
+    assert [result.raw_data['delay'] for result in results] == [0.0, 0.01, 0.03]
+
+
+def test_aclean_stream_aclose():
+    """
+    Test closing a stream cancels the records in flight.
+    """
+    async def take_one():
+        stream = DelaySwamper.aclean_stream([{'delay': 0.0}, {'delay': 0.01}, {'delay': 0.01}], ['delay'],
+                                            concurrency=2)
+        result = await stream.__anext__()
+        pending = list(stream._pending)
+        await stream.aclose()
+        with raises(StopAsyncIteration):
+            await stream.__anext__()
+        return result, pending
+
+    result, pending = run(take_one())
+    assert result.cleaned_data == {'delay': 0.0}
+    assert len(pending) == 1
+    assert all(task.cancelled() for task in pending)
+
+
+def test_aclean_stream_error():
+    """
+    Test an unexpected error cleaning a record cancels the records in flight
+    before it is raised.
+    """
+    async def take_one():
+        stream = DelaySwamper.aclean_stream([{'delay': 'invalid'}, {'delay': 0.01}, {'delay': 0.01}], ['delay'],
+                                            concurrency=3)
+        await stream._fill()
+        pending = list(stream._pending)[1:]
+        with raises(TypeError):
+            await stream.__anext__()
+        with raises(StopAsyncIteration):
+            await stream.__anext__()
+        return pending
+
+    pending = run(take_one())
+    assert len(pending) == 2
+    assert all(task.cancelled() for task in pending)
+
+
+def test_aclean_stream_concurrency_fail():
+    """
+    Test at least one record must be in flight, instead of silently cleaning
+    no records at all.
+    """
+    for concurrency in (0, -1):
+        with raises(ValueError):
+            DelaySwamper.aclean_stream([{'delay': 0.0}], ['delay'], concurrency=concurrency)
+
+
+def test_aclean_stream_prefetch_instances():
+    """
+    Test instances are prefetched per batch of records in flight, also with
+    a coroutine, and swampers of records that are done are re-used.
+    """
+    class Company(object):
+        def __init__(self, id):
+            self.id = id
+
+    class Swamper(DelaySwamper):
+        batches = []
+
+        @classmethod
+        async def prefetch_instances(cls, records):
+            await asyncio.sleep(0)
+            cls.batches.append(len(records))
+            return [{Company: Company(record['id'])} for record in records]
+
+    records = [{'id': i, 'delay': 0.0} for i in range(10)]
+    results = run(collect(Swamper.aclean_stream(records, ['delay'], concurrency=4)))
+
+    assert [result.instances[Company].id for result in results] == list(range(10))
+    assert sum(Swamper.batches) == 10
+    assert len(Swamper.batches) < 10
+    assert min(Swamper.batches[:-1]) >= 2
+
+
+def test_aclean_stream_prefetch_length():
+    """
+    Test prefetched instances must match the records one to one.
+    """
+    class Swamper(DelaySwamper):
+        @classmethod
+        def prefetch_instances(cls, records):
+            return []
+
+    with raises(ValueError):
+        run(collect(Swamper.aclean_stream([{'delay': 0.0}], ['delay'])))
+
+
+def test_afull_clean_collector():
+    """
+    Test coroutines are timed until they are done and their errors are
+    reported, while plain methods are timed as usual.
+    """
+    class Swamper(AsyncSwamper):
+        async def clean_name(self, value, is_blank):
+            await asyncio.sleep(0.05)
+            raise self.error_class('Unknown name')
+
+        def clean_city(self, value, is_blank):
+            raise self.error_class('Unknown city')
+
+        @validates('age')
+        async def validate_age(self):
+            await asyncio.sleep(0)
+
+        async def clean(self):
+            await asyncio.sleep(0.05)
+
+    Swamper.collector = MetricsCollector()
+    swamper = Swamper(['name', 'city', 'age'], {'name': 'swamper', 'city': 'Groningen', 'age': 4})
+    assert run(swamper.ais_clean()) is False
+
+    metrics = dict([(step, m) for (_, step), m in Swamper.collector.metrics().items()])
+    assert dict([(step, (m.count, m.errors)) for step, m in metrics.items()]) == {
+        'build_instances': (1, 0),
+        'clean_instances': (1, 0),
+        'clean_name': (1, 1),
+        'clean_city': (1, 1),
+        'validate_age': (1, 0),
+        'clean': (1, 0),
+    }
+    assert metrics['clean_name'].seconds >= 0.04
+    assert metrics['clean'].seconds >= 0.04
+
+
+def test_afull_clean_error_budget():
+    """
+    Test cleaning stops when the number of fields with errors reaches the
+    budget, also for errors added by concurrent validators, and the budget is
+    reset afterwards.
+    """
+    class Swamper(AsyncSwamper):
+        max_errors = 1
+
+        async def clean_a(self, value, is_blank):
+            if is_blank:
+                raise self.error_class('a is required')
+            return value
+
+        async def clean_b(self, value, is_blank):
+            if is_blank:
+                raise self.error_class('b is required')
+            return value
+
+        @validates('a')
+        async def validate_a(self):
+            await asyncio.sleep(0)
+            self.add_error('a', 'a is invalid')
+
+        async def clean(self):
+            raise AssertionError('Not run after the budget is used up')
+
+    swamper = Swamper(['a', 'b'], {'a': '', 'b': ''})
+    assert run(swamper.ais_clean()) is False
+    assert swamper.errors == {'a': ['a is required']}
+    assert swamper.errors.short_circuited is True
+    assert swamper._error_budget is None
+
+    swamper = Swamper(['a', 'b'], {'a': 'swamper', 'b': 'rotinaj'})
+    assert run(swamper.ais_clean()) is False
+    assert swamper.errors == {'a': ['a is invalid']}
+    assert swamper.errors.short_circuited is True
+
+
+def test_afull_clean_error_budget_in_clean_method():
+    """
+    Test errors added by a clean method itself stop cleaning too.
+    """
+    class Swamper(AsyncSwamper):
+        max_errors = 1
+
+        async def clean_a(self, value, is_blank):
+            self.add_error('a', 'a is invalid')
+            return value
+
+        def clean_b(self, value, is_blank):
+            raise self.error_class('b is invalid')
+
+    swamper = Swamper(['a', 'b'], {'a': 'swamper', 'b': 'rotinaj'})
+    assert run(swamper.ais_clean()) is False
+    assert swamper.errors == {'a': ['a is invalid']}
+    assert swamper.errors.short_circuited is True
@@ -0,0 +1,95 @@
+import array
+
+from pytest import importorskip, raises
+
+from swamper.base import BaseSwamper
+from swamper.buffers import ColumnBuffers, clean_to_columns
+
+
+class CompanySwamper(BaseSwamper):
+    instance_to_data_fields = {'github': 'github_address'}
+
+    def clean_name(self, value, is_blank):
+        if is_blank:
+            raise self.error_class('Name is required')
+        return value.upper()
+
+    def clean_age(self, value, is_blank):
+        return int(value)
+
+
+RECORDS = [
+    {'name': 'swamper', 'github_address': 'wearespindle', 'age': '4'},
+    {'name': '', 'github_address': 'nobody', 'age': '1'},
+    {'name': 'rotinaj', 'age': '2'},
+]
+
+
+def test_clean_to_columns():
+    """
+    Test clean rows end up in columns by instance field name and rejected
+    rows in the index of rejected rows.
+    """
+    buffers = clean_to_columns(CompanySwamper, iter(RECORDS), args=(['name', 'github', 'age'],))
+
+    assert list(buffers.columns) == ['name', 'github', 'age']
+    assert buffers.as_lists() == {
+        'name': ['SWAMPER', 'ROTINAJ'],
+        'github': ['wearespindle', None],
+        'age': [4, 2],
+    }
+    assert buffers.rejected_rows.tolist() == [1]
+    assert buffers.errors == [{'name': ['Name is required']}]
+    assert (len(buffers), buffers.rows) == (2, 3)
+
+
+def test_clean_to_columns_swamper_arguments():
+    """
+    Test the columns follow the fields of swampers that pick their own
+    fields, such as the one in the README.
+    """
+    class Swamper(CompanySwamper):
+        fields = ['name', 'github']
+
+        def __init__(self, data):
+            super(Swamper, self).__init__(self.fields, data)
+
+    buffers = clean_to_columns(Swamper, RECORDS)
+    assert buffers.as_lists() == {'name': ['SWAMPER', 'ROTINAJ'], 'github': ['wearespindle', None]}
+
+
+def test_clean_to_columns_no_records():
+    """
+    Test a batch without records has no columns.
+    """
+    buffers = clean_to_columns(CompanySwamper, [], args=(['name'],))
+    assert (len(buffers), buffers.columns) == (0, {})
+
+
+def test_as_arrays():
+    """
+    Test columns can be copied into arrays with a type code per column.
+    """
+    buffers = ColumnBuffers(['name', 'age'], ['name', 'age'])
+    buffers.append({'name': 'swamper', 'age': 4}, {})
+    arrays = buffers.as_arrays({'age': 'l'})
+
+    assert list(arrays) == ['age']
+    assert arrays['age'] == array.array('l', [4])
+
+    with raises(TypeError):
+        buffers.as_arrays({'name': 'l'})
+
+
+def test_as_numpy():
+    """
+    Test columns can be copied into NumPy arrays, with a dtype for some
+    columns.
+    """
+    numpy = importorskip('numpy')
+    buffers = clean_to_columns(CompanySwamper, RECORDS, args=(['name', 'age'],))
+    arrays = buffers.as_numpy({'age': 'int16'})
+
+    assert arrays['age'].dtype == numpy.int16
+    assert arrays['age'].tolist() == [4, 2]
+    assert arrays['name'].tolist() == ['SWAMPER', 'ROTINAJ']
@@ -0,0 +1,133 @@
+from pytest import raises
+
+from swamper.base import BaseSwamper
+from swamper.setters import compile_setter
+
+
+class Object(object):
+    first_name = ''
+    city = ''
+
+
+class SlotsObject(object):
+    __slots__ = ('first_name', 'city')
+
+
+class PropertyObject(object):
+    def __init__(self):
+        self._city = None
+
+    @property
+    def city(self):
+        return self._city
+
+    @city.setter
+    def city(self, value):
+        self._city = value.upper()
+
+
+class Swamper(BaseSwamper):
+    instance_to_data_fields = {'first_name': 'name'}
+
+
+def clean(records, swamper_class=Swamper, **kwargs):
+    return list(swamper_class.clean_many(records, ['first_name', 'city'], **kwargs))
+
+
+def test_build_or_update_many():
+    """
+    Test an object is built for every result, with field names mapped.
+    """
+    results = clean([{'name': 'swamper', 'city': 'Groningen'}, {'name': 'rotinaj'}])
+    objects = Swamper.build_or_update_many(results, Object, ['first_name', 'city'])
+
+    assert [type(obj) for obj in objects] == [Object, Object]
+    assert [(obj.first_name, obj.city) for obj in objects] == [('swamper', 'Groningen'), ('rotinaj', None)]
+
+
+def test_build_or_update_many_slots_and_properties():
+    """
+    Test objects with slots or properties get their values assigned.
+    """
+    results = clean([{'name': 'swamper', 'city': 'Groningen'}])
+
+    obj, = Swamper.build_or_update_many(results, SlotsObject, ['first_name', 'city'])
+    assert (obj.first_name, obj.city) == ('swamper', 'Groningen')
+
+    obj, = Swamper.build_or_update_many(results, PropertyObject, ['city'])
+    assert obj.city == 'GRONINGEN'
+
+
+def test_build_or_update_many_updates_instances():
+    """
+    Test an instance in the instances of a result is updated, and other types
+    than those in instances are refused.
+    """
+    existing = Object()
+
+    class InstanceSwamper(Swamper):
+        def build_instances(self):
+            self.instances = {Object: existing}
+
+    results = clean([{'name': 'swamper'}], InstanceSwamper)
+    obj, = InstanceSwamper.build_or_update_many(results, Object, ['first_name'])
+    assert obj is existing
+    assert obj.first_name == 'swamper'
+
+    with raises(TypeError):
+        InstanceSwamper.build_or_update_many(results, SlotsObject, ['first_name'])
+
+
+def test_build_or_update_many_custom_setattr():
+    """
+    Test an overridden `setattr` of the swamper is used.
+    """
+    class SetattrSwamper(Swamper):
+        def setattr(self, instance, field):
+            setattr(instance, field, self.cleaned_data.get(self.get_data_field(field), 'unknown'))
+
+    results = clean([{'name': 'swamper'}], SetattrSwamper)
+    obj, = SetattrSwamper.build_or_update_many(results, Object, ['first_name', 'age'])
+    assert obj.first_name == 'swamper'
+    assert obj.age == 'unknown'
+
+
+def test_build_or_update_many_fail():
+    """
+    Test building fails for results with errors or invalid field lists.
+    """
+    class ErrorSwamper(Swamper):
+        def clean_city(self, value, is_blank):
+            raise self.error_class('City is invalid')
+
+    with raises(ValueError):
+        Swamper.build_or_update_many(clean([{'name': 'swamper'}], ErrorSwamper), Object, ['first_name'])
+
+    with raises(TypeError):
+        Swamper.build_or_update_many([], Object, 'first_name')
+    assert Swamper.build_or_update_many([], Object, 'first_name', skip_verify=True) == []
+
+
+def test_compile_setter_paths():
+    """
+    Test the way values are assigned depends on the class.
+    """
+    class SetattrObject(object):
+        def __setattr__(self, name, value):
+            object.__setattr__(self, name, value * 2)
+
+    class SlotsOnly(object):
+        __slots__ = ('first_name',)
+
+    for klass, expected in (
+        (Object, 'a'),
+        (SlotsObject, 'a'),
+        (SetattrObject, 'aa'),
+    ):
+        obj = klass()
+        compile_setter(klass, [('name', 'first_name')])(obj, {'name': 'a'})
+        assert obj.first_name == expected
+
+    obj = SlotsOnly()
+    compile_setter(SlotsOnly, [('name', 'first_name'), ('city', 'city')])(obj, {'name': 'a'})
+    assert obj.first_name == 'a'
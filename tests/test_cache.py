@@ -0,0 +1,122 @@
+from swamper.base import BaseSwamper
+from swamper.cache import CacheInfo, LRUCache, cached
+
+
+def test_lru_cache_evicts_least_recently_used():
+    """
+    Test the least recently used entry is evicted when the cache is full.
+    """
+    cache = LRUCache(maxsize=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1
+    cache.set('c', 3)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert cache.info() == CacheInfo(hits=3, misses=1, evictions=1, maxsize=2, currsize=2)
+
+    cache.set('c', 4)
+    assert cache.get('c') == 4
+    assert len(cache) == 2
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.hits == 4
+
+
+def test_cached_cleaner():
+    """
+    Test a cached clean method is only called once for the same value and
+    is_blank, and errors are cached too.
+    """
+    calls = []
+
+    class Swamper(BaseSwamper):
+        @cached(maxsize=10)
+        def clean_name(self, value, is_blank):
+            """
+            Upper case name.
+            """
+            calls.append((value, is_blank))
+            if is_blank:
+                raise self.error_class('Name is required')
+            return value.upper()
+
+    records = [{'name': 'swamper'}, {'name': 'swamper'}, {'name': ''}, {'name': ''}, {'name': 'rotinaj'}]
+    results = list(Swamper.clean_many(records, ['name']))
+
+    assert [result.cleaned_data for result in results] == [
+        {'name': 'SWAMPER'}, {'name': 'SWAMPER'}, {}, {}, {'name': 'ROTINAJ'},
+    ]
+    assert results[3].errors == {'name': ['Name is required']}
+    assert calls == [('swamper', False), ('', True), ('rotinaj', False)]
+    assert Swamper.clean_name.__doc__.strip() == 'Upper case name.'
+
+
+def test_cached_cleaner_per_instance():
+    """
+    Test every swamper has its own cache, unless the class shares it.
+    """
+    class Swamper(BaseSwamper):
+        @cached(maxsize=1)
+        def clean_name(self, value, is_blank):
+            return value
+
+    swamper = Swamper(['name'], {'name': 'swamper'})
+    other = Swamper(['name'], {'name': 'swamper'})
+    swamper.full_clean()
+    other.full_clean()
+    assert Swamper.clean_name.cache_for(swamper) is not Swamper.clean_name.cache_for(other)
+    assert Swamper.clean_name.cache_for(swamper).info() == CacheInfo(0, 1, 0, 1, 1)
+
+    class SharedSwamper(Swamper):
+        share_cleaner_cache = True
+
+    swamper = SharedSwamper(['name'], {'name': 'swamper'})
+    other = SharedSwamper(['name'], {'name': 'rotinaj'})
+    swamper.full_clean()
+    other.full_clean()
+    cache = SharedSwamper.clean_name.cache_for(swamper)
+    assert cache is SharedSwamper.clean_name.cache_for(other)
+    assert cache.info() == CacheInfo(0, 2, 1, 1, 1)
+
+
+def test_cached_cleaner_keys():
+    """
+    Test values that are equal but of a different type aren't mixed up, and
+    unhashable values are cleaned without caching.
+    """
+    calls = []
+
+    class Swamper(BaseSwamper):
+        @cached()
+        def clean_name(self, value, is_blank):
+            calls.append(value)
+            return repr(value)
+
+    results = Swamper.clean_many([{'name': 1}, {'name': True}, {'name': [1]}, {'name': [1]}], ['name'])
+    assert [result.cleaned_data['name'] for result in results] == ['1', 'True', '[1]', '[1]']
+    assert calls == [1, True, [1], [1]]
+
+
+def test_cached_cleaner_raises_new_error():
+    """
+    Test a cached error is raised as a copy of the original error.
+    """
+    errors = []
+
+    class Swamper(BaseSwamper):
+        @cached()
+        def clean_name(self, value, is_blank):
+            raise self.error_class('Name is invalid')
+
+        def add_error(self, data_field, message):
+            errors.append(message)
+            super(Swamper, self).add_error(data_field, message)
+
+    results = list(Swamper.clean_many([{'name': 'swamper'}, {'name': 'swamper'}], ['name']))
+    assert [result.errors for result in results] == [{'name': ['Name is invalid']}] * 2
+    assert errors[0] is not errors[1]
+    assert str(errors[0]) == str(errors[1])
@@ -0,0 +1,82 @@
+import types
+
+from pytest import raises
+
+from swamper.base import BaseSwamper, CleanResult
+
+
+class CompanySwamper(BaseSwamper):
+    fields = ['name']
+
+    def __init__(self, data):
+        super(CompanySwamper, self).__init__(self.fields, data)
+
+    def clean_name(self, value, is_blank):
+        if is_blank or value is None:
+            raise ValueError('Field "name" is required.')
+
+        return value.upper()
+
+
+def test_clean_many_results():
+    """
+    Test every record gets a result in input order, with the cleaned data or
+    the errors for that record.
+    """
+    records = [{'name': 'swamper'}, {'name': ''}, {}, {'name': 'rotinaj'}]
+    results = CompanySwamper.clean_many(records)
+    assert isinstance(results, types.GeneratorType)
+
+    results = list(results)
+    assert [result.raw_data for result in results] == records
+    assert [result.is_clean() for result in results] == [True, False, False, True]
+    assert results[0] == CleanResult({'name': 'swamper'}, {'name': 'SWAMPER'}, {}, {})
+    assert results[1].errors == {'name': ['Field "name" is required.']}
+    assert results[2].errors == {'name': ['Field "name" is required.']}
+    assert results[3].cleaned_data == {'name': 'ROTINAJ'}
+
+
+def test_clean_many_reuses_swamper():
+    """
+    Test a single swamper is built for all records.
+    """
+    built = []
+
+    class Swamper(BaseSwamper):
+        def __init__(self, *args, **kwargs):
+            built.append(self)
+            super(Swamper, self).__init__(*args, **kwargs)
+
+    results = Swamper.clean_many(({'name': i} for i in range(3)), ['name'], skip_verify=True)
+    assert [result.cleaned_data['name'] for result in results] == [0, 1, 2]
+    assert len(built) == 1
+
+
+def test_clean_many_is_lazy():
+    """
+    Test records are consumed one at a time, as results are requested.
+    """
+    consumed = []
+
+    def records():
+        for i in range(3):
+            consumed.append(i)
+            yield {'name': i}
+
+    results = BaseSwamper.clean_many(records(), ['name'])
+    assert consumed == []
+    next(results)
+    assert consumed == [0]
+
+
+def test_clean_many_verifies_every_record():
+    """
+    Test every record is type checked, unless verification is skipped.
+    """
+    results = BaseSwamper.clean_many([{'name': 'swamper'}, ('swamper',)], ['name'])
+    next(results)
+    with raises(TypeError):
+        next(results)
+
+    results = BaseSwamper.clean_many([{'name': 'swamper'}, {}], ['name'], skip_verify=True)
+    assert len(list(results)) == 2
@@ -0,0 +1,91 @@
+import gc
+import linecache
+import traceback
+
+from swamper.base import BaseSwamper
+from swamper.dependencies import validates
+
+
+VALUES = ['swamper', '', u'', b'', b'swamper', None, 0, 1, 0.0, [], [0], (), {}, {'a': 1}, set(), False]
+
+
+class Swamper(BaseSwamper):
+    compile_cleaning = True
+
+    def clean_name(self, value, is_blank):
+        return (value, is_blank)
+
+    def clean_missing(self, value, is_blank):
+        return (value, is_blank)
+
+
+def test_compiled_is_blank_parity():
+    """
+    Test the inlined blank test gives the same outcome as `test_is_blank`.
+    """
+    for value in VALUES:
+        swamper = Swamper(['name', 'missing'], {'name': value})
+        swamper.full_clean()
+        assert swamper.cleaned_data['name'] == (value, swamper.test_is_blank('name', value))
+        assert swamper.cleaned_data['missing'] == (None, False)
+
+
+def test_compiled_overridden_is_blank():
+    """
+    Test an overridden `test_is_blank` is called instead of inlined.
+    """
+    class OtherSwamper(Swamper):
+        def test_is_blank(self, data_field, value):
+            return 'blank'
+
+    swamper = OtherSwamper(['name'], {'name': 'swamper'})
+    swamper.full_clean()
+    assert swamper.cleaned_data == {'name': ('swamper', 'blank')}
+    assert 'self.test_is_blank(' in swamper._plan.compiled.source
+
+
+def test_compiled_source():
+    """
+    Test the generated function writes out fields, clean methods and
+    validators, and shows up in tracebacks.
+    """
+    class OtherSwamper(Swamper):
+        def clean_age(self, value, is_blank):
+            raise KeyError('age')
+
+        @validates('name', 'age')
+        def validate_age(self):
+            pass
+
+    swamper = OtherSwamper(['name', 'city', 'age'], {'name': 'swamper'})
+    try:
+        swamper.full_clean()
+    except KeyError:
+        stack = traceback.format_exc()
+
+    source = swamper._plan.compiled.source
+    assert "value = data.get('city')" in source
+    assert 'cleaner_0_1' not in source
+    assert 'cleaner_0_2(self, value, is_blank=is_blank)' in source
+    assert "if not ('age' in errors or 'name' in errors):" in source
+    assert 'validator_0_0(self)' in source
+    assert "cleaned_data['age'] = cleaner_0_2(self, value, is_blank=is_blank)" in stack
+
+
+def test_compiled_source_is_forgotten_with_plan():
+    """
+    Test the source of a generated function is only kept for tracebacks as
+    long as its plan exists.
+    """
+    class OtherSwamper(Swamper):
+        plan_cache_size = 1
+
+    swamper = OtherSwamper(['name'], {'name': 'swamper'})
+    swamper.full_clean()
+    filename = swamper._plan.compiled.__code__.co_filename
+    assert filename in linecache.cache
+
+    del swamper
+    OtherSwamper(['missing'], {})
+    gc.collect()
+    assert filename not in linecache.cache
@@ -0,0 +1,85 @@
+from pytest import importorskip, raises
+
+from swamper.base import BaseSwamper
+
+numpy = importorskip('numpy')
+from swamper.columns import clean_columns  # noqa: E402
+
+
+class Swamper(BaseSwamper):
+    instance_to_data_fields = {'years': 'age'}
+
+    def clean_age_column(self, values, is_blank_mask):
+        values = values.astype(int)
+        return values, numpy.where(values < 0, 'Age must be positive', '')
+
+    def clean_name_column(self, values, is_blank_mask):
+        return numpy.char.upper(numpy.where(is_blank_mask, 'unknown', values))
+
+    def clean_city(self, value, is_blank):
+        if is_blank or value is None:
+            raise self.error_class('City is required')
+        return value.lower()
+
+    def clean_code_column(self, values, is_blank_mask):
+        return numpy.where(is_blank_mask, b'-', values)
+
+    def clean_note_column(self, values, is_blank_mask):
+        assert is_blank_mask.tolist() == [False] * len(values)
+        return values, [None] * (len(values) - 1) + ['Note is invalid']
+
+
+def test_clean_columns():
+    """
+    Test column clean methods clean whole columns, and fields without one
+    are cleaned value by value.
+    """
+    batch = clean_columns(Swamper, {
+        'age': ['4', '-1', '30'],
+        'name': ['swamper', '', 'rotinaj'],
+        'city': numpy.array(['Groningen', '', 'Amsterdam'], dtype=object),
+        'country': ['NL', 'BE', 'DE'],
+    }, args=(['years', 'name', 'city', 'country'],))
+
+    assert len(batch) == 3
+    assert batch.cleaned['age'].tolist() == [4, -1, 30]
+    assert batch.cleaned['name'].tolist() == ['SWAMPER', 'UNKNOWN', 'ROTINAJ']
+    assert batch.cleaned['city'].tolist() == ['groningen', None, 'amsterdam']
+    assert batch.cleaned['country'].tolist() == ['NL', 'BE', 'DE']
+    assert batch.valid.tolist() == [True, False, True]
+    assert batch.errors == {1: {'age': ['Age must be positive'], 'city': ['City is required']}}
+
+    valid = batch.valid_columns()
+    assert valid['age'].tolist() == [4, 30]
+    assert valid['name'].tolist() == ['SWAMPER', 'ROTINAJ']
+
+
+def test_clean_columns_structured_array():
+    """
+    Test a structured array can be cleaned, and missing columns are treated
+    like missing fields.
+    """
+    dtype = [('age', 'i4'), ('name', 'U10'), ('code', 'S4')]
+    rows = numpy.array([(4, u'swamper', b'A1'), (-1, u'', b'')], dtype=dtype)
+    batch = clean_columns(Swamper, rows, args=(['age', 'name', 'code', 'city', 'note'],), kwargs={'skip_verify': True})
+
+    assert batch.cleaned['age'].tolist() == [4, -1]
+    assert batch.cleaned['name'].tolist() == ['SWAMPER', 'UNKNOWN']
+    assert batch.cleaned['code'].tolist() == [b'A1', b'-']
+    assert batch.cleaned['note'].tolist() == [None, None]
+    assert batch.valid.tolist() == [False, False]
+    assert batch.errors == {
+        0: {'city': ['City is required']},
+        1: {'age': ['Age must be positive'], 'city': ['City is required'], 'note': ['Note is invalid']},
+    }
+
+
+def test_clean_columns_length_mismatch():
+    """
+    Test columns must have the same number of rows.
+    """
+    with raises(ValueError):
+        clean_columns(Swamper, {'age': [1, 2], 'name': ['swamper']}, args=(['age', 'name'],))
+
+    batch = clean_columns(Swamper, {}, args=(['city'],))
+    assert len(batch) == 0
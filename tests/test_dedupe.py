@@ -0,0 +1,103 @@
+from swamper.base import BaseSwamper
+from swamper.cache import LRUCache
+from swamper.dedupe import clean_deduped, fingerprint
+
+
+class NameSwamper(BaseSwamper):
+    max_errors = 1
+
+    def clean_name(self, value, is_blank):
+        if is_blank:
+            raise self.error_class('Name is required')
+        return value.upper()
+
+
+def test_fingerprint():
+    """
+    Test fingerprints only depend on the given fields, their types and
+    whether they are present.
+    """
+    assert fingerprint({'name': 'a', 'other': 1}, ['name']) == fingerprint({'name': 'a', 'other': 2}, ['name'])
+    assert fingerprint({'name': 1}, ['name']) != fingerprint({'name': True}, ['name'])
+    assert fingerprint({'name': None}, ['name']) != fingerprint({}, ['name'])
+
+
+def test_clean_deduped():
+    """
+    Test identical records are cleaned once and get copies of the result.
+    """
+    cache = LRUCache(10)
+    records = [{'name': 'swamper'}, {'name': ''}, {'name': 'swamper'}, {'name': ''}, {'name': 'rotinaj'}]
+    results = list(clean_deduped(NameSwamper, records, args=(['name'],), cache=cache))
+
+    assert [result.raw_data for result in results] == records
+    assert [result.cleaned_data for result in results] == [
+        {'name': 'SWAMPER'}, {}, {'name': 'SWAMPER'}, {}, {'name': 'ROTINAJ'},
+    ]
+    assert results[3].errors == {'name': ['Name is required']}
+    assert results[3].errors.short_circuited is True
+    assert (cache.info().hits, cache.info().misses) == (2, 3)
+
+    # Results don't share their data.
+    results[0].cleaned_data['name'] = 'changed'
+    results[1].errors['name'].append('changed')
+    assert results[2].cleaned_data == {'name': 'SWAMPER'}
+    assert results[3].errors == {'name': ['Name is required']}
+
+
+def test_clean_deduped_unhashable():
+    """
+    Test records with unhashable values are always cleaned.
+    """
+    records = [{'name': ['a']}, {'name': ['a']}]
+    results = list(clean_deduped(BaseSwamper, records, args=(['name'],)))
+    assert [result.cleaned_data for result in results] == [{'name': ['a']}, {'name': ['a']}]
+
+
+def test_clean_deduped_escape_hatch():
+    """
+    Test swampers can opt out, then every record is cleaned.
+    """
+    class Swamper(BaseSwamper):
+        deduplicate_records = False
+        calls = []
+
+        def clean_name(self, value, is_blank):
+            self.calls.append(value)
+            return value
+
+    results = list(clean_deduped(Swamper, [{'name': 'a'}, {'name': 'a'}], args=(['name'],)))
+    assert [result.cleaned_data for result in results] == [{'name': 'a'}, {'name': 'a'}]
+    assert Swamper.calls == ['a', 'a']
+
+
+def test_clean_deduped_builds_instances_per_record():
+    """
+    Test identical records get instances of their own, and errors cleaning
+    instances are not re-used.
+    """
+    class Company(object):
+        pass
+
+    class Swamper(NameSwamper):
+        def build_instances(self):
+            self.instances = {Company: Company()}
+
+        def clean_instances(self):
+            if self.data.get('blocked'):
+                raise self.error_class('Company is blocked')
+
+    records = [{'name': 'swamper'}, {'name': 'swamper'}, {'name': 'swamper', 'blocked': True}]
+    results = list(clean_deduped(Swamper, records, args=(['name'],)))
+    assert [result.cleaned_data for result in results] == [{'name': 'SWAMPER'}, {'name': 'SWAMPER'}, {}]
+    assert results[2].errors == {None: ['Company is blocked']}
+    assert results[0].instances[Company] is not results[1].instances[Company]
+
+    instances = Swamper.build_or_update_many(results[:2], Company, ['name'])
+    assert instances[0] is not instances[1]
+
+    # A record after one whose instances had errors is cleaned as usual.
+    records = [{'name': 'swamper', 'blocked': True}, {'name': 'swamper'}]
+    results = list(clean_deduped(Swamper, records, args=(['name'],)))
+    assert [result.errors for result in results] == [{None: ['Company is blocked']}, {}]
+    assert results[1].cleaned_data == {'name': 'SWAMPER'}
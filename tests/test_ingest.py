@@ -0,0 +1,206 @@
+import datetime
+import json
+
+import six
+from pytest import raises
+
+from swamper.__main__ import import_swamper, main
+from swamper.base import BaseSwamper
+from swamper.ingest import IngestReport, guess_format, ingest, read_records
+
+
+class NameSwamper(BaseSwamper):
+    fields = ['name', 'city']
+
+    def __init__(self, fields=None, data=None):
+        super(NameSwamper, self).__init__(fields or self.fields, data)
+
+    def clean_name(self, value, is_blank):
+        if is_blank or value is None:
+            raise self.error_class('Name is required')
+        return value.upper()
+
+
+class PlainSwamper(BaseSwamper):
+    def clean_name(self, value, is_blank):
+        return value.upper()
+
+
+CSV = 'name,city\nswamper,Groningen\n,Amsterdam\nrotinaj,Utrecht\n'
+JSON_LINES = '{"name": "swamper", "city": "Groningen"}\n\n{"city": "Amsterdam"}\n{"name": "rotinaj"}\n'
+
+
+def test_read_records():
+    """
+    Test records are read from CSV with a header row and from JSON Lines,
+    skipping blank lines.
+    """
+    assert list(read_records(six.StringIO(CSV), 'csv')) == [
+        {'name': 'swamper', 'city': 'Groningen'},
+        {'name': '', 'city': 'Amsterdam'},
+        {'name': 'rotinaj', 'city': 'Utrecht'},
+    ]
+    assert list(read_records(six.StringIO(JSON_LINES), 'jsonl')) == [
+        {'name': 'swamper', 'city': 'Groningen'},
+        {'city': 'Amsterdam'},
+        {'name': 'rotinaj'},
+    ]
+
+    with raises(ValueError):
+        list(read_records(six.StringIO(CSV), 'xml'))
+
+
+def test_guess_format():
+    """
+    Test the format is told from the extension of the file name.
+    """
+    assert guess_format('export.csv') == 'csv'
+    assert guess_format('export.jsonl') == 'jsonl'
+    assert guess_format('export.ndjson') == 'jsonl'
+    with raises(ValueError):
+        guess_format('export.xml')
+
+
+def test_ingest_csv():
+    """
+    Test clean records are written as CSV and rejected records as JSON Lines
+    with their row number, data and errors.
+    """
+    clean_output = six.StringIO()
+    reject_output = six.StringIO()
+    reports = []
+    report = ingest(NameSwamper, six.StringIO(CSV), clean_output, reject_output, format='csv', chunk_size=2,
+                    progress=lambda report: reports.append(report.rows))
+
+    assert clean_output.getvalue().splitlines() == ['name,city', 'SWAMPER,Groningen', 'ROTINAJ,Utrecht']
+    assert [json.loads(line) for line in reject_output.getvalue().splitlines()] == [
+        {'row': 2, 'data': {'name': '', 'city': 'Amsterdam'}, 'errors': {'name': ['Name is required']}},
+    ]
+    assert (report.rows, report.clean, report.rejected) == (3, 2, 1)
+    assert reports == [2, 3]
+
+
+def test_ingest_json_lines():
+    """
+    Test clean records are written as JSON Lines and rejected records are
+    only counted without a reject output.
+    """
+    clean_output = six.StringIO()
+    report = ingest(NameSwamper, six.StringIO(JSON_LINES), clean_output, args=(), kwargs={'fields': ['name']})
+
+    assert [json.loads(line) for line in clean_output.getvalue().splitlines()] == [
+        {'name': 'SWAMPER'}, {'name': 'ROTINAJ'},
+    ]
+    assert (report.rows, report.clean, report.rejected) == (3, 2, 1)
+
+
+def test_ingest_serializes_values():
+    """
+    Test cleaned values json cannot serialize are written as text.
+    """
+    class DateSwamper(NameSwamper):
+        def clean_city(self, value, is_blank):
+            return datetime.date(2016, 1, 1) if value == 'Groningen' else b'bytes'
+
+    clean_output = six.StringIO()
+    ingest(DateSwamper, six.StringIO(JSON_LINES), clean_output)
+
+    assert [json.loads(line)['city'] for line in clean_output.getvalue().splitlines()] == ['2016-01-01', 'bytes']
+
+
+def test_ingest_workers():
+    """
+    Test records can be cleaned by a pool of processes.
+    """
+    clean_output = six.StringIO()
+    report = ingest(NameSwamper, six.StringIO(JSON_LINES), clean_output, workers=2, chunk_size=1)
+
+    assert len(clean_output.getvalue().splitlines()) == 2
+    assert report.rejected == 1
+
+
+def test_ingest_report():
+    """
+    Test the report counts rows and tells the throughput.
+    """
+    report = IngestReport(rows=10, clean=8, rejected=2, seconds=2.0)
+    assert report.rows_per_second == 5.0
+    assert str(report) == '10 rows (8 clean, 2 rejected) in 2.00s, 5 rows/s'
+    assert IngestReport().rows_per_second == 0.0
+
+
+def test_import_swamper():
+    """
+    Test swamper classes can be imported with a colon or a dot before the
+    class name, but not without a module.
+    """
+    assert import_swamper('tests.test_ingest:NameSwamper') is NameSwamper
+    assert import_swamper('tests.test_ingest.NameSwamper') is NameSwamper
+    with raises(ValueError):
+        import_swamper('NameSwamper')
+
+
+def test_main(tmpdir, capsys):
+    """
+    Test the command line reads a file and writes clean and rejected records
+    to the given files, reporting counts on stderr.
+    """
+    source = tmpdir.join('input.csv')
+    source.write(CSV)
+    clean = tmpdir.join('clean.csv')
+    rejects = tmpdir.join('rejects.jsonl')
+
+    main(['tests.test_ingest:NameSwamper', str(source), '--clean', str(clean), '--rejects', str(rejects),
+          '--fields', 'name', '--chunk-size', '2', '--progress'])
+
+    assert clean.read().splitlines() == ['name', 'SWAMPER', 'ROTINAJ']
+    assert len(rejects.read().splitlines()) == 1
+    assert capsys.readouterr().err.count('3 rows (2 clean, 1 rejected)') == 2
+
+
+def test_main_stdout(tmpdir, capsys):
+    """
+    Test clean records are written to stdout by default.
+    """
+    source = tmpdir.join('input.data')
+    source.write(JSON_LINES)
+
+    main(['tests.test_ingest:NameSwamper', str(source), '--format', 'jsonl'])
+
+    assert len(capsys.readouterr().out.splitlines()) == 2
+
+
+def test_main_argument_fail(tmpdir, capsys):
+    """
+    Test invalid chunk sizes and input of unknown format are refused with a
+    usage error instead of dropping records or a traceback.
+    """
+    source = tmpdir.join('input.csv')
+    source.write(CSV)
+
+    for argv in (
+        [str(source), '--chunk-size', '0'],
+        [str(source), '--workers', '-1'],
+        ['-'],
+    ):
+        with raises(SystemExit) as exc_info:
+            main(['tests.test_ingest:NameSwamper'] + argv)
+        assert exc_info.value.code == 2
+    assert capsys.readouterr().err.count('usage:') == 3
+
+
+def test_main_fields(tmpdir, capsys):
+    """
+    Test swamper classes without fields of their own clean the fields given
+    on the command line, which are then required.
+    """
+    source = tmpdir.join('input.csv')
+    source.write(CSV)
+
+    main(['tests.test_ingest:PlainSwamper', str(source), '--fields', 'name'])
+    assert capsys.readouterr().out.splitlines() == ['name', 'SWAMPER', '""', 'ROTINAJ']
+
+    with raises(SystemExit) as exc_info:
+        main(['tests.test_ingest:PlainSwamper', str(source)])
+    assert exc_info.value.code == 2
+    assert 'choose them with --fields' in capsys.readouterr().err
@@ -0,0 +1,127 @@
+from pytest import raises
+
+from swamper.base import BaseSwamper
+
+
+class Object(object):
+    first_name = ''
+    city = ''
+
+
+class Swamper(BaseSwamper):
+    instance_to_data_fields = {'first_name': 'name'}
+
+    def __init__(self, *args, **kwargs):
+        self.calls = []
+        super(Swamper, self).__init__(*args, **kwargs)
+
+    def clean_name(self, value, is_blank):
+        self.calls.append('name')
+        if is_blank:
+            raise self.error_class('Name is required')
+        return value.upper()
+
+    def clean_city(self, value, is_blank):
+        self.calls.append('city')
+        if value == 'Atlantis':
+            raise self.error_class('City does not exist')
+        return value.lower()
+
+    def clean(self):
+        raise AssertionError('Should not be called')
+
+
+def test_lazy_clean_reading_fields():
+    """
+    Test fields are cleaned when they are read, only once, and errors are
+    only known for fields that were read.
+    """
+    swamper = Swamper(['first_name', 'city', 'age'], {'name': 'swamper', 'city': 'Atlantis', 'age': 4})
+    swamper.lazy_clean()
+    assert swamper.calls == []
+    assert swamper.errors == {}
+
+    assert swamper.cleaned_data['name'] == 'SWAMPER'
+    assert swamper.cleaned_data.get('name') == 'SWAMPER'
+    assert swamper.calls == ['name']
+    assert swamper.errors == {}
+
+    assert 'city' not in swamper.cleaned_data
+    assert swamper.calls == ['name', 'city']
+    assert swamper.errors == {'city': ['City does not exist']}
+
+    assert dict(swamper.cleaned_data) == {'name': 'SWAMPER', 'age': 4}
+    assert len(swamper.cleaned_data) == 2
+    assert swamper.calls == ['name', 'city']
+    assert 'pending=[]' in repr(swamper.cleaned_data)
+
+
+def test_lazy_clean_writing_fields():
+    """
+    Test fields that are assigned or deleted are not cleaned anymore.
+    """
+    swamper = Swamper(['name', 'city'], {'name': 'swamper', 'city': 'Groningen'})
+    swamper.lazy_clean()
+    swamper.cleaned_data['name'] = 'rotinaj'
+    del swamper.cleaned_data['city']
+    assert dict(swamper.cleaned_data) == {'name': 'rotinaj'}
+    assert swamper.calls == ['city']
+
+
+def test_lazy_clean_build_or_update():
+    """
+    Test building an object only cleans the fields to assign, and does not
+    build with errors for those fields.
+    """
+    swamper = Swamper(['first_name', 'city'], {'name': 'swamper', 'city': 'Atlantis'})
+    swamper.lazy_clean()
+    obj = swamper.build_or_update(Object, ['first_name'])
+    assert obj.first_name == 'SWAMPER'
+    assert swamper.calls == ['name']
+
+    with raises(ValueError):
+        swamper.build_or_update(Object, ['city'])
+
+
+def test_lazy_clean_instance_errors():
+    """
+    Test fields are never cleaned when cleaning instances fails.
+    """
+    class InstanceSwamper(Swamper):
+        def clean_instances(self):
+            raise ValueError('No instance')
+
+    swamper = InstanceSwamper(['name'], {'name': 'swamper'})
+    swamper.lazy_clean()
+    assert swamper.errors == {None: ['No instance']}
+    assert swamper.cleaned_data == {}
+
+
+def test_partial_clean_fields_in_input():
+    """
+    Test only fields present in the input are cleaned by default.
+    """
+    swamper = Swamper(['first_name', 'city'], {'city': 'Groningen'})
+    swamper.partial_clean()
+    assert swamper.calls == ['city']
+    assert swamper.cleaned_data == {'city': 'groningen'}
+    assert swamper.errors == {}
+
+    obj = Object()
+    obj.first_name = 'John'
+    swamper.build_or_update(obj, ['first_name', 'city'])
+    assert obj.first_name == 'John'
+    assert obj.city == 'groningen'
+
+
+def test_partial_clean_given_fields():
+    """
+    Test only given fields are cleaned and unknown fields are refused.
+    """
+    swamper = Swamper(['first_name', 'city'], {'name': '', 'city': 'Atlantis'})
+    swamper.partial_clean(['first_name'])
+    assert swamper.calls == ['name']
+    assert swamper.errors == {'name': ['Name is required']}
+
+    with raises(ValueError):
+        swamper.partial_clean(['age'])
@@ -0,0 +1,133 @@
+import pickle
+
+from swamper.base import BaseSwamper, ErrorDict
+from swamper.dependencies import validates
+
+
+class RequiredSwamper(BaseSwamper):
+    def __init__(self, *args, **kwargs):
+        self.calls = []
+        super(RequiredSwamper, self).__init__(*args, **kwargs)
+
+    def required(self, field, value, is_blank):
+        self.calls.append(field)
+        if is_blank or value is None:
+            raise self.error_class('{} is required'.format(field))
+        return value
+
+    def clean_a(self, value, is_blank):
+        return self.required('a', value, is_blank)
+
+    def clean_b(self, value, is_blank):
+        return self.required('b', value, is_blank)
+
+    def clean_c(self, value, is_blank):
+        return self.required('c', value, is_blank)
+
+    @validates('a', 'b')
+    def validate_different(self):
+        self.calls.append('different')
+        if self.cleaned_data['a'] == self.cleaned_data['b']:
+            raise self.error_class('a and b must differ')
+
+    def clean(self):
+        self.calls.append('clean')
+        if self.cleaned_data.get('c') == 'invalid':
+            self.add_error('c', 'c is invalid')
+        return self.cleaned_data
+
+
+class FailFastSwamper(RequiredSwamper):
+    max_errors = 1
+
+
+class BudgetSwamper(RequiredSwamper):
+    max_errors = 2
+
+
+def test_no_error_budget():
+    """
+    Test all fields are cleaned without an error budget.
+    """
+    swamper = RequiredSwamper(['a', 'b', 'c'], {})
+    assert swamper.errors == {'a': ['a is required'], 'b': ['b is required'], 'c': ['c is required']}
+    assert isinstance(swamper.errors, ErrorDict)
+    assert swamper.errors.short_circuited is False
+    assert swamper.calls == ['a', 'b', 'c', 'clean']
+
+
+def test_fail_fast():
+    """
+    Test cleaning stops at the first error.
+    """
+    swamper = FailFastSwamper(['a', 'b', 'c'], {'b': 'swamper'})
+    assert swamper.is_clean() is False
+    assert swamper.errors == {'a': ['a is required']}
+    assert swamper.errors.short_circuited is True
+    assert swamper.calls == ['a']
+
+    swamper = FailFastSwamper(['a', 'b', 'c'], {'a': 'swamper', 'b': 'swamper', 'c': 'swamper'})
+    assert swamper.errors == {None: ['a and b must differ']}
+    assert swamper.errors.short_circuited is True
+    assert swamper.calls == ['a', 'b', 'different']
+
+
+def test_error_budget():
+    """
+    Test cleaning stops when the number of fields with errors reaches the
+    budget, and runs to the end when it doesn't.
+    """
+    swamper = BudgetSwamper(['a', 'b', 'c'], {})
+    assert swamper.errors == {'a': ['a is required'], 'b': ['b is required']}
+    assert swamper.errors.short_circuited is True
+    assert swamper.calls == ['a', 'b']
+
+    swamper = BudgetSwamper(['a', 'b', 'c'], {'a': 'swamper', 'b': 'rotinaj', 'c': 'invalid'})
+    assert swamper.errors == {'c': ['c is invalid']}
+    assert swamper.errors.short_circuited is False
+    assert swamper.calls == ['a', 'b', 'different', 'c', 'clean']
+    assert swamper._error_budget is None
+
+
+def test_error_budget_with_error_class_exception():
+    """
+    Test errors added with `add_error` by validators and the post clean stop
+    cleaning when `error_class` is `Exception`, which catches about anything.
+    """
+    swamper = FailFastSwamper(['a', 'b', 'c'], {'a': 'swamper', 'b': 'rotinaj', 'c': 'invalid'},
+                              error_class=Exception)
+    assert swamper.errors == {'c': ['c is invalid']}
+    assert swamper.errors.short_circuited is True
+
+    class Swamper(FailFastSwamper):
+        @validates('a')
+        def validate_a(self):
+            self.add_error('a', 'a is invalid')
+
+    swamper = Swamper(['a', 'b', 'c'], {'a': 'swamper'}, error_class=Exception)
+    assert swamper.errors == {'a': ['a is invalid']}
+    assert swamper.errors.short_circuited is True
+    assert swamper.calls == ['a']
+
+
+def test_error_budget_clean_many():
+    """
+    Test the error budget applies to every record of a batch and the flag is
+    reset for the next record.
+    """
+    records = [{}, {'a': 'swamper', 'b': 'rotinaj', 'c': 'swamper'}]
+    results = list(FailFastSwamper.clean_many(records, ['a', 'b', 'c']))
+    assert results[0].errors == {'a': ['a is required']}
+    assert results[0].errors.short_circuited is True
+    assert results[1].errors == {}
+    assert results[1].errors.short_circuited is False
+
+
+def test_error_dict_pickles():
+    """
+    Test the flag survives pickling, for results from worker processes.
+    """
+    swamper = FailFastSwamper(['a'], {})
+    errors = pickle.loads(pickle.dumps(swamper.errors, pickle.HIGHEST_PROTOCOL))
+    assert errors == {'a': ['a is required']}
+    assert errors.short_circuited is True
@@ -0,0 +1,142 @@
+from pytest import raises
+
+from swamper.base import BaseSwamper
+from swamper.dependencies import validates
+from swamper.metrics import MetricsCollector, StepMetrics, timed
+
+
+class MeasuredSwamper(BaseSwamper):
+    def clean_name(self, value, is_blank):
+        if is_blank:
+            raise self.error_class('Name is required')
+        return value
+
+    @validates('name', 'city')
+    def validate_city(self):
+        pass
+
+    def clean(self):
+        if self.cleaned_data.get('city') == 'nowhere':
+            raise self.error_class('Unknown city')
+        return self.cleaned_data
+
+
+def make_swamper_class(collector):
+    return type('MeasuredSwamper', (MeasuredSwamper,), {'collector': collector})
+
+
+def test_timed():
+    """
+    Test a timed function reports every call and re-raises errors.
+    """
+    collector = MetricsCollector()
+
+    def double(value):
+        if value is None:
+            raise ValueError('No value')
+        return value * 2
+
+    wrapper = timed(collector, MeasuredSwamper, 'double', double)
+    assert wrapper.__name__ == 'double'
+    assert wrapper(2) == 4
+    with raises(ValueError):
+        wrapper(None)
+
+    metrics = collector.metrics()[('MeasuredSwamper', 'double')]
+    assert (metrics.count, metrics.errors, len(metrics.samples)) == (2, 1, 2)
+
+
+def test_step_metrics_percentile():
+    """
+    Test percentiles are taken from the most recent samples only.
+    """
+    metrics = StepMetrics(sample_size=3)
+    assert metrics.percentile(50) == 0.0
+
+    for seconds in [4.0, 1.0, 3.0, 2.0]:
+        metrics.samples.append(seconds)
+    assert metrics.percentile(0) == 1.0
+    assert metrics.percentile(50) == 2.0
+    assert metrics.percentile(100) == 3.0
+
+
+def test_collector_records_all_steps():
+    """
+    Test every step of cleaning is reported, with errors of field clean
+    methods and the post clean.
+    """
+    collector = MetricsCollector()
+    swamper_class = make_swamper_class(collector)
+    records = [{'name': 'swamper', 'city': 'Groningen'}, {'name': '', 'city': 'Amsterdam'},
+               {'name': 'swamper', 'city': 'nowhere'}]
+    results = list(swamper_class.clean_many(records, ['name', 'city']))
+    assert [result.is_clean() for result in results] == [True, False, False]
+
+    metrics = collector.metrics()
+    assert list(metrics) == [
+        ('MeasuredSwamper', 'build_instances'),
+        ('MeasuredSwamper', 'clean_instances'),
+        ('MeasuredSwamper', 'clean_name'),
+        ('MeasuredSwamper', 'validate_city'),
+        ('MeasuredSwamper', 'clean'),
+    ]
+    assert [(m.count, m.errors) for m in metrics.values()] == [(3, 0), (3, 0), (3, 1), (2, 0), (3, 1)]
+
+    collector.reset()
+    assert collector.metrics() == {}
+
+
+def test_collector_is_optional():
+    """
+    Test swampers without a collector use the plan and methods of the class.
+    """
+    swamper = MeasuredSwamper(['name'], {'name': 'swamper'})
+    assert swamper._plan.collected is None
+    assert 'clean' not in vars(swamper)
+
+
+def test_instrumented_plan_is_cached():
+    """
+    Test the instrumented plan is made once per collector.
+    """
+    collector = MetricsCollector()
+    swamper = make_swamper_class(collector)(['name', 'city'], {})
+    plan = swamper._plan
+    assert swamper.get_plan(['name', 'city']).instrumented(type(swamper), collector) is plan
+    assert swamper.get_plan(['name', 'city']).instrumented(type(swamper), MetricsCollector()) is not plan
+
+
+def test_report():
+    """
+    Test the report has a line with the counts and timings of every step.
+    """
+    collector = MetricsCollector()
+    collector.observe(MeasuredSwamper, 'clean_name', 0.002, False)
+    collector.observe(MeasuredSwamper, 'clean_name', 0.004, True)
+
+    lines = collector.report().splitlines()
+    assert lines[0].split() == ['swamper', 'step', 'calls', 'errors', 'total', 'ms', 'p50', 'ms', 'p90', 'ms',
+                                'p99', 'ms']
+    assert lines[1].split() == ['MeasuredSwamper', 'clean_name', '2', '1', '6.000', '2.000', '4.000', '4.000']
+
+
+def test_prometheus():
+    """
+    Test metrics are exported in the Prometheus text format, with quotes in
+    labels escaped.
+    """
+    collector = MetricsCollector()
+    collector.observe(MeasuredSwamper, 'clean_"name"', 0.5, True)
+
+    assert collector.prometheus().splitlines() == [
+        '# HELP swamper_step_seconds Time spent in a step of cleaning.',
+        '# TYPE swamper_step_seconds summary',
+        'swamper_step_seconds{swamper="MeasuredSwamper",step="clean_\\"name\\"",quantile="0.5"} 0.5',
+        'swamper_step_seconds{swamper="MeasuredSwamper",step="clean_\\"name\\"",quantile="0.9"} 0.5',
+        'swamper_step_seconds{swamper="MeasuredSwamper",step="clean_\\"name\\"",quantile="0.99"} 0.5',
+        'swamper_step_seconds_sum{swamper="MeasuredSwamper",step="clean_\\"name\\""} 0.5',
+        'swamper_step_seconds_count{swamper="MeasuredSwamper",step="clean_\\"name\\""} 1',
+        '# HELP swamper_step_errors_total Calls of a step of cleaning that raised.',
+        '# TYPE swamper_step_errors_total counter',
+        'swamper_step_errors_total{swamper="MeasuredSwamper",step="clean_\\"name\\""} 1',
+    ]
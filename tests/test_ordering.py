@@ -0,0 +1,158 @@
+import json
+
+from swamper.base import BaseSwamper
+from swamper.dependencies import depends_on, validates
+from swamper.ordering import CleaningProfile, FieldStats
+
+
+class OrderSwamper(BaseSwamper):
+    adaptive_ordering = True
+    max_errors = 1
+
+    def __init__(self, *args, **kwargs):
+        self.calls = []
+        super(OrderSwamper, self).__init__(*args, **kwargs)
+
+    def required(self, field, value, is_blank):
+        self.calls.append(field)
+        if is_blank or value is None:
+            raise self.error_class('{} is required'.format(field))
+        return value
+
+    def clean_a(self, value, is_blank):
+        return self.required('a', value, is_blank)
+
+    def clean_b(self, value, is_blank):
+        return self.required('b', value, is_blank)
+
+    @depends_on('b')
+    def clean_c(self, value, is_blank):
+        return self.required('c', value, is_blank)
+
+    @validates('a', 'c')
+    def validate_different(self):
+        self.calls.append('different')
+
+
+def make_profile(**failures):
+    profile = CleaningProfile()
+    for data_field, count in failures.items():
+        profile.stats[data_field] = FieldStats(calls=10, failures=count, seconds=1.0)
+    return profile
+
+
+def test_field_stats_rank():
+    """
+    Test fields are ranked by mean cost divided by failure rate.
+    """
+    assert FieldStats(calls=10, failures=5, seconds=2.0).rank() == 0.4
+    assert FieldStats(calls=10, failures=0, seconds=2.0).rank() == float('inf')
+
+
+def test_profile_order():
+    """
+    Test cleaners are ordered by rank, keeping their order for ties, and
+    never before the fields they must follow.
+    """
+    cleaners = (('a', None), ('b', None), ('c', None), ('d', None))
+    profile = make_profile(c=5, d=2)
+
+    assert profile.order(cleaners, {}) == (('c', None), ('d', None), ('a', None), ('b', None))
+    assert profile.order(cleaners, {'c': set(['b'])}) == (('b', None), ('c', None), ('d', None), ('a', None))
+    assert profile.order(cleaners, {'c': set(['d']), 'd': set(['c'])}) == (
+        ('a', None), ('b', None), ('c', None), ('d', None))
+
+
+def test_profile_records_and_reorders():
+    """
+    Test a profile records calls and starts a new generation every
+    `reorder_every` records.
+    """
+    profile = CleaningProfile(reorder_every=2)
+    profile.record('a', 0.5, True)
+    profile.record('a', 0.25, False)
+    assert (profile.stats['a'].calls, profile.stats['a'].failures, profile.stats['a'].seconds) == (2, 1, 0.75)
+
+    profile.record_done()
+    assert profile.generation == 0
+    profile.record_done()
+    assert profile.generation == 1
+
+
+def test_profile_dump_and_load():
+    """
+    Test a dumped profile survives JSON and loads frozen.
+    """
+    profile = make_profile(a=1)
+    profile.records = 10
+
+    loaded = CleaningProfile.load(json.loads(json.dumps(profile.dump())))
+    assert loaded.frozen is True
+    assert loaded.records == 10
+    assert loaded.dump() == profile.dump()
+    assert CleaningProfile.load({'fields': {}}, frozen=False).frozen is False
+
+
+def test_adaptive_ordering_learns():
+    """
+    Test a recording profile moves the field that fails most to the front,
+    after `reorder_every` records.
+    """
+    class Swamper(OrderSwamper):
+        pass
+
+    profile = Swamper.get_cleaning_profile()
+    assert Swamper.get_cleaning_profile() is profile
+    assert OrderSwamper.get_cleaning_profile() is not profile
+    profile.reorder_every = 3
+
+    records = [{'a': 'a', 'b': 'b'}] * 3 + [{'a': 'a', 'b': 'b'}]
+    results = list(Swamper.clean_many(records, ['a', 'b', 'c', 'd']))
+    assert [result.errors for result in results] == [{'c': ['c is required']}] * 4
+    assert profile.stats['c'].failures == 4
+    assert profile.records == 4
+
+    swamper = Swamper(['a', 'b', 'c', 'd'], {'a': 'a', 'b': 'b', 'c': 'c', 'd': 'd'})
+    assert swamper.is_clean()
+    assert swamper.calls == ['b', 'c', 'a', 'different']
+    assert swamper.cleaned_data == {'a': 'a', 'b': 'b', 'c': 'c', 'd': 'd'}
+
+
+def test_adaptive_ordering_frozen_profile():
+    """
+    Test a frozen profile orders fields the same way every time, without
+    recording.
+    """
+    class Swamper(OrderSwamper):
+        cleaning_profile = CleaningProfile.load({'fields': {
+            'a': {'calls': 10, 'failures': 1, 'seconds': 1.0},
+            'c': {'calls': 10, 'failures': 5, 'seconds': 1.0},
+        }})
+
+    swamper = Swamper(['a', 'b', 'c'], {})
+    assert swamper.errors == {'b': ['b is required']}
+    assert swamper.errors.short_circuited is True
+    assert swamper.calls == ['b']
+
+    swamper = Swamper(['a', 'b', 'c'], {'a': 'a', 'b': 'b', 'c': 'c'})
+    assert swamper.is_clean()
+    assert swamper.calls == ['b', 'c', 'a', 'different']
+    assert Swamper.cleaning_profile.dump()['fields']['a'] == {'calls': 10, 'failures': 1, 'seconds': 1.0}
+
+
+def test_ordered_plan_is_cached():
+    """
+    Test the ordered plan is only built again for a new generation.
+    """
+    class Swamper(OrderSwamper):
+        pass
+
+    profile = make_profile(c=1)
+    swamper = Swamper(['a', 'b', 'c'], {})
+    plan = swamper._plan.ordered(swamper, profile)
+    assert [data_field for data_field, _ in plan.cleaners] == ['b', 'c', 'a']
+    assert swamper._plan.ordered(swamper, profile) is plan
+
+    profile.generation += 1
+    assert swamper._plan.ordered(swamper, profile) is not plan
+    assert swamper._plan.ordered(swamper, make_profile()) is not plan
@@ -0,0 +1,66 @@
+from pytest import raises
+
+from swamper.base import BaseSwamper
+from swamper.parallel import _clean_chunk, clean_parallel
+
+
+class SwamperError(Exception):
+    pass
+
+
+class NameSwamper(BaseSwamper):
+    def clean_name(self, value, is_blank):
+        if not value:
+            raise self.error_class('Name is required')
+        return value.upper()
+
+
+def test_clean_chunk():
+    """
+    Test a worker cleans its chunk like `clean_many` would.
+    """
+    results = _clean_chunk(NameSwamper, (['name'],), {}, [{'name': 'swamper'}, {'name': ''}])
+    assert [result.cleaned_data for result in results] == [{'name': 'SWAMPER'}, {}]
+    assert [result.errors for result in results] == [{}, {'name': ['Name is required']}]
+
+
+def test_clean_parallel_keeps_input_order():
+    """
+    Test results of all chunks are returned in input order.
+    """
+    records = [{'name': 'swamper %d' % i if i % 3 else ''} for i in range(50)]
+    results = list(clean_parallel(NameSwamper, records, args=(['name'],), kwargs={'error_class': SwamperError},
+                                  workers=2, chunk_size=4))
+
+    assert [result.raw_data for result in results] == records
+    for i, result in enumerate(results):
+        if i % 3:
+            assert result.cleaned_data == {'name': 'SWAMPER %d' % i}
+        else:
+            assert result.errors == {'name': ['Name is required']}
+
+
+def test_clean_parallel_default_workers():
+    """
+    Test the number of workers defaults to the number of CPUs.
+    """
+    results = list(clean_parallel(NameSwamper, [{'name': 'swamper'}], args=(['name'],)))
+    assert results[0].cleaned_data == {'name': 'SWAMPER'}
+
+
+def test_clean_parallel_unpicklable_swamper():
+    """
+    Test swampers that cannot be sent to a worker are refused up front.
+    """
+    class Swamper(BaseSwamper):
+        pass
+
+    with raises(TypeError):
+        next(clean_parallel(Swamper, [{'name': 'swamper'}], args=(['name'],)))
+
+    class LocalError(Exception):
+        pass
+
+    with raises(TypeError):
+        next(clean_parallel(NameSwamper, [{'name': 'swamper'}], args=(['name'],),
+                            kwargs={'error_class': LocalError}))
@@ -0,0 +1,174 @@
+import abc
+
+import six
+
+from swamper.base import BaseSwamper
+
+
+def test_plan_is_compiled_once_per_class_and_fields():
+    """
+    Test instances of a class that clean the same fields share one plan, and
+    other fields or other classes get their own.
+    """
+    class Swamper(BaseSwamper):
+        pass
+
+    swamper = Swamper(['name'], {'name': 'swamper'})
+    assert Swamper(['name'], {'name': 'rotinaj'})._plan is swamper._plan
+    assert Swamper(('name',), {'name': 'rotinaj'})._plan is swamper._plan
+    assert Swamper(['name', 'age'], {})._plan is not swamper._plan
+
+    class OtherSwamper(Swamper):
+        pass
+
+    assert OtherSwamper(['name'], {})._plan is not swamper._plan
+    assert Swamper._plans is not OtherSwamper._plans
+
+
+def test_plan_cache_size():
+    """
+    Test a class keeps plans for at most `plan_cache_size` lists of fields,
+    and forgets the oldest plan first.
+    """
+    class Swamper(BaseSwamper):
+        plan_cache_size = 2
+
+    first = Swamper(['a'], {})._plan
+    Swamper(['b'], {})
+    Swamper(['c'], {})
+    assert list(Swamper._plans) == [('b',), ('c',)]
+    assert len(Swamper._verified_fields) <= 2
+    assert Swamper(['a'], {})._plan is not first
+
+
+def test_plan_fields_are_copied():
+    """
+    Test changing the field lists of a swamper doesn't change those of other
+    swampers that share its plan.
+    """
+    swamper = BaseSwamper(['a'], {})
+    swamper.fields.append('b')
+    swamper.instance_fields.append('b')
+    swamper.data_to_instance_fields['b'] = 'c'
+
+    swamper = BaseSwamper(['a'], {})
+    assert swamper.fields == ['a']
+    assert swamper.instance_fields == ['a']
+    assert swamper.data_to_instance_fields == {}
+
+
+def test_plan_resolves_field_mapping():
+    """
+    Test the plan maps instance fields to data fields and back again.
+    """
+    class Swamper(BaseSwamper):
+        instance_to_data_fields = {'first_name': 'name'}
+
+    swamper = Swamper(['first_name', 'age'], {'name': 'swamper'})
+    assert swamper.fields == ['name', 'age']
+    assert swamper.instance_fields == ['first_name', 'age']
+    assert swamper.data_to_instance_fields == {'name': 'first_name'}
+
+
+def test_plan_resolves_clean_methods():
+    """
+    Test the plan only holds clean methods for fields that have one, and they
+    are called with the swamper they clean for.
+    """
+    class Swamper(BaseSwamper):
+        def clean_name(self, value, is_blank):
+            return (self, value)
+
+    swamper = Swamper(['name', 'age'], {'name': 'swamper', 'age': 4})
+    cleaners = dict(swamper._plan.cleaners)
+    assert cleaners['age'] is None
+    assert cleaners['name'] is not None
+
+    assert swamper.is_clean() is True
+    assert swamper.cleaned_data == {'name': (swamper, 'swamper'), 'age': 4}
+
+
+def test_plan_for_class_with_metaclass():
+    """
+    Test swamper classes can use a metaclass of their own, such as ABCMeta.
+    """
+    @six.add_metaclass(abc.ABCMeta)
+    class Swamper(BaseSwamper):
+        @abc.abstractmethod
+        def clean_name(self, value, is_blank):
+            pass
+
+    class NameSwamper(Swamper):
+        def clean_name(self, value, is_blank):
+            return value.upper()
+
+    swamper = NameSwamper(['name'], {'name': 'swamper'})
+    assert swamper.is_clean() is True
+    assert swamper.cleaned_data == {'name': 'SWAMPER'}
+
+
+def test_plan_resolves_static_and_class_methods():
+    """
+    Test clean methods can be static or class methods, and are called the
+    same way as plain clean methods.
+    """
+    class Swamper(BaseSwamper):
+        @staticmethod
+        def clean_name(value, is_blank):
+            return value.upper()
+
+        @classmethod
+        def clean_city(cls, value, is_blank):
+            return (cls, value, is_blank)
+
+    swamper = Swamper(['name', 'city'], {'name': 'swamper', 'city': ''})
+    assert swamper.is_clean() is True
+    assert swamper.cleaned_data == {'name': 'SWAMPER', 'city': (Swamper, '', True)}
+
+
+def test_plan_resolves_clean_methods_of_instance():
+    """
+    Test clean methods assigned on a swamper replace those of its class, for
+    that swamper only.
+    """
+    class Swamper(BaseSwamper):
+        def __init__(self, fields, data, suffix=None):
+            super(Swamper, self).__init__(fields, data)
+            if suffix is not None:
+                self.clean_city = lambda value, is_blank: value + suffix
+
+        def clean_name(self, value, is_blank):
+            return value.upper()
+
+        def clean_city(self, value, is_blank):
+            return value.lower()
+
+    data = {'name': 'swamper', 'city': 'Utrecht'}
+    swamper = Swamper(['name', 'city'], data, suffix='!')
+    assert swamper.is_clean() is True
+    assert swamper.cleaned_data == {'name': 'SWAMPER', 'city': 'Utrecht!'}
+
+    swamper = Swamper(['name', 'city'], data)
+    assert swamper.is_clean() is True
+    assert swamper.cleaned_data == {'name': 'SWAMPER', 'city': 'utrecht'}
+
+
+def test_plan_for_map_of_instance():
+    """
+    Test swampers that map fields by a map of their own don't share plans,
+    while those that use the map of their class do.
+    """
+    class Swamper(BaseSwamper):
+        def __init__(self, fields, data, instance_to_data_fields=None):
+            if instance_to_data_fields is not None:
+                self.instance_to_data_fields = instance_to_data_fields
+            super(Swamper, self).__init__(fields, data)
+
+    data = {'company_name': 'spindle', 'person_name': 'swamper'}
+    company = Swamper(['name'], data, {'name': 'company_name'})
+    person = Swamper(['name'], data, {'name': 'person_name'})
+    assert company.is_clean() is True
+    assert person.is_clean() is True
+    assert company.cleaned_data == {'company_name': 'spindle'}
+    assert person.cleaned_data == {'person_name': 'swamper'}
+    assert Swamper(['name'], data)._plan is Swamper(['name'], data)._plan
@@ -0,0 +1,58 @@
+import threading
+
+from swamper.base import BaseSwamper
+from swamper.pool import SwamperPool
+
+
+class NameSwamper(BaseSwamper):
+    def clean_name(self, value, is_blank):
+        if is_blank:
+            raise self.error_class('Name is required')
+        return value.upper()
+
+
+def test_pool_reuses_swampers():
+    """
+    Test a released swamper is reset for the next input.
+    """
+    pool = SwamperPool(NameSwamper, args=(['name'],), kwargs={'skip_verify': True})
+    with pool.swamper({'name': 'swamper'}) as swamper:
+        assert swamper.is_clean()
+        assert swamper.cleaned_data == {'name': 'SWAMPER'}
+        first = swamper
+
+    with pool.swamper({'name': ''}) as swamper:
+        assert swamper is first
+        assert swamper.errors == {'name': ['Name is required']}
+        assert swamper.skip_verify is True
+
+
+def test_pool_size():
+    """
+    Test a pool keeps at most `size` idle swampers per thread.
+    """
+    pool = SwamperPool(NameSwamper, args=(['name'],), size=1)
+    swampers = [pool.acquire({'name': 'swamper'}) for _ in range(2)]
+    assert swampers[0] is not swampers[1]
+
+    for swamper in swampers:
+        pool.release(swamper)
+    assert pool._idle() == [swampers[0]]
+
+
+def test_pool_is_thread_local():
+    """
+    Test swampers are not shared between threads.
+    """
+    pool = SwamperPool(NameSwamper, args=(['name'],))
+    with pool.swamper({'name': 'swamper'}) as swamper:
+        pass
+
+    acquired = []
+    thread = threading.Thread(target=lambda: acquired.append(pool.acquire({'name': 'rotinaj'})))
+    thread.start()
+    thread.join()
+
+    assert acquired[0] is not swamper
+    assert acquired[0].is_clean()
+    assert pool.acquire({'name': 'swamper'}) is swamper
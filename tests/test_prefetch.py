@@ -0,0 +1,161 @@
+import sqlite3
+
+from pytest import raises
+
+from swamper.base import BaseSwamper
+from swamper.dedupe import clean_deduped
+from swamper.pool import SwamperPool
+from swamper.rows import clean_rows
+
+
+class Company(object):
+    def __init__(self, id, name):
+        self.id = id
+        self.name = name
+
+
+class Database(object):
+    """
+    Stand-in for a database that counts its queries.
+    """
+
+    def __init__(self):
+        self.connection = sqlite3.connect(':memory:')
+        self.connection.execute('CREATE TABLE company (id INTEGER PRIMARY KEY, name TEXT)')
+        self.connection.executemany('INSERT INTO company VALUES (?, ?)', [(i, 'company %d' % i) for i in range(10)])
+        self.queries = 0
+
+    def companies(self, ids):
+        self.queries += 1
+        rows = self.connection.execute(
+            'SELECT id, name FROM company WHERE id IN (%s)' % ', '.join('?' * len(ids)), list(ids))
+        return dict([(id, Company(id, name)) for id, name in rows])
+
+
+db = Database()
+
+
+class CompanySwamper(BaseSwamper):
+    prefetch_chunk_size = 4
+
+    def build_instances(self):
+        self.instances = {Company: db.companies([self.raw_data['id']]).get(self.raw_data['id'])}
+
+    def clean_instances(self):
+        if self.instances[Company] is None:
+            raise self.error_class('Unknown company')
+
+    @classmethod
+    def prefetch_instances(cls, records):
+        companies = db.companies(set([record['id'] for record in records]))
+        return [{Company: companies.get(record['id'])} for record in records]
+
+    def clean_name(self, value, is_blank):
+        return value.strip()
+
+
+def test_prefetch_instances():
+    """
+    Test instances are prefetched for the first record, then once per chunk
+    instead of built for every record.
+    """
+    db.queries = 0
+    records = [{'id': i, 'name': ' name %d ' % i} for i in range(10)]
+    results = list(CompanySwamper.clean_many(records, ['name']))
+
+    assert db.queries == 4
+    assert [result.instances[Company] and result.instances[Company].id for result in results] == [
+        0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
+    assert results[0].cleaned_data == {'name': 'name 0'}
+
+    results = list(CompanySwamper.clean_many([{'id': 11, 'name': 'unknown'}], ['name']))
+    assert results[0].errors == {None: ['Unknown company']}
+
+
+def test_prefetch_instances_batch_cleaning():
+    """
+    Test every way of cleaning a batch of records prefetches instances.
+    """
+    records = [{'id': i % 5, 'name': 'name %d' % (i % 5)} for i in range(10)]
+
+    db.queries = 0
+    results = list(clean_deduped(CompanySwamper, records, args=(['name'],)))
+    assert db.queries == 4
+    assert [result.instances[Company].id for result in results] == [0, 1, 2, 3, 4, 0, 1, 2, 3, 4]
+    assert results[0].instances[Company] is not results[5].instances[Company]
+
+    db.queries = 0
+    results = list(clean_rows(CompanySwamper, [(record['id'], record['name']) for record in records], ['id', 'name'],
+                              args=(['name'],)))
+    assert db.queries == 4
+    assert [result.raw_data for result in results[:2]] == [(0, 'name 0'), (1, 'name 1')]
+    assert [result.instances[Company].id for result in results] == [0, 1, 2, 3, 4, 0, 1, 2, 3, 4]
+
+
+def test_build_instances_without_prefetch():
+    """
+    Test a single swamper still builds its own instances, also when it comes
+    from a pool.
+    """
+    db.queries = 0
+    swamper = CompanySwamper(['name'], {'id': 1, 'name': 'name'})
+    assert swamper.is_clean()
+    assert swamper.instances[Company].name == 'company 1'
+    assert db.queries == 1
+
+    pool = SwamperPool(CompanySwamper, args=(['name'],))
+    for i in range(2):
+        with pool.swamper({'id': i, 'name': 'name'}) as swamper:
+            assert swamper.is_clean()
+            assert swamper.instances[Company].id == i
+    assert db.queries == 3
+
+
+def test_prefetch_instances_default():
+    """
+    Test instances are built for every record by default.
+    """
+    assert BaseSwamper.prefetch_instances([{}]) is None
+
+    class Swamper(BaseSwamper):
+        def build_instances(self):
+            self.instances = {Company: Company(self.raw_data['id'], None)}
+
+    results = list(Swamper.clean_many([{'id': 1}, {'id': 2}], []))
+    assert [result.instances[Company].id for result in results] == [1, 2]
+
+
+def test_prefetch_instances_checks_length():
+    """
+    Test prefetched instances must match the records one to one.
+    """
+    class Swamper(BaseSwamper):
+        @classmethod
+        def prefetch_instances(cls, records):
+            return []
+
+    with raises(ValueError):
+        list(Swamper.clean_many([{}, {}], []))
+
+
+def test_prefetch_instances_per_chunk():
+    """
+    Test instances are built for every record of a chunk for which
+    `prefetch_instances` returns None, while other chunks are prefetched.
+    """
+    class Swamper(CompanySwamper):
+        prefetch_chunk_size = 2
+
+        @classmethod
+        def prefetch_instances(cls, records):
+            if records[0]['id'] < 3:
+                return super(Swamper, cls).prefetch_instances(records)
+            return None
+
+    db.queries = 0
+    results = list(Swamper.clean_many([{'id': i, 'name': 'name'} for i in range(5)], ['name']))
+
+    assert [result.instances[Company].id for result in results] == [0, 1, 2, 3, 4]
+    # The first record and the chunk of 1 and 2 are prefetched, 3 and 4 are
+    # each built.
+    assert db.queries == 4
@@ -0,0 +1,60 @@
+from pytest import raises
+
+from swamper.base import BaseSwamper
+
+
+class CompanySwamper(BaseSwamper):
+    def build_instances(self):
+        self.instances = {'company': self.raw_data.get('name')}
+
+    def clean_name(self, value, is_blank):
+        if is_blank:
+            raise self.error_class('Name is required')
+        return value.upper()
+
+
+def test_reset():
+    """
+    Test a reset swamper cleans new input like a new swamper would, keeping
+    its field mappings.
+    """
+    swamper = CompanySwamper(['name'], {'name': ''})
+    plan = swamper._plan
+    assert swamper.errors == {'name': ['Name is required']}
+
+    swamper.reset({'name': 'swamper'})
+    assert 'cleaned_data' not in vars(swamper)
+    assert 'instances' not in vars(swamper)
+    assert swamper._errors is None
+
+    assert swamper.is_clean()
+    assert swamper.cleaned_data == {'name': 'SWAMPER'}
+    assert swamper.instances == {'company': 'swamper'}
+    assert swamper._plan is plan
+
+
+def test_reset_forgets_update_snapshots():
+    """
+    Test the first update after a reset cleans everything.
+    """
+    swamper = CompanySwamper(['name'], {'name': 'swamper'})
+    swamper.update({'name': 'rotinaj'})
+    assert swamper._snapshots is not None
+
+    swamper.reset({'name': ''})
+    assert swamper._snapshots is None
+    swamper.update({})
+    assert swamper.errors == {'name': ['Name is required']}
+
+
+def test_reset_verifies_data():
+    """
+    Test new input is type checked, unless verification is skipped.
+    """
+    swamper = CompanySwamper(['name'], {'name': 'swamper'})
+    with raises(TypeError):
+        swamper.reset(['swamper'])
+
+    swamper = CompanySwamper(['name'], {'name': 'swamper'}, skip_verify=True)
+    swamper.reset(['swamper'])
+    assert swamper.raw_data == ['swamper']
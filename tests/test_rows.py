@@ -0,0 +1,86 @@
+import sqlite3
+
+from pytest import raises
+
+from swamper.base import BaseSwamper
+from swamper.rows import RowSchema, RowView, clean_rows
+
+
+class CompanySwamper(BaseSwamper):
+    instance_to_data_fields = {'github': 'github_address'}
+
+    def clean_name(self, value, is_blank):
+        if is_blank:
+            raise self.error_class('Name is required')
+        if value is None:
+            raise self.error_class('Name is missing')
+        return value.upper()
+
+
+def test_row_view():
+    """
+    Test a row view reads values by column name, where columns that are not
+    in the schema or not in the row are missing.
+    """
+    view = RowSchema(['name', None, 'city']).view(('swamper', 'skipped', 'Groningen'))
+    assert view['name'] == 'swamper'
+    assert view.get('city') == 'Groningen'
+    assert 'name' in view
+    assert sorted(view) == ['city', 'name']
+    assert len(view) == 2
+    assert dict(view) == {'name': 'swamper', 'city': 'Groningen'}
+    assert repr(RowView({'name': 0}, ('swamper',))) == "<RowView {'name': 'swamper'}>"
+
+    view = RowSchema(['name', None, 'city']).view(('rotinaj',))
+    assert view['name'] == 'rotinaj'
+    assert 'city' not in view
+    assert view.get('city', 'default') == 'default'
+    assert view.get('unknown') is None
+    assert 'unknown' not in view
+    assert len(view) == 1
+    with raises(KeyError):
+        view['city']
+    with raises(KeyError):
+        view['unknown']
+
+
+def test_swamper_reads_row_view():
+    """
+    Test a swamper can clean a row view, telling missing from blank values.
+    """
+    schema = RowSchema(['name'])
+    swamper = CompanySwamper(['name'], schema.view(('swamper',)))
+    assert swamper.is_clean()
+    assert swamper.cleaned_data == {'name': 'SWAMPER'}
+
+    assert CompanySwamper(['name'], schema.view(('',))).errors == {'name': ['Name is required']}
+    assert CompanySwamper(['name'], schema.view((None,))).errors == {'name': ['Name is required']}
+    assert CompanySwamper(['name'], schema.view(())).errors == {'name': ['Name is missing']}
+
+
+def test_clean_rows():
+    """
+    Test rows are cleaned in input order, with the row as raw data.
+    """
+    rows = [('swamper', 'wearespindle'), ('', 'rotinaj'), ('rotinaj',)]
+    results = list(clean_rows(CompanySwamper, iter(rows), ['name', 'github_address'], args=(['name', 'github'],),
+                              kwargs={'skip_verify': True}))
+
+    assert [result.raw_data for result in results] == rows
+    assert results[0].cleaned_data == {'name': 'SWAMPER', 'github_address': 'wearespindle'}
+    assert results[1].errors == {'name': ['Name is required']}
+    assert results[2].cleaned_data == {'name': 'ROTINAJ', 'github_address': None}
+
+
+def test_clean_rows_from_cursor():
+    """
+    Test rows of a DB-API cursor are cleaned with its column names.
+    """
+    connection = sqlite3.connect(':memory:')
+    connection.execute('CREATE TABLE company (name TEXT, github_address TEXT)')
+    connection.executemany('INSERT INTO company VALUES (?, ?)', [('swamper', 'wearespindle'), (None, 'rotinaj')])
+    cursor = connection.execute('SELECT name, github_address FROM company ORDER BY rowid')
+
+    results = list(clean_rows(CompanySwamper, cursor, RowSchema.from_cursor(cursor), args=(['name'],)))
+    assert [result.cleaned_data for result in results] == [{'name': 'SWAMPER'}, {}]
+    assert results[1].errors == {'name': ['Name is required']}
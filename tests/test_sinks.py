@@ -0,0 +1,100 @@
+import sqlite3
+
+from pytest import fixture
+
+from swamper.base import NON_FIELD_ERRORS, BaseSwamper
+from swamper.sinks import write_sqlite
+
+
+class CompanySwamper(BaseSwamper):
+    instance_to_data_fields = {'github': 'github_address'}
+
+    def clean_name(self, value, is_blank):
+        if is_blank:
+            raise self.error_class('Name is required')
+        return value
+
+    def clean_github_address(self, value, is_blank):
+        if value is None:
+            return None
+        return value.lower()
+
+
+@fixture
+def connection():
+    connection = sqlite3.connect(':memory:')
+    connection.execute('CREATE TABLE company (name TEXT UNIQUE, github TEXT)')
+    yield connection
+    connection.close()
+
+
+def clean(records):
+    return CompanySwamper.clean_many(records, ['name', 'github'])
+
+
+def test_write_sqlite(connection):
+    """
+    Test clean records are inserted by instance field and records with errors
+    are reported with their errors.
+    """
+    records = [
+        {'name': 'swamper', 'github_address': 'WeAreSpindle'},
+        {'name': '', 'github_address': 'nobody'},
+        {'name': 'rotinaj', 'github_address': 'rotinaj'},
+    ]
+    report = write_sqlite(CompanySwamper, clean(records), connection, 'company', ['name', 'github'], chunk_size=2)
+
+    assert report.written == 2
+    assert [(failure.position, failure.raw_data, failure.errors) for failure in report.failures] == [
+        (1, records[1], {'name': ['Name is required']}),
+    ]
+    assert connection.execute('SELECT name, github FROM company ORDER BY name').fetchall() == [
+        ('rotinaj', 'rotinaj'), ('swamper', 'wearespindle'),
+    ]
+
+
+def test_write_sqlite_missing_value(connection):
+    """
+    Test fields missing from cleaned data are inserted as NULL.
+    """
+    report = write_sqlite(CompanySwamper, clean([{'name': 'swamper'}]), connection, 'company', ['name', 'github'])
+
+    assert (report.written, report.failures) == (1, [])
+    assert connection.execute('SELECT name, github FROM company').fetchall() == [('swamper', None)]
+
+
+def test_write_sqlite_get_data_field(connection):
+    """
+    Test instance fields are mapped to data fields by an overridden
+    `get_data_field`.
+    """
+    class Swamper(CompanySwamper):
+        instance_to_data_fields = {}
+
+        def get_data_field(self, field):
+            if field == 'github':
+                return 'github_address'
+            return super(Swamper, self).get_data_field(field)
+
+    results = Swamper.clean_many([{'name': 'swamper', 'github_address': 'WeAreSpindle'}], ['name', 'github'])
+    report = write_sqlite(Swamper, results, connection, 'company', ['name', 'github'])
+
+    assert report.written == 1
+    assert connection.execute('SELECT name, github FROM company').fetchall() == [('swamper', 'wearespindle')]
+
+
+def test_write_sqlite_row_failures(connection):
+    """
+    Test a chunk the database refuses is rolled back and written row by row,
+    reporting only the rows that fail.
+    """
+    records = [{'name': 'swamper'}, {'name': 'rotinaj'}, {'name': 'swamper'}, {'name': 'spindle'}]
+    report = write_sqlite(CompanySwamper, clean(records), connection, 'company', ['name'], chunk_size=3)
+
+    assert report.written == 3
+    assert [failure.position for failure in report.failures] == [2]
+    assert list(report.failures[0].errors) == [NON_FIELD_ERRORS]
+    assert 'UNIQUE' in report.failures[0].errors[NON_FIELD_ERRORS][0]
+    assert connection.execute('SELECT name FROM company ORDER BY name').fetchall() == [
+        ('rotinaj',), ('spindle',), ('swamper',),
+    ]
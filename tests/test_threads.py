@@ -0,0 +1,155 @@
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from pytest import raises
+
+from swamper import threads
+from swamper.base import BaseSwamper
+from swamper.dependencies import validates
+
+
+def wait_until(condition, predicate, timeout=5.0):
+    """
+    Wait on `condition` until `predicate` holds, failing after `timeout`
+    seconds instead of hanging.
+    """
+    deadline = time.time() + timeout
+    while not predicate():
+        remaining = deadline - time.time()
+        assert remaining > 0, 'Timed out waiting for other clean methods'
+        condition.wait(remaining)
+
+
+class SlowSwamper(BaseSwamper):
+    cleaner_threads = 4
+    # Clean methods wait until this many of them are running, which only
+    # happens when they run at the same time.
+    together = 1
+    # Map of field to the field whose clean method must finish first.
+    after = {}
+
+    def __init__(self, *args, **kwargs):
+        self.events = []
+        self.running = 0
+        self.most_running = 0
+        self.changed = threading.Condition()
+        super(SlowSwamper, self).__init__(*args, **kwargs)
+
+    def slow(self, field, value):
+        with self.changed:
+            self.running += 1
+            self.most_running = max(self.most_running, self.running)
+            self.changed.notify_all()
+            wait_until(self.changed, lambda: self.most_running >= self.together and (
+                field not in self.after or self.after[field] in self.events))
+            self.running -= 1
+            self.events.append(field)
+            self.changed.notify_all()
+        if not value:
+            raise self.error_class('{} is required'.format(field))
+        return value
+
+    def clean_a(self, value, is_blank):
+        return self.slow('a', value)
+
+    def clean_b(self, value, is_blank):
+        return self.slow('b', value)
+
+    def clean_c(self, value, is_blank):
+        return self.slow('c', value)
+
+    def clean_d(self, value, is_blank):
+        return self.slow('d', value)
+
+    @validates('a', 'b')
+    def validate_a_b(self):
+        self.events.append('validate')
+
+    def clean(self):
+        self.events.append('clean')
+        return self.cleaned_data
+
+
+def test_cleaner_threads():
+    """
+    Test clean methods run at the same time, while the outcome is added in
+    field order and the post clean runs after all fields.
+    """
+    class Swamper(SlowSwamper):
+        together = 4
+        after = {'a': 'b', 'b': 'c', 'c': 'd'}
+
+    swamper = Swamper(['a', 'b', 'c', 'd', 'e'], {'a': 'a', 'b': '', 'c': '', 'd': 'd'})
+    assert swamper.is_clean() is False
+
+    assert swamper.most_running == 4
+    assert swamper.events == ['d', 'c', 'b', 'a', 'clean']
+    assert swamper.errors == {'b': ['b is required'], 'c': ['c is required']}
+    assert swamper.cleaned_data == {'a': 'a', 'd': 'd', 'e': None}
+
+    swamper = SlowSwamper(['a', 'b'], {'a': 'a', 'b': 'b'})
+    assert swamper.is_clean()
+    assert swamper.events[-2:] == ['validate', 'clean']
+
+
+def test_cleaner_threads_limit():
+    """
+    Test no more than `cleaner_threads` clean methods of a class run at once.
+    """
+    class Swamper(SlowSwamper):
+        cleaner_threads = 2
+        together = 2
+
+    swamper = Swamper(['a', 'b', 'c', 'd'], {'a': 'a', 'b': 'b', 'c': 'c', 'd': 'd'})
+    assert swamper.is_clean()
+    assert swamper.most_running == 2
+
+    Swamper.cleaner_threads = Swamper.together = 1
+    swamper = Swamper(['a', 'b', 'c', 'd'], {'a': 'a', 'b': 'b', 'c': 'c', 'd': 'd'})
+    assert swamper.is_clean()
+    assert swamper.most_running == 1
+
+
+def test_cleaner_threads_max_errors():
+    """
+    Test the error budget applies in field order.
+    """
+    class Swamper(SlowSwamper):
+        max_errors = 1
+
+    swamper = Swamper(['a', 'b', 'c'], {})
+    assert swamper.errors == {'a': ['a is required']}
+    assert swamper.errors.short_circuited is True
+
+
+def test_cleaner_threads_unexpected_error():
+    """
+    Test errors other than `error_class` are raised in the cleaning thread.
+    """
+    class Swamper(SlowSwamper):
+        def clean_a(self, value, is_blank):
+            raise KeyError('a')
+
+    with raises(KeyError):
+        Swamper(['a'], {}).full_clean()
+
+
+def test_set_executor():
+    """
+    Test the shared pool can be replaced, and a pool that cannot run
+    anything doesn't hold on to the limit of a class.
+    """
+    executor = ThreadPoolExecutor(max_workers=2)
+    executor.shutdown()
+    threads.set_executor(executor)
+    try:
+        assert threads.get_executor() is executor
+        for _ in range(SlowSwamper.cleaner_threads + 1):
+            with raises(RuntimeError):
+                SlowSwamper(['a'], {'a': 'a'}).full_clean()
+    finally:
+        threads.set_executor(None)
+
+    assert threads.get_executor() is not executor
+    assert SlowSwamper(['a'], {'a': 'a'}).is_clean()
@@ -0,0 +1,121 @@
+from swamper.base import BaseSwamper
+from swamper.dependencies import depends_on
+
+
+class Swamper(BaseSwamper):
+    def __init__(self, *args, **kwargs):
+        self.calls = []
+        super(Swamper, self).__init__(*args, **kwargs)
+
+    def clean_name(self, value, is_blank):
+        self.calls.append('name')
+        if is_blank:
+            raise self.error_class('Name is required')
+        return value.upper()
+
+    def clean_start(self, value, is_blank):
+        self.calls.append('start')
+        return int(value)
+
+    def clean_end(self, value, is_blank):
+        self.calls.append('end')
+        return int(value)
+
+    @depends_on('start', 'end')
+    def clean(self):
+        self.calls.append('clean')
+        if 'start' in self.cleaned_data and 'end' in self.cleaned_data:
+            if self.cleaned_data['start'] > self.cleaned_data['end']:
+                self.add_error('end', 'End must be after start')
+        return self.cleaned_data
+
+
+def test_update_first_cleans_everything():
+    """
+    Test the first update cleans all fields and runs the post clean.
+    """
+    swamper = Swamper(['name', 'start', 'end'], {'name': 'swamper', 'start': '1', 'end': '2'})
+    swamper.update({'name': 'rotinaj'})
+    assert swamper.calls == ['name', 'start', 'end', 'clean']
+    assert swamper.cleaned_data == {'name': 'ROTINAJ', 'start': 1, 'end': 2}
+    assert swamper.raw_data == {'name': 'rotinaj', 'start': '1', 'end': '2'}
+
+
+def test_update_only_cleans_changed_fields():
+    """
+    Test later updates only run the clean methods for changed fields, and
+    skip the post clean when it doesn't depend on them.
+    """
+    swamper = Swamper(['name', 'start', 'end'], {'name': 'swamper', 'start': '1', 'end': '2'})
+    swamper.update({})
+    swamper.calls = []
+
+    swamper.update({'name': ''})
+    assert swamper.calls == ['name']
+    assert swamper.errors == {'name': ['Name is required']}
+    assert swamper.cleaned_data == {'start': 1, 'end': 2}
+
+    swamper.update({'name': 'rotinaj'})
+    assert swamper.calls == ['name', 'name']
+    assert swamper.errors == {}
+    assert swamper.cleaned_data == {'name': 'ROTINAJ', 'start': 1, 'end': 2}
+
+
+def test_update_reruns_post_clean_for_its_fields():
+    """
+    Test the post clean runs again when a field it depends on changes, on top
+    of the outcome of cleaning fields.
+    """
+    swamper = Swamper(['name', 'start', 'end'], {'name': '', 'start': '1', 'end': '2'})
+    swamper.update({})
+    swamper.calls = []
+
+    swamper.update({'start': '3'})
+    assert swamper.calls == ['start', 'clean']
+    assert swamper.errors == {'name': ['Name is required'], 'end': ['End must be after start']}
+    assert swamper.cleaned_data == {'start': 3}
+
+    swamper.update({'end': '4'})
+    assert swamper.calls == ['start', 'clean', 'end', 'clean']
+    assert swamper.errors == {'name': ['Name is required']}
+    assert swamper.cleaned_data == {'start': 3, 'end': 4}
+
+
+def test_update_without_dependencies():
+    """
+    Test a post clean without declared dependencies runs on every update.
+    """
+    class OtherSwamper(BaseSwamper):
+        runs = 0
+
+        def clean(self):
+            self.runs += 1
+
+    swamper = OtherSwamper(['name'], {'name': 'swamper'})
+    swamper.full_clean()
+    swamper.update({'name': 'rotinaj'})
+    swamper.update({'name': 'rotinaj'})
+    assert swamper.runs == 3
+    assert swamper.cleaned_data == {'name': 'rotinaj'}
+
+
+def test_update_after_full_clean_or_failed_setup():
+    """
+    Test full clean throws away what update remembered, and updates keep
+    cleaning everything as long as cleaning instances fails.
+    """
+    class InstanceSwamper(Swamper):
+        def clean_instances(self):
+            if self.data['name'] == 'swamper':
+                raise ValueError('No instance')
+
+    swamper = InstanceSwamper(['name'], {'name': 'swamper'})
+    swamper.update({})
+    assert swamper.errors == {None: ['No instance']}
+    swamper.update({'name': 'rotinaj'})
+    assert swamper.errors == {}
+    assert swamper.calls == ['name', 'clean']
+
+    swamper.full_clean()
+    swamper.update({'name': 'jan'})
+    assert swamper.calls == ['name', 'clean', 'name', 'clean', 'name', 'clean']
@@ -0,0 +1,21 @@
+from pytest import raises
+
+from swamper.utils import chunks
+
+
+def test_chunks():
+    """
+    Test items are split in chunks of at most `chunk_size` items.
+    """
+    assert list(chunks(iter(range(5)), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(chunks([], 2)) == []
+
+
+def test_chunks_size_fail():
+    """
+    Test chunks must hold at least one item, instead of silently dropping
+    all items.
+    """
+    for chunk_size in (0, -1):
+        with raises(ValueError):
+            chunks([1, 2], chunk_size)
@@ -0,0 +1,148 @@
+from pytest import raises
+
+from swamper.base import BaseSwamper
+from swamper.dependencies import depends_on, validates
+
+
+class PeriodSwamper(BaseSwamper):
+    instance_to_data_fields = {'begin': 'start'}
+
+    def __init__(self, *args, **kwargs):
+        self.calls = []
+        super(PeriodSwamper, self).__init__(*args, **kwargs)
+
+    def clean_start(self, value, is_blank):
+        self.calls.append('start')
+        return int(value)
+
+    def clean_end(self, value, is_blank):
+        self.calls.append('end')
+        return int(value)
+
+    def clean_name(self, value, is_blank):
+        self.calls.append('name')
+        if is_blank:
+            raise self.error_class('Name is required')
+        return value
+
+    @validates('begin', 'end')
+    def validate_period(self):
+        self.calls.append('period')
+        if self.cleaned_data['start'] > self.cleaned_data['end']:
+            raise self.error_class('Period cannot end before it starts')
+
+    @validates('start')
+    def validate_start(self):
+        self.calls.append('positive start')
+        if self.cleaned_data['start'] < 0:
+            self.add_error('start', 'Start must be positive')
+
+    @depends_on('name')
+    def clean(self):
+        self.calls.append('clean')
+        return self.cleaned_data
+
+
+def test_validators_run_when_their_fields_are_clean():
+    """
+    Test validators run right after the last field they depend on.
+    """
+    swamper = PeriodSwamper(['begin', 'end', 'name'], {'start': '3', 'end': '2', 'name': 'swamper'})
+    assert swamper.is_clean() is False
+    assert swamper.calls == ['start', 'positive start', 'end', 'period', 'name', 'clean']
+    assert swamper.errors == {None: ['Period cannot end before it starts']}
+
+    swamper = PeriodSwamper(['name', 'end', 'begin'], {'start': '-1', 'end': '2', 'name': ''})
+    assert swamper.is_clean() is False
+    assert swamper.calls == ['name', 'end', 'start', 'period', 'positive start', 'clean']
+    assert swamper.errors == {'name': ['Name is required'], 'start': ['Start must be positive']}
+
+
+def test_validators_skipped_for_errors():
+    """
+    Test validators are skipped when any of their fields has errors.
+    """
+    swamper = PeriodSwamper(['begin', 'end'], {'start': '-3', 'end': '2'})
+    assert swamper.errors == {'start': ['Start must be positive']}
+    assert swamper.calls == ['start', 'positive start', 'end', 'clean']
+
+
+def test_validators_for_missing_fields_are_left_out():
+    """
+    Test validators that depend on fields which are not cleaned never run.
+    """
+    swamper = PeriodSwamper(['end', 'name'], {'start': '3', 'end': '2', 'name': 'swamper'})
+    assert swamper.is_clean() is True
+    assert swamper.calls == ['end', 'name', 'clean']
+    assert swamper._plan.validators == ()
+    assert len(swamper._plan.stages) == 1
+
+
+def test_validators_partial_clean():
+    """
+    Test partial cleaning runs validators for which all fields are cleaned.
+    """
+    swamper = PeriodSwamper(['begin', 'end', 'name'], {'start': '3', 'end': '2', 'name': 'swamper'})
+    swamper.partial_clean(['begin', 'name'])
+    assert swamper.calls == ['start', 'name', 'positive start']
+
+
+def test_validators_update():
+    """
+    Test updates run validators again when any of their fields changed, and
+    keep their outcome otherwise.
+    """
+    swamper = PeriodSwamper(['begin', 'end', 'name'], {'start': '3', 'end': '2', 'name': 'swamper'})
+    swamper.update({})
+    swamper.calls = []
+
+    swamper.update({'name': 'rotinaj'})
+    assert swamper.calls == ['name', 'clean']
+    assert swamper.errors == {None: ['Period cannot end before it starts']}
+
+    swamper.update({'end': '4'})
+    assert swamper.calls == ['name', 'clean', 'end', 'positive start', 'period', 'clean']
+    assert swamper.errors == {}
+
+    swamper.calls = []
+    swamper.update({'name': ''})
+    assert swamper.calls == ['name', 'clean']
+    assert swamper.errors == {'name': ['Name is required']}
+
+    swamper.update({'end': '1'})
+    assert swamper.calls == ['name', 'clean', 'end', 'positive start', 'period', 'clean']
+    assert swamper.errors == {'name': ['Name is required'], None: ['Period cannot end before it starts']}
+
+
+def test_validators_update_reruns_post_clean():
+    """
+    Test the post clean runs again when validators ran again, even when it
+    doesn't depend on the changed fields.
+    """
+    class Swamper(PeriodSwamper):
+        @validates('name')
+        def validate_name(self):
+            self.calls.append('validate name')
+
+        @depends_on('end')
+        def clean(self):
+            self.calls.append('clean')
+
+    swamper = Swamper(['begin', 'end', 'name'], {'start': '3', 'end': '2', 'name': 'swamper'})
+    swamper.update({})
+    swamper.calls = []
+
+    swamper.update({'name': ''})
+    assert swamper.calls == ['name', 'positive start', 'period', 'clean']
+    assert swamper.errors == {'name': ['Name is required'], None: ['Period cannot end before it starts']}
+
+    swamper.update({'start': '1'})
+    assert swamper.errors == {'name': ['Name is required']}
+
+
+def test_validates_needs_fields():
+    """
+    Test a validator must depend on at least one field.
+    """
+    with raises(TypeError):
+        validates()
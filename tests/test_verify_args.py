@@ -119,15 +119,63 @@ def test_types_for_instance_to_data_fields_ok():
 
 def test_types_for_instance_to_data_fields_fail():
     """
-    Test objects you cannot use to map field names.
+    Test objects you cannot use to map field names, which fail as soon as the
+    class is used, even when verifying arguments is skipped.
     """
     class Swamper(BaseSwamper):
         instance_to_data_fields = [('first_name', 'name')]
 
-    fields = ['first_name']
+    for skip_verify in (False, True):
+        with raises(TypeError):
+            Swamper(['first_name'], {'name': 'swamper'}, skip_verify=skip_verify)
+
+    class InstanceSwamper(BaseSwamper):
+        def __init__(self, fields, data):
+            self.instance_to_data_fields = [('first_name', 'name')]
+            super(InstanceSwamper, self).__init__(fields, data)
+
+    with raises(TypeError):
+        InstanceSwamper(['first_name'], {'name': 'swamper'})
+
+
+def test_types_for_class_field_list_fail():
+    """
+    Test objects you cannot use to provide field names on a class, which fail
+    as soon as the class is used.
+    """
+    for fields in (
+        {'field': 'name'},
+        [('name',)],
+        'name',
+    ):
+        Swamper = type('Swamper', (BaseSwamper,), {'fields': fields})
+        with raises(TypeError):
+            Swamper(['name'], {'name': 'swamper'})
+
+
+def test_types_for_field_list_verified_once():
+    """
+    Test lists and tuples of field names are only verified once per class,
+    and unhashable ones are always refused.
+    """
+    class Swamper(BaseSwamper):
+        pass
+
+    class OtherSwamper(Swamper):
+        pass
+
     data = {'name': 'swamper'}
+    Swamper(['name'], data)
+    assert Swamper._verified_fields == set([('name',)])
+    Swamper(('name',), data)
+    assert Swamper._verified_fields == set([('name',)])
+
+    OtherSwamper(['name', 'age'], data)
+    assert OtherSwamper._verified_fields == set([('name', 'age')])
+    assert Swamper._verified_fields == set([('name',)])
+
     with raises(TypeError):
-        Swamper(fields, data)
+        Swamper([['name']], data)
 
 
 def test_build_or_update_object_types_for_field_list_fail():